@@ -66,7 +66,8 @@ else:
 if config.WithProfiling:
     profiler.disable()
     profile = pstats.Stats(profiler)
-    profile.sort_stats(pstats.SortKey.CUMULATIVE).print_stats('ogd\\\\core|ogd\\\\games', .1)
+    # match both Windows and POSIX path separators
+    profile.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(r'ogd[\\/](core|games)', .1)
 
 if not success:
     sys.exit(1)
@@ -12,11 +12,12 @@ from typing import Any, List, Optional, Set, Tuple
 
 # import OGD files
 # from ogd.core.exec.Generators import OGDGenerators
-from ogd.common.interfaces.CSVInterface import CSVInterface
 from ogd.common.interfaces.EventInterface import EventInterface
 from ogd.common.interfaces.outerfaces.DataOuterface import DataOuterface
 from ogd.common.interfaces.outerfaces.DebugOuterface import DebugOuterface
 from ogd.common.interfaces.outerfaces.TSVOuterface import TSVOuterface
+from ogd.core.interfaces.outerfaces.ParquetOuterface import ParquetOuterface
+from ogd.core.interfaces.StreamingFileInterface import StreamingFileInterface
 from ogd.core.managers.ExportManager import ExportManager
 from ogd.common.models.enums.ExportMode import ExportMode
 from ogd.common.models.enums.IDMode import IDMode
@@ -129,8 +130,16 @@ class OGDCommands:
             # raise NotImplementedError("Sorry, exports with file inputs are currently broken.")
             _ext = str(args.file).rsplit('.', maxsplit=1)[-1]
             _cfg = GameSourceSchema(name="FILE SOURCE", all_elements={"schema":"OGD_EVENT_FILE"}, data_sources={})
-            interface = CSVInterface(game_id=args.game, config=_cfg, fail_fast=config.FailFast, filepath=Path(args.file), delim="\t" if _ext == 'tsv' else ',')
-            export_range = ExporterRange.FromIDs(source=interface, ids=interface.AllIDs() or [])
+            if args.stream:
+                # sessions are found as the file is streamed, so the range has no IDs or dates up-front, and the dataset is named for the file.
+                interface = StreamingFileInterface(game_id=args.game, config=_cfg, fail_fast=config.FailFast, filepath=Path(args.file), delim="\t" if _ext == 'tsv' else ',')
+                export_range = ExporterRange(date_min=None, date_max=None, ids=None, id_mode=IDMode.SESSION)
+                dataset_id = f"{args.game}_from_{Path(args.file).name}"
+            else:
+                # pandas is slow to import, so the CSVInterface is only imported when it is needed.
+                from ogd.common.interfaces.CSVInterface import CSVInterface
+                interface = CSVInterface(game_id=args.game, config=_cfg, fail_fast=config.FailFast, filepath=Path(args.file), delim="\t" if _ext == 'tsv' else ',')
+                export_range = ExporterRange.FromIDs(source=interface, ids=interface.AllIDs() or [])
         else:
             interface = OGDGenerators.GenDBInterface(config=config, game=args.game)
         # a. Case where specific player ID was given
@@ -166,8 +175,12 @@ class OGDCommands:
                 export_range = OGDGenerators.GenDateRange(game=args.game, interface=interface, monthly=args.monthly, start_date=args.start_date, end_date=args.end_date)
     # 3. set up the outerface, based on the range and dataset_id.
         _cfg = GameSourceSchema(name="FILE DEST", all_elements={"database":"FILE", "table":"DEBUG", "schema":"OGD_EVENT_FILE"}, data_sources={})
-        file_outerface = TSVOuterface(game_id=args.game, config=_cfg, export_modes=export_modes, date_range=export_range.DateRange,
-                                    file_indexing=config.FileIndexConfig, dataset_id=dataset_id)
+        if args.format == "parquet":
+            file_outerface = ParquetOuterface(game_id=args.game, config=_cfg, export_modes=export_modes, date_range=export_range.DateRange,
+                                              file_indexing=config.FileIndexConfig, codec=args.codec, dataset_id=dataset_id)
+        else:
+            file_outerface = TSVOuterface(game_id=args.game, config=_cfg, export_modes=export_modes, date_range=export_range.DateRange,
+                                        file_indexing=config.FileIndexConfig, dataset_id=dataset_id)
         # file_outerface = TSVOuterface(game_id=args.game, config=_cfg, export_modes=export_modes, date_range=export_range.DateRange,
         #                             file_indexing=config.FileIndexConfig, dataset_id=dataset_id, with_zipping=not args.no_zips)
         outerfaces : Set[DataOuterface] = {file_outerface}
@@ -177,7 +190,8 @@ class OGDCommands:
             outerfaces.add(DebugOuterface(game_id=args.game, config=_cfg, export_modes=export_modes))
 
     # 4. Once we have the parameters parsed out, construct the request.
-        req = Request(range=export_range, exporter_modes=export_modes, interface=interface, outerfaces=outerfaces)
+        req = Request(range=export_range, exporter_modes=export_modes, interface=interface, outerfaces=outerfaces, incremental=args.incremental,
+                      use_event_cache=args.cache or args.refresh_cache, refresh_event_cache=args.refresh_cache)
         if req.Interface.IsOpen():
             export_manager : ExportManager = ExportManager(config=config)
             result         : RequestResult = export_manager.ExecuteRequest(request=req)
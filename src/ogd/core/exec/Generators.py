@@ -9,9 +9,6 @@ from typing import Optional, Set
 
 # import local files
 from ogd.common.interfaces.EventInterface import EventInterface
-from ogd.common.interfaces.MySQLInterface import MySQLInterface
-from ogd.common.interfaces.BigQueryInterface import BigQueryInterface
-from ogd.common.interfaces.BQFirebaseInterface import BQFirebaseInterface
 from ogd.core.requests.Request import ExporterRange
 from ogd.core.schemas.configs.ConfigSchema import ConfigSchema
 from ogd.common.models.enums.ExportMode import ExportMode
@@ -42,12 +39,16 @@ class OGDGenerators:
         ret_val : EventInterface
         _game_cfg = config.GameSourceMap.get(game)
         if _game_cfg is not None and _game_cfg.Source is not None:
+            # database clients are slow to import, so only import the one that is needed.
             match (_game_cfg.Source.Type):
                 case "Firebase" | "FIREBASE":
+                    from ogd.common.interfaces.BQFirebaseInterface import BQFirebaseInterface
                     ret_val = BQFirebaseInterface(game_id=game, config=_game_cfg, fail_fast=config.FailFast)
                 case "BigQuery" | "BIGQUERY":
+                    from ogd.common.interfaces.BigQueryInterface import BigQueryInterface
                     ret_val = BigQueryInterface(game_id=game, config=_game_cfg, fail_fast=config.FailFast)
                 case "MySQL" | "MYSQL":
+                    from ogd.common.interfaces.MySQLInterface import MySQLInterface
                     ret_val = MySQLInterface(game_id=game, config=_game_cfg, fail_fast=config.FailFast)
                 case _:
                     raise Exception(f"{_game_cfg.Source.Type} is not a valid EventInterface type!")
@@ -6,6 +6,7 @@ from typing import List
 # import 3rd-party libraries
 
 # import OGD files
+from ogd.core.interfaces.outerfaces.ParquetOuterface import ParquetOuterface
 
 class OGDParsers:
     """Utility class to collect functions for setting up each of the parsers that are used by the various commands."""
@@ -65,10 +66,17 @@ class OGDParsers:
         * --player_id_file
         * --session_id_file
         * --file
+        * --stream
         * --monthly
         * --no_session_file
         * --no_player_file
         * --no_pop_file
+        * --no_zips
+        * --format
+        * --codec
+        * --incremental
+        * --cache
+        * --refresh-cache
 
         :param parents: The parent parser(s) that the export parsers contributes to.
         :type parents: List[ArgumentParser]
@@ -90,6 +98,8 @@ class OGDParsers:
                             help="Tell the program to output data for a collection of sessions with IDs in given file, instead of using a date range.")
         export_parser.add_argument("-f", "--file", default="",
                             help="Tell the program to use a file as input, instead of looking up a database.")
+        export_parser.add_argument("--stream", default=False, action="store_true",
+                            help="With --file, read the file in a single pass, one session at a time, instead of loading it all into memory. The file must be sorted by session.")
         export_parser.add_argument("-m", "--monthly", default=False, action="store_true",
                             help="Set the program to export a month's-worth of data, instead of using a date range. Replace the start_date argument with a month in MM/YYYY format.")
         # allow individual feature files to be skipped.
@@ -101,6 +111,16 @@ class OGDParsers:
                             help="Tell the program to skip outputting a population file.")
         export_parser.add_argument("--no_zips", default=False, action="store_true",
                             help="Tell the program to skip zipping of tsv files.")
+        export_parser.add_argument("--format", default="tsv", choices=["tsv", "parquet"],
+                            help="The format of the output files. Parquet files have typed columns, and require the pyarrow package.")
+        export_parser.add_argument("--codec", default="snappy", choices=ParquetOuterface.CODECS,
+                            help="The compression codec to use for parquet output files.")
+        export_parser.add_argument("--incremental", default=False, action="store_true",
+                            help="Tell the program to reuse cached session features from earlier exports, for sessions whose events have not changed.")
+        export_parser.add_argument("--cache", default=False, action="store_true",
+                            help="Tell the program to read and store session events in the local event cache. Cached events of a session are only used if the session has not changed at the data source since they were cached.")
+        export_parser.add_argument("--refresh-cache", default=False, action="store_true",
+                            help="Tell the program to use the local event cache, but retrieve all events from the data source, replacing any already in the cache.")
         return export_parser
 
     @staticmethod
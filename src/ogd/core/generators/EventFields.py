@@ -0,0 +1,105 @@
+## import standard libraries
+import json
+from typing import Any, Callable, Dict, Optional
+# import locals
+from ogd.common.models.Event import Event
+
+class EventFields:
+    """Memoized accessors for values derived from an event, such as decoded JSON fields, shared by every generator that receives the event.
+
+    Many generators decode the same field of each event (e.g. a JSON string in the game state),
+    so the derived values of the event currently being dispatched are kept here, and only computed by the first generator to ask for them.
+    Registries attach each event before sending it to their generators, which drops the values of the previous event.
+    If a value is requested for an event that was not attached (e.g. a generator used outside a registry), the event is attached then.
+
+    Values are shared between generators, so they must be treated as read-only.
+    """
+
+    _MISSING = object()
+
+    _event  : Optional[Event] = None
+    _values : Dict[str, Any]  = {}
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Attach(event:Event) -> None:
+        """Make the given event the one whose derived values are kept, if it is not already.
+
+        :param event: The event about to be dispatched.
+        :type event: Event
+        """
+        if event is not EventFields._event:
+            EventFields._event  = event
+            EventFields._values = {}
+
+    @staticmethod
+    def Get(event:Event, key:str, compute:Callable[[Event], Any]) -> Any:
+        """Get a value derived from an event, computing it only if no other generator has already done so for the event.
+
+        :param event: The event the value is derived from.
+        :type event: Event
+        :param key: A name for the value, unique among the values derived from an event.
+        :type key: str
+        :param compute: Function to derive the value from the event. If it raises an error, nothing is stored, and the error is raised.
+        :type compute: Callable[[Event], Any]
+        :return: The derived value.
+        :rtype: Any
+        """
+        if event is not EventFields._event:
+            EventFields.Attach(event)
+        ret_val = EventFields._values.get(key, EventFields._MISSING)
+        if ret_val is EventFields._MISSING:
+            ret_val = EventFields._values[key] = compute(event)
+        return ret_val
+
+    @staticmethod
+    def GameStateJSON(event:Event, name:str) -> Any:
+        """Get the decoded value of a JSON string in an event's game state.
+
+        :param event: The event with the game state.
+        :type event: Event
+        :param name: The name of the game state element.
+        :type name: str
+        :raises KeyError: If the game state has no such element.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        return EventFields.Get(event, f"game_state.json.{name}", lambda evt : json.loads(evt.GameState[name]))
+
+    @staticmethod
+    def EventDataJSON(event:Event, name:str) -> Any:
+        """Get the decoded value of a JSON string in an event's data.
+
+        :param event: The event with the data.
+        :type event: Event
+        :param name: The name of the event data element.
+        :type name: str
+        :raises KeyError: If the event data has no such element.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        return EventFields.Get(event, f"event_data.json.{name}", lambda evt : json.loads(evt.EventData[name]))
+
+    @staticmethod
+    def StateValue(event:Event, name:str, default:Any=None) -> Any:
+        """Get an element from an event's game state, or from its event data if the game state does not have it,
+        unwrapping values logged as `{"string_value" : ...}`, such as job and level names from some logging versions.
+
+        :param event: The event with the element.
+        :type event: Event
+        :param name: The name of the element.
+        :type name: str
+        :param default: The value to return if neither the game state nor the event data has the element, defaults to None
+        :type default: Any, optional
+        :return: The value of the element, or the default.
+        :rtype: Any
+        """
+        ret_val = EventFields.Get(event, f"state_value.{name}", lambda evt : EventFields._unwrap(evt.GameState.get(name, evt.EventData.get(name, EventFields._MISSING))))
+        return default if ret_val is EventFields._MISSING else ret_val
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _unwrap(value:Any) -> Any:
+        return value['string_value'] if isinstance(value, dict) else value
@@ -0,0 +1,121 @@
+# import libraries
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+# import locals
+from ogd.common.utils.Logger import Logger
+
+T = TypeVar("T")
+
+class GameMetadataCache:
+    """Process-wide cache of game metadata files, such as a game's DBExport.json.
+
+    Each file is parsed at most once per process, and any structures derived from it
+    (e.g. a loader's map of job names to indices) are built once and shared by every loader and extractor that asks for them.
+    The cached data is shared, so callers must treat it as read-only.
+
+    When a file is requested, its modification time and size are checked against the cached copy,
+    at most once every `CHECK_INTERVAL` seconds (metadata is requested for every extractor that is created, so checking on every request is too slow).
+    If they changed, the file is re-read, and if its content hash also changed, the parsed data and derived structures are rebuilt.
+    """
+    class _Entry:
+        def __init__(self, stamp:Tuple[int, int], digest:str, data:Dict[str, Any]):
+            self.stamp      : Tuple[int, int] = stamp
+            self.digest     : str             = digest
+            self.data       : Dict[str, Any]  = data
+            self.derived    : Dict[str, Any]  = {}
+            self.checked_at : float           = time.monotonic()
+
+    CHECK_INTERVAL : float = 1.0
+
+    _entries : Dict[Path, _Entry]            = {}
+    _paths   : Dict[Tuple[str, str], Path]   = {}
+    _lock    : threading.RLock               = threading.RLock()
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def MetadataPath(game_module:ModuleType, filename:str="DBExport.json") -> Path:
+        """Get the path to a metadata file that lives in a game's package folder.
+
+        :param game_module: The game's package, e.g. `ogd.games.AQUALAB`.
+        :type game_module: ModuleType
+        :param filename: The name of the metadata file, defaults to "DBExport.json"
+        :type filename: str, optional
+        :return: The path to the metadata file.
+        :rtype: Path
+        """
+        _key = (game_module.__name__, filename)
+        ret_val = GameMetadataCache._paths.get(_key)
+        if ret_val is None:
+            _game_path = Path(str(game_module.__file__))
+            _game_path = _game_path if _game_path.is_dir() else _game_path.parent
+            ret_val = GameMetadataCache._paths[_key] = _game_path / filename
+        return ret_val
+
+    @staticmethod
+    def GetMetadata(path:Path) -> Dict[str, Any]:
+        """Get the parsed contents of a metadata file.
+
+        :param path: The path to the metadata file.
+        :type path: Path
+        :raises FileNotFoundError: If the metadata file does not exist.
+        :return: The parsed JSON content of the file, which must not be modified.
+        :rtype: Dict[str, Any]
+        """
+        return GameMetadataCache._getEntry(path=path).data
+
+    @staticmethod
+    def GetDerived(path:Path, key:str, builder:Callable[[Dict[str, Any]], T]) -> T:
+        """Get a structure derived from a metadata file, building it from the file's contents if it was not already cached.
+
+        :param path: The path to the metadata file.
+        :type path: Path
+        :param key: A name for the derived structure, unique among structures derived from the same file.
+        :type key: str
+        :param builder: Function to build the structure from the parsed content of the file.
+        :type builder: Callable[[Dict[str, Any]], T]
+        :raises FileNotFoundError: If the metadata file does not exist.
+        :return: The derived structure, which must not be modified.
+        :rtype: T
+        """
+        with GameMetadataCache._lock:
+            entry = GameMetadataCache._getEntry(path=path)
+            if key not in entry.derived:
+                entry.derived[key] = builder(entry.data)
+            return entry.derived[key]
+
+    @staticmethod
+    def Clear() -> None:
+        with GameMetadataCache._lock:
+            GameMetadataCache._entries = {}
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _getEntry(path:Path) -> _Entry:
+        with GameMetadataCache._lock:
+            entry : Optional[GameMetadataCache._Entry] = GameMetadataCache._entries.get(path)
+            _now = time.monotonic()
+            if entry is not None and _now - entry.checked_at < GameMetadataCache.CHECK_INTERVAL:
+                return entry
+            _stat  = path.stat()
+            _stamp = (_stat.st_mtime_ns, _stat.st_size)
+            if entry is not None:
+                entry.checked_at = _now
+            if entry is None or entry.stamp != _stamp:
+                _raw    = path.read_bytes()
+                _digest = hashlib.sha256(_raw).hexdigest()
+                if entry is not None and entry.digest == _digest:
+                    # file was touched, but content is unchanged, so everything we built from it is still good.
+                    entry.stamp = _stamp
+                else:
+                    Logger.Log(f"Loading game metadata from {path}", logging.DEBUG, depth=3)
+                    entry = GameMetadataCache._Entry(stamp=_stamp, digest=_digest, data=json.loads(_raw))
+                    GameMetadataCache._entries[path] = entry
+            return entry
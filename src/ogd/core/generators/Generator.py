@@ -1,11 +1,12 @@
 ## import standard libraries
 import abc
 import logging
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple, Type
 # import locals
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.utils.Logger import Logger
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
 
 ## @class ExtractorParams
 class GeneratorParameters:
@@ -13,7 +14,12 @@ class GeneratorParameters:
     This just makes it easier to add/manage any new params,
     so that we don't need to change the param list for hundreds of individual
     extractor subclasses every time something changes.
+
+    The parameters are not changed after construction,
+    so one instance is shared by the generators of every session loaded from the same RegistryTemplate.
     """
+    __slots__ = ("_name", "_desc", "_mode", "_count_index")
+
     def __init__(self, name:str, description:str, mode:ExtractionMode, count_index:Optional[int]):
         self._name = name
         self._desc = description
@@ -25,6 +31,12 @@ class GeneratorParameters:
 class Generator(abc.ABC):
 #TODO: use a dirty bit so we only run the GetValue function if we've received an event or feature since last calculation
 
+    # Whether each generator class accepts a given log version, and the event types it accepts in each mode.
+    # Both only depend on the class, so they are worked out once per process and shared by all instances.
+    _version_cache    : Dict[Tuple[Type["Generator"], str], bool]                          = {}
+    _event_type_cache : Dict[Tuple[Type["Generator"], ExtractionMode], FrozenSet[str]]     = {}
+    _cache_stats      : Dict[str, int] = {"version_hits" : 0, "version_misses" : 0, "event_type_hits" : 0, "event_type_misses" : 0}
+
     # *** ABSTRACTS ***
 
     ## Abstract function to get a list of event types the Feature wants.
@@ -120,6 +132,42 @@ class Generator(abc.ABC):
         """
         return [ExtractionMode.POPULATION, ExtractionMode.PLAYER, ExtractionMode.SESSION, ExtractionMode.DETECTOR]
 
+    @staticmethod
+    def ValidationCacheStats() -> Dict[str, int]:
+        """Get the hit and miss counts of the caches used to validate event versions and types, for profiling.
+
+        :return: A mapping of stat names to counts, plus the number of cached versions and event type sets.
+        :rtype: Dict[str, int]
+        """
+        ret_val = dict(Generator._cache_stats)
+        ret_val["cached_versions"]    = len(Generator._version_cache)
+        ret_val["cached_event_types"] = len(Generator._event_type_cache)
+        return ret_val
+
+    @staticmethod
+    def ClearValidationCache() -> None:
+        Generator._version_cache    = {}
+        Generator._event_type_cache = {}
+        Generator._cache_stats      = {key : 0 for key in Generator._cache_stats.keys()}
+
+    @classmethod
+    def AcceptedEventTypes(cls, mode:ExtractionMode) -> FrozenSet[str]:
+        """Get the set of event types the generator class accepts in the given mode, as given by its EventFilter.
+
+        :param mode: The extraction mode of the generator.
+        :type mode: ExtractionMode
+        :return: The accepted event types, which includes 'all_events' if the generator accepts every type.
+        :rtype: FrozenSet[str]
+        """
+        _key = (cls, mode)
+        ret_val = Generator._event_type_cache.get(_key)
+        if ret_val is None:
+            Generator._cache_stats["event_type_misses"] += 1
+            ret_val = Generator._event_type_cache[_key] = frozenset(cls.EventFilter(mode=mode))
+        else:
+            Generator._cache_stats["event_type_hits"] += 1
+        return ret_val
+
     # *** PUBLIC METHODS ***
 
     @classmethod
@@ -133,9 +181,15 @@ class Generator(abc.ABC):
     def UpdateFromEvent(self, event:Event):
         if self._validateEvent(event=event):
             self._updateFromEvent(event=event)
+        elif GeneratorProfiler.Enabled:
+            GeneratorProfiler.Rejected(self)
 
     # *** PROPERTIES ***
 
+    @property
+    def Params(self) -> GeneratorParameters:
+        return self._params
+
     @property
     def Name(self) -> str:
         return self._params._name
@@ -173,6 +227,23 @@ class Generator(abc.ABC):
     def _validateVersion(self, data_version:str) -> bool:
         """Private function to check whether a given version is valid for this Feature.
 
+        :param data_version: The logging version for some event to be checked.
+        :type data_version: str
+        :return: True if the given version is valid for this feature, otherwise false.
+        :rtype: bool
+        """
+        _key = (type(self), data_version)
+        ret_val = Generator._version_cache.get(_key)
+        if ret_val is None:
+            Generator._cache_stats["version_misses"] += 1
+            ret_val = Generator._version_cache[_key] = self._compareVersion(data_version=data_version)
+        else:
+            Generator._cache_stats["version_hits"] += 1
+        return ret_val
+
+    def _compareVersion(self, data_version:str) -> bool:
+        """Uncached check of whether a given version is between this Feature's min and max versions.
+
         :param data_version: The logging version for some event to be checked.
         :type data_version: str
         :return: True if the given version is valid for this feature, otherwise false.
@@ -199,7 +270,7 @@ class Generator(abc.ABC):
         :return: True if the given event type is in this feature's list, otherwise false.
         :rtype: bool
         """
-        _deps = self.EventFilter(mode=self.ExtractionMode)
+        _deps = self.AcceptedEventTypes(mode=self.ExtractionMode)
         if event_type in _deps or 'all_events' in _deps:
             return True
         else:
@@ -9,6 +9,7 @@ from ogd.core.generators.extractors import builtin
 from ogd.core.generators.extractors.builtin.BuiltinExtractor import BuiltinExtractor
 from ogd.core.generators.extractors.builtin import *
 from ogd.core.generators.Generator import Generator, GeneratorParameters
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
 from ogd.core.generators.detectors.Detector import Detector
 from ogd.core.generators.extractors.Extractor import Extractor
 from ogd.common.models.Event import Event
@@ -63,20 +64,43 @@ class GeneratorLoader(abc.ABC):
 
     # *** PUBLIC METHODS ***
     
-    def LoadDetector(self, detector_type:str, name:str, schema_args:Dict[str,Any], trigger_callback:Callable[[Event], None], count_index:Optional[int] = None) -> Optional[Detector]:
+    def LoadDetector(self, detector_type:str, name:str, schema_args:Dict[str,Any], trigger_callback:Callable[[Event], None], count_index:Optional[int] = None,
+                     params:Optional[GeneratorParameters] = None) -> Optional[Detector]:
         ret_val = None
 
-        params = GeneratorParameters(name=name, description=schema_args.get('description',""), mode=self._mode, count_index=count_index)
+        params = params or GeneratorParameters(name=name, description=schema_args.get('description',""), mode=self._mode, count_index=count_index)
         ret_val = self._loadDetector(detector_type=detector_type, extractor_params=params, schema_args=schema_args, trigger_callback=trigger_callback) \
                or self._loadBuiltinDetector(detector_type=detector_type, extractor_params=params, schema_args=schema_args, trigger_callback=trigger_callback)
 
         return ret_val
 
-    def LoadFeature(self, feature_type:str, name:str, schema_args:Dict[str,Any], count_index:Optional[int] = None) -> Optional[Extractor]:
+    def LoadFeature(self, feature_type:str, name:str, schema_args:Dict[str,Any], count_index:Optional[int] = None, validate:bool = True,
+                    params:Optional[GeneratorParameters] = None) -> Optional[Extractor]:
+        """Load an instance of a feature.
+
+        :param feature_type: The type (class name) of the feature to load.
+        :type feature_type: str
+        :param name: The name of the feature instance.
+        :type name: str
+        :param schema_args: Any non-standard elements from the feature's schema.
+        :type schema_args: Dict[str,Any]
+        :param count_index: The count index of a per-count feature, defaults to None
+        :type count_index: Optional[int], optional
+        :param validate: Whether to check that the feature class supports the loader's mode.
+            This may be skipped when the feature type is already known to be valid, e.g. when loading from a RegistryTemplate.
+            Defaults to True
+        :type validate: bool, optional
+        :param params: Parameters to share with other instances of the same feature, e.g. those of the instance a RegistryTemplate was compiled from.
+            If given, the name, description, and count index come from the parameters instead of being built again.
+            Defaults to None
+        :type params: Optional[GeneratorParameters], optional
+        :return: An instance of the feature, or None if the feature could not be loaded.
+        :rtype: Optional[Extractor]
+        """
         ret_val = None
 
-        if self._validateMode(feature_type=feature_type):
-            params = GeneratorParameters(name=name, description=schema_args.get('description',""), mode=self._mode, count_index=count_index)
+        if not validate or self._validateMode(feature_type=feature_type):
+            params = params or GeneratorParameters(name=name, description=schema_args.get('description',""), mode=self._mode, count_index=count_index)
             ret_val = self._loadFeature(feature_type=feature_type, extractor_params=params, schema_args=schema_args) \
                    or self._loadBuiltinFeature(feature_type=feature_type, extractor_params=params, schema_args=schema_args)
 
@@ -86,8 +110,11 @@ class GeneratorLoader(abc.ABC):
         ret_val : Optional[Type[Extractor]] = None
         game_module = self._getFeaturesModule()
         try:
-            # Try to find feature module in the game module, falling back on finding it in builtin module.
-            feature_mod = getattr(game_module, feature_type, None) or getattr(builtin, feature_type)
+            # If the manifest knows which module defines the class, import just that module.
+            _module_name = GeneratorManifest.ModuleFor(package=game_module.__name__, class_name=feature_type)
+            feature_mod  = import_module(_module_name) if _module_name is not None else None
+            # Otherwise, try to find feature module in the game module, falling back on finding it in builtin module.
+            feature_mod = feature_mod or getattr(game_module, feature_type, None) or getattr(builtin, feature_type)
             # if feature_mod is None:
             #     Logger.Log(f"Didn't find module for feature {feature_type} in module {game_module}, searching in builtin module instead.")
             #     feature_mod = 
@@ -0,0 +1,167 @@
+# import libraries
+import ast
+import importlib.util
+import json
+import logging
+import sys
+import threading
+import warnings
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Tuple
+# import locals
+from ogd.common.utils.Logger import Logger
+
+class GeneratorManifest:
+    """Registry of where each game's feature and detector classes live, so they can be imported only when they are used.
+
+    The manifest is a JSON file in the `ogd.games` package, generated by `Write` (or by running this module),
+    which maps each game's features and detectors packages to the classes defined in their modules, e.g.
+    `{"ogd.games.AQUALAB.features" : {"ActiveTime" : "ActiveTime", "SessionDuration" : "SessionDurationPerJob", ...}, ...}`.
+    It is generated from the source files without importing them, so it only needs to be regenerated when a generator module is added, renamed, or removed.
+    If the file is missing, the manifest is built from the source files when first needed.
+
+    The generator packages themselves use `LazyModules` to bind their modules without importing them,
+    so a loader that star-imports a package still only imports the modules of the generators it actually creates.
+    """
+
+    MANIFEST_FILE : str = "generators.json"
+    KINDS         : Tuple[str, ...] = ("features", "detectors")
+
+    _manifest : Optional[Dict[str, Dict[str, str]]] = None
+    _lock     : threading.Lock                      = threading.Lock()
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def ModuleFor(package:str, class_name:str) -> Optional[str]:
+        """Find the module that defines a generator class.
+
+        :param package: The name of the generators package, e.g. `ogd.games.AQUALAB.features`.
+        :type package: str
+        :param class_name: The name of the generator class, e.g. a feature type from a game's schema.
+        :type class_name: str
+        :return: The full name of the module defining the class, or None if the manifest has no such class in the package.
+        :rtype: Optional[str]
+        """
+        _module = GeneratorManifest.Load().get(package, {}).get(class_name)
+        return f"{package}.{_module}" if _module is not None else None
+
+    @staticmethod
+    def LazyModules(package:str, modules:Iterable[str]) -> Dict[str, ModuleType]:
+        """Create modules of a package that are only executed when one of their attributes is first used.
+
+        Each module is added to `sys.modules`, so later imports of it get the same module object, and none of its code runs until it is used.
+        Names without a module file in the package (e.g. functions re-exported by the package) are skipped.
+        Each game's features and detectors packages call this from their `__init__`, so a loader only imports the generators its game schema enables.
+
+        :param package: The name of the package, which must already be in `sys.modules` (i.e. the package calling this from its `__init__`).
+        :type package: str
+        :param modules: The names of the package's modules.
+        :type modules: Iterable[str]
+        :return: A mapping of module names to the (lazy) module objects, to be added to the package's namespace.
+        :rtype: Dict[str, ModuleType]
+        """
+        ret_val : Dict[str, ModuleType] = {}
+        _package_dir = Path(sys.modules[package].__path__[0])
+        for name in modules:
+            _full_name = f"{package}.{name}"
+            if _full_name in sys.modules:
+                ret_val[name] = sys.modules[_full_name]
+                continue
+            _path = _package_dir / f"{name}.py"
+            if not _path.is_file():
+                continue
+            _spec = importlib.util.spec_from_file_location(_full_name, _path)
+            if _spec is None or _spec.loader is None:
+                continue
+            _spec.loader = importlib.util.LazyLoader(_spec.loader)
+            _module = importlib.util.module_from_spec(_spec)
+            sys.modules[_full_name] = _module
+            _spec.loader.exec_module(_module)
+            ret_val[name] = _module
+        return ret_val
+
+    @staticmethod
+    def Load() -> Dict[str, Dict[str, str]]:
+        """Get the manifest, reading it on first use.
+
+        :return: A mapping of generator package names to the classes in each package, and the modules defining them.
+        :rtype: Dict[str, Dict[str, str]]
+        """
+        if GeneratorManifest._manifest is None:
+            with GeneratorManifest._lock:
+                if GeneratorManifest._manifest is None:
+                    _games_dir = GeneratorManifest._gamesDirectory()
+                    try:
+                        with open(_games_dir / GeneratorManifest.MANIFEST_FILE, encoding="utf-8") as _file:
+                            GeneratorManifest._manifest = json.load(_file)
+                    except (OSError, json.JSONDecodeError) as err:
+                        Logger.Log(f"Could not read generator manifest from {_games_dir}, building it from source files instead:\n{err}", logging.DEBUG)
+                        GeneratorManifest._manifest = GeneratorManifest.Build(games_dir=_games_dir)
+        return GeneratorManifest._manifest
+
+    @staticmethod
+    def Build(games_dir:Path) -> Dict[str, Dict[str, str]]:
+        """Build the manifest by parsing the generator modules of every game, without importing them.
+
+        :param games_dir: The directory of the `ogd.games` package.
+        :type games_dir: Path
+        :return: A mapping of generator package names to the public classes defined by each module in the package.
+        :rtype: Dict[str, Dict[str, str]]
+        """
+        ret_val : Dict[str, Dict[str, str]] = {}
+        for game_dir in sorted(path for path in games_dir.iterdir() if path.is_dir() and not path.name.startswith("__")):
+            for kind in GeneratorManifest.KINDS:
+                _package_dir = game_dir / kind
+                if not (_package_dir / "__init__.py").is_file():
+                    continue
+                _classes : Dict[str, str] = {}
+                for module_path in sorted(_package_dir.glob("*.py")):
+                    if module_path.name == "__init__.py":
+                        continue
+                    try:
+                        # the modules are only parsed, not run, so warnings about their code (e.g. invalid escapes) are not relevant here.
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("ignore", SyntaxWarning)
+                            _tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+                    except SyntaxError as err:
+                        Logger.Log(f"Could not parse {module_path} for the generator manifest:\n{err}", logging.WARN)
+                        continue
+                    for node in _tree.body:
+                        # if a class name is defined in more than one module, prefer the module of the same name.
+                        if isinstance(node, ast.ClassDef) and not node.name.startswith("_") \
+                        and (node.name not in _classes or node.name == module_path.stem):
+                            _classes[node.name] = module_path.stem
+                ret_val[f"ogd.games.{game_dir.name}.{kind}"] = dict(sorted(_classes.items()))
+        return ret_val
+
+    @staticmethod
+    def Write(games_dir:Optional[Path]=None) -> Path:
+        """Regenerate the manifest file from the generator modules.
+
+        :param games_dir: The directory of the `ogd.games` package, defaults to None, in which case the installed package is used.
+        :type games_dir: Optional[Path], optional
+        :return: The path of the manifest file.
+        :rtype: Path
+        """
+        _games_dir = games_dir or GeneratorManifest._gamesDirectory()
+        _manifest  = GeneratorManifest.Build(games_dir=_games_dir)
+        ret_val = _games_dir / GeneratorManifest.MANIFEST_FILE
+        with open(ret_val, "w", encoding="utf-8") as _file:
+            json.dump(_manifest, _file, indent=4)
+            _file.write("\n")
+        GeneratorManifest._manifest = _manifest
+        return ret_val
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _gamesDirectory() -> Path:
+        from ogd import games
+        _games_path = Path(str(games.__file__))
+        return _games_path if _games_path.is_dir() else _games_path.parent
+
+# Regenerate the manifest with `python -m ogd.core.generators.GeneratorManifest`
+if __name__ == "__main__":
+    print(f"Wrote generator manifest to {GeneratorManifest.Write()}")
@@ -0,0 +1,205 @@
+## import standard libraries
+import json
+import logging
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+# import locals
+from ogd.common.models.Event import Event
+from ogd.common.utils.Logger import Logger
+
+class GeneratorProfiler:
+    """Collects the time spent in each generator, and how often each one was called, while profiling is enabled.
+
+    Stats are kept per generator class and instance name, summed over every registry the instance appears in,
+    so that e.g. the session-level instances of a feature for all sessions are counted together.
+    For each generator, three kinds of calls are tracked:
+    updates from events (along with the number of events the generator rejected on validation),
+    updates from the FeatureData of other features, and calculations of feature values.
+
+    Like the validation caches of `Generator`, the stats are kept at class level, so they are per-process.
+    When profiling is disabled, generators and registries skip the instrumentation entirely.
+    """
+
+    EVENTS   : str = "events"
+    FEATURES : str = "features"
+    VALUES   : str = "values"
+
+    Enabled  : bool = False
+    # maps (class name, instance name) to [event seconds, event calls, rejected events, feature seconds, feature calls, value seconds, value calls]
+    _stats   : Dict[Tuple[str, str], List[float]] = {}
+
+    _OFFSETS : Dict[str, int] = { EVENTS : 0, FEATURES : 3, VALUES : 5 }
+    _COLUMNS : List[str] = ["rank", "class", "instance", "total_seconds", "percent",
+                            "event_seconds", "event_calls", "rejected_events",
+                            "feature_seconds", "feature_calls", "value_seconds", "value_calls"]
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Enable() -> None:
+        GeneratorProfiler.Enabled = True
+
+    @staticmethod
+    def Disable() -> None:
+        GeneratorProfiler.Enabled = False
+
+    @staticmethod
+    def Reset() -> None:
+        GeneratorProfiler._stats = {}
+
+    @staticmethod
+    def Wrap(generator:Any, update:Callable[[Event], None]) -> Callable[[Event], None]:
+        """Wrap the function that sends events to a generator, so each call is timed and counted.
+
+        :param generator: The generator that receives the events.
+        :type generator: Generator
+        :param update: The function that sends an event to the generator.
+        :type update: Callable[[Event], None]
+        :return: A function with the same behavior as `update`, which also records the time and call to the generator's stats.
+        :rtype: Callable[[Event], None]
+        """
+        _stats = GeneratorProfiler._statsFor(generator)
+        def _timed(event:Event) -> None:
+            start = perf_counter()
+            try:
+                update(event)
+            finally:
+                _stats[0] += perf_counter() - start
+                _stats[1] += 1
+        return _timed
+
+    @staticmethod
+    def Call(generator:Any, kind:str, func:Callable[..., Any], *args:Any) -> Any:
+        """Call a function of a generator, recording the time and call to the generator's stats for the given kind of call.
+
+        :param generator: The generator the function belongs to.
+        :type generator: Generator
+        :param kind: The kind of call, one of `GeneratorProfiler.EVENTS`, `FEATURES`, or `VALUES`.
+        :type kind: str
+        :param func: The function to call.
+        :type func: Callable[..., Any]
+        :return: Whatever the function returned.
+        :rtype: Any
+        """
+        _stats  = GeneratorProfiler._statsFor(generator)
+        _offset = GeneratorProfiler._OFFSETS[kind]
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            _stats[_offset]     += perf_counter() - start
+            _stats[_offset + 1] += 1
+
+    @staticmethod
+    def Rejected(generator:Any) -> None:
+        """Count an event the generator rejected on validation."""
+        GeneratorProfiler._statsFor(generator)[2] += 1
+
+    @staticmethod
+    def Drain() -> Dict[Tuple[str, str], List[float]]:
+        """Take the stats collected so far, and reset them, so they can be sent to another process and merged there.
+
+        :return: The collected stats, keyed by generator class and instance name.
+        :rtype: Dict[Tuple[str, str], List[float]]
+        """
+        # stats are zeroed in place, since wrapped dispatchers hold on to the stats of their generators.
+        ret_val = {key : list(stats) for key, stats in GeneratorProfiler._stats.items() if stats[1] + stats[2] + stats[4] + stats[6] > 0}
+        for stats in GeneratorProfiler._stats.values():
+            stats[:] = [0.0] * 7
+        return ret_val
+
+    @staticmethod
+    def Merge(stats:Dict[Tuple[str, str], List[float]]) -> None:
+        """Add stats collected elsewhere (e.g. by a worker process) to the stats in this process.
+
+        :param stats: The stats to add, as returned by `Drain`.
+        :type stats: Dict[Tuple[str, str], List[float]]
+        """
+        for key, values in stats.items():
+            _stats = GeneratorProfiler._stats.setdefault(key, [0.0] * 7)
+            for i, value in enumerate(values):
+                _stats[i] += value
+
+    @staticmethod
+    def Report() -> List[Dict[str, Any]]:
+        """Get the collected stats as rows, ranked from the generator instance with the most total time to the least.
+
+        :return: A list of rows, one per generator instance, with the columns of `GeneratorProfiler._COLUMNS`.
+        :rtype: List[Dict[str, Any]]
+        """
+        _totals = {key : stats[0] + stats[3] + stats[5] for key, stats in GeneratorProfiler._stats.items()
+                   if stats[1] + stats[2] + stats[4] + stats[6] > 0}
+        _grand_total = sum(_totals.values())
+        ret_val : List[Dict[str, Any]] = []
+        for rank, key in enumerate(sorted(_totals.keys(), key=lambda key : (-_totals[key], key)), start=1):
+            _stats = GeneratorProfiler._stats[key]
+            ret_val.append({
+                "rank"            : rank,
+                "class"           : key[0],
+                "instance"        : key[1],
+                "total_seconds"   : round(_totals[key], 6),
+                "percent"         : round(100 * _totals[key] / _grand_total, 2) if _grand_total > 0 else 0.0,
+                "event_seconds"   : round(_stats[0], 6),
+                "event_calls"     : int(_stats[1]),
+                "rejected_events" : int(_stats[2]),
+                "feature_seconds" : round(_stats[3], 6),
+                "feature_calls"   : int(_stats[4]),
+                "value_seconds"   : round(_stats[5], 6),
+                "value_calls"     : int(_stats[6]),
+            })
+        return ret_val
+
+    @staticmethod
+    def ClassReport() -> List[Dict[str, Any]]:
+        """Get the collected stats summed over the instances of each generator class, ranked from the class with the most total time to the least.
+
+        :return: A list of rows, one per generator class, with the same columns as `Report`, except that "instance" is the count of instances.
+        :rtype: List[Dict[str, Any]]
+        """
+        _classes : Dict[str, Dict[str, Any]] = {}
+        for row in GeneratorProfiler.Report():
+            _class = _classes.setdefault(row["class"], {col : 0 for col in GeneratorProfiler._COLUMNS if col not in {"rank", "class"}})
+            for col, value in row.items():
+                if col not in {"rank", "class", "instance"}:
+                    _class[col] += value
+            _class["instance"] += 1
+        ret_val : List[Dict[str, Any]] = []
+        for rank, (name, row) in enumerate(sorted(_classes.items(), key=lambda item : (-item[1]["total_seconds"], item[0])), start=1):
+            ret_val.append({"rank" : rank, "class" : name, **{col : round(value, 6) if isinstance(value, float) else value for col, value in row.items()}})
+        return ret_val
+
+    @staticmethod
+    def WriteReport(directory:Path, base_name:str) -> List[Path]:
+        """Write the ranked report of collected stats, as a TSV file with one row per generator instance,
+        and a JSON file with both the per-instance and per-class rankings.
+
+        :param directory: The directory in which to write the report.
+        :type directory: Path
+        :param base_name: The start of the report file names, to which "_generator-profile.tsv" and "_generator-profile.json" are added.
+        :type base_name: str
+        :return: The paths of the files that were written.
+        :rtype: List[Path]
+        """
+        _rows = GeneratorProfiler.Report()
+        directory.mkdir(exist_ok=True, parents=True)
+        _tsv_path  = directory / f"{base_name}_generator-profile.tsv"
+        _json_path = directory / f"{base_name}_generator-profile.json"
+        with open(_tsv_path, "w", encoding="utf-8") as _file:
+            _file.write("\t".join(GeneratorProfiler._COLUMNS) + "\n")
+            for row in _rows:
+                _file.write("\t".join(str(row[col]) for col in GeneratorProfiler._COLUMNS) + "\n")
+        with open(_json_path, "w", encoding="utf-8") as _file:
+            json.dump({"instances" : _rows, "classes" : GeneratorProfiler.ClassReport()}, _file, indent=2)
+        Logger.Log(f"Wrote profile of {len(_rows)} generators to {_tsv_path} and {_json_path}", logging.INFO, depth=1)
+        return [_tsv_path, _json_path]
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _statsFor(generator:Any) -> List[float]:
+        _key = (type(generator).__name__, generator.Name)
+        ret_val = GeneratorProfiler._stats.get(_key)
+        if ret_val is None:
+            ret_val = GeneratorProfiler._stats[_key] = [0.0] * 7
+        return ret_val
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 # import locals
 from ogd.core.generators.Generator import Generator, GeneratorParameters
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
 from ogd.core.generators.detectors.DetectorEvent import DetectorEvent
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
@@ -70,7 +71,10 @@ class Detector(Generator):
             if self._trigger_condition():
                 self._triggering_event = event
                 _new_event = self._trigger_event()
+                _new_event.Source = self.Name
                 self._callback(_new_event)
+        elif GeneratorProfiler.Enabled:
+            GeneratorProfiler.Rejected(self)
 
     def GenerateEvent(self, event_name:str,              event_data:Map,
                       session_id:Optional[str]=None,     app_id:Optional[str]=None,
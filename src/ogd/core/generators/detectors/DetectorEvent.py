@@ -43,4 +43,6 @@ class DetectorEvent(Event):
                        event_name=event_name,   event_data=event_data,   event_source=EventSource.GENERATED,
                        app_version=app_version, log_version=log_version, time_offset=time_offset,
                        user_id=user_id,         user_data=user_data,
-                       game_state=game_state,   event_sequence_index=event_sequence_index)
\ No newline at end of file
+                       game_state=game_state,   event_sequence_index=event_sequence_index)
+      # name of the detector that generated the event, set by the detector when it is triggered.
+      self.Source : Optional[str] = None
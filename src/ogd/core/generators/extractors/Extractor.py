@@ -3,6 +3,7 @@ import abc
 from typing import Any, Dict, List, Optional
 # import locals
 from ogd.core.generators.Generator import Generator, GeneratorParameters
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
@@ -17,6 +18,11 @@ class Extractor(Generator):
 
 #TODO: use a dirty bit so we only run the GetValue function if we've received an event or feature since last calculation
 
+    # Defaults for the calculated values, shared by every instance until it calculates its own,
+    # so an extractor that never sees an event (e.g. most per-count instances in a session) holds no copy of them.
+    _up_to_date    : bool                = False
+    _latest_values : Optional[List[Any]] = None
+
     # *** ABSTRACTS ***
 
     ## Abstract declaration of a function to perform update of a feature from a row.
@@ -43,9 +49,6 @@ class Extractor(Generator):
 
     def __init__(self, params:GeneratorParameters):
         super().__init__(params=params)
-        self._up_to_date = False
-        # by default, latest values should just be None, with length equal to number of columns for the feature.
-        self._latest_values : List[Any] = [None for i in range(len(self.GetFeatureNames())) ]
 
     # *** PUBLIC STATICS ***
 
@@ -128,6 +131,8 @@ class Extractor(Generator):
         if self._validateEvent(event=event):
             self._updateFromEvent(event=event)
             self._up_to_date = False
+        elif GeneratorProfiler.Enabled:
+            GeneratorProfiler.Rejected(self)
 
     def UpdateFromFeatureData(self, feature:FeatureData):
         # TODO: add validation for FeatureData, if applicable/possible.
@@ -140,9 +145,24 @@ class Extractor(Generator):
         # Practically, this doesn't matter because we always process all data before using GetFeatureValues.
         # Someday, however, this may be useful when dealing with a caching system.
         if not self._up_to_date:
-            self._latest_value = self._getFeatureValues()
+            if GeneratorProfiler.Enabled:
+                self._latest_values = GeneratorProfiler.Call(self, GeneratorProfiler.VALUES, self._getFeatureValues)
+            else:
+                self._latest_values = self._getFeatureValues()
             self._up_to_date = True
-        return self._latest_value
+        return self._latest_values
+
+    def Restore(self, values:List[Any]) -> None:
+        """Set the feature's values to ones calculated earlier, e.g. by a worker process or in a previous export.
+
+        The values are kept until the feature sees another event or FeatureData,
+        so a restored feature should not be sent any events it would have counted towards them.
+
+        :param values: The values of all columns of the feature, as returned by an earlier call to GetFeatureValues.
+        :type values: List[Any]
+        """
+        self._latest_values = list(values)
+        self._up_to_date = True
 
     # *** PROPERTIES ***
 
@@ -1,6 +1,7 @@
 # import standard libraries
 import abc
 from multiprocessing.sharedctypes import Value
+from typing import Iterable, Optional
 # import locals
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.Feature import Feature
@@ -35,8 +36,37 @@ class PerCountFeature(Feature):
 
     # *** PUBLIC STATICS ***
 
+    @classmethod
+    def IndexesEvents(cls) -> bool:
+        """Whether the feature class can work out which count indices an event belongs to, via `_eventCountIndices`.
+
+        This is only the case if the class (or a parent) overrides `_eventCountIndices`,
+        and no class further down the hierarchy changed how events are validated without also overriding `_eventCountIndices`.
+
+        :return: True if registries can use `CountIndicesForEvent` to dispatch events to instances of the class, otherwise False.
+        :rtype: bool
+        """
+        def _owner(attr:str) -> type:
+            return next(_class for _class in cls.__mro__ if attr in _class.__dict__)
+
+        _indexer_owner = _owner("_eventCountIndices")
+        return _indexer_owner is not PerCountFeature \
+           and all(issubclass(_indexer_owner, _owner(attr)) for attr in ("_validateEventCountIndex", "_validateEvent", "UpdateFromEvent"))
+
     # *** PUBLIC METHODS ***
 
+    def CountIndicesForEvent(self, event:Event) -> Optional[Iterable[int]]:
+        """Get the count indices of the instances of this feature class which could accept the given event.
+
+        Registries use this to send an event only to matching instances of a per-count feature, instead of all of them.
+
+        :param event: The event to be dispatched.
+        :type event: Event
+        :return: The count indices the event may belong to, or None if they could not be determined, in which case the event should go to every instance.
+        :rtype: Optional[Iterable[int]]
+        """
+        return self._eventCountIndices(event=event)
+
     # *** PROPERTIES ***
 
     @property
@@ -51,6 +81,21 @@ class PerCountFeature(Feature):
 
     # *** PRIVATE METHODS ***
 
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        """Optional override, to work out which count indices an event belongs to.
+
+        The result must include every index whose instance would accept the event in `_validateEventCountIndex`,
+        and may only depend on the event and on data shared by all instances of the class.
+        Instances still validate each event they receive, so returning extra indices is safe, but leaving one out is not.
+        Return None whenever the indices can't be determined (e.g. the event is missing data), so that every instance gets the event.
+
+        :param event: The event to be dispatched.
+        :type event: Event
+        :return: The count indices the event may belong to, or None if unknown.
+        :rtype: Optional[Iterable[int]]
+        """
+        return None
+
     def _validateEvent(self, event:Event):
        
         return (
@@ -1,3 +1,5 @@
+# import standard libraries
+from typing import Iterable, Optional
 # import locals
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
@@ -38,3 +40,9 @@ class PerLevelFeature(PerCountFeature):
     def _validateEventCountIndex(self, event:Event):
     
         return int(event.GameState['level']) == self.CountIndex
+
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        try:
+            return (int(event.GameState['level']),)
+        except (KeyError, ValueError, TypeError):
+            return None
@@ -1,5 +1,6 @@
 # import standard libraries
 import logging
+from typing import Optional
 # import locals
 from ogd.core.generators.extractors.Feature import Feature
 from ogd.core.generators.Generator import GeneratorParameters
@@ -12,7 +13,6 @@ class SessionFeature(Feature):
     def __init__(self, params:GeneratorParameters):
         if params._count_index is not None and params._count_index != 0:
             Logger.Log(f"Session feature {params._name} got non-zero count index of {params._count_index}!", logging.WARN)
-        params._count_index = 0
         super().__init__(params=params)
 
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
@@ -23,6 +23,11 @@ class SessionFeature(Feature):
 
     # *** PROPERTIES ***
 
+    @property
+    def CountIndex(self) -> Optional[int]:
+        # session features always have a count index of 0; the parameters are shared, so this is not set in them.
+        return 0
+
     # *** PRIVATE STATICS ***
 
     # *** PRIVATE METHODS ***
@@ -16,7 +16,6 @@ class Timespan(BuiltinExtractor):
     def __init__(self, params:GeneratorParameters, schema_args:Dict[str,Any]):
         if params._count_index is not None and params._count_index != 0:
             self.WarningMessage(f"Session feature {params._name} got non-zero count index of {params._count_index}!")
-        params._count_index = 0
         super().__init__(params=params, schema_args=schema_args)
         self._start_time : Optional[datetime] = None
         self._end_time   : Optional[datetime] = None
@@ -107,3 +106,8 @@ class Timespan(BuiltinExtractor):
     def MaxVersion() -> Optional[str]:
         # >>> replace return statement below with a string defining the maximum logging version for events to be processed by this Feature. <<<
         return None
+
+    @property
+    def CountIndex(self) -> Optional[int]:
+        # like session features, always has a count index of 0; the parameters are shared, so this is not set in them.
+        return 0
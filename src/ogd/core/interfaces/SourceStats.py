@@ -0,0 +1,106 @@
+## import standard libraries
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+## import local files
+from ogd.common.interfaces.EventInterface import EventInterface
+from ogd.common.utils.Logger import Logger
+
+# The state of a session at the source: its number of events, and the ISO timestamp of its latest event.
+SessionStats = Tuple[int, str]
+
+class SourceStats:
+    """Queries for the state of many sessions at an interface's source, without retrieving their events.
+
+    Each call makes a single grouped query (`... GROUP BY session_id`) for all of the given sessions,
+    so caches can check a whole slice for changes in one round-trip, rather than one per session.
+    The database interfaces are matched by class name, so their client libraries are only imported by exports that use them.
+    Interfaces in this package, and any other interface with a `SessionStats(id_list)` function, are asked directly.
+    """
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def SessionStats(interface:EventInterface, session_ids:Iterable[str]) -> Optional[Dict[str, SessionStats]]:
+        """Get the event count and latest event time of each of the given sessions, at the interface's source.
+
+        :param interface: The interface events are retrieved from.
+        :type interface: EventInterface
+        :param session_ids: The IDs of the sessions to check.
+        :type session_ids: Iterable[str]
+        :return: The stats of each session that has events at the source, by session ID,
+            or None if the interface does not support the query, in which case no session can be checked.
+        :rtype: Optional[Dict[str, SessionStats]]
+        """
+        _ids = list(dict.fromkeys(session_ids))
+        if len(_ids) == 0:
+            return {}
+        _query : Optional[Callable[..., List[Tuple[Any, Any, Any]]]] = getattr(interface, "SessionStats", None)
+        _rows  : Optional[List[Tuple[Any, Any, Any]]]
+        if _query is not None:
+            _rows = _query(id_list=_ids)
+        else:
+            match type(interface).__name__:
+                case "MySQLInterface":
+                    _rows = SourceStats._fromMySQL(interface=interface, session_ids=_ids)
+                case "BigQueryInterface":
+                    _rows = SourceStats._fromBigQuery(interface=interface, session_ids=_ids)
+                case "CSVInterface":
+                    _rows = SourceStats._fromDataFrame(interface=interface, session_ids=_ids)
+                case _:
+                    Logger.Log(f"{type(interface).__name__} does not support session stats queries, sessions cannot be checked for changes.", logging.WARN, depth=3)
+                    _rows = None
+        if _rows is None:
+            return None
+        return { str(sess_id) : (int(count), SourceStats._timeString(latest)) for sess_id, count, latest in _rows if count }
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _timeString(time:Any) -> str:
+        return time.isoformat() if isinstance(time, datetime) else str(time)
+
+    @staticmethod
+    def _fromMySQL(interface:Any, session_ids:List[str]) -> Optional[List[Tuple[Any, Any, Any]]]:
+        from ogd.common.interfaces.MySQLInterface import SQL
+
+        if interface._db_cursor is None:
+            Logger.Log(f"Could not get stats of {len(session_ids)} sessions, MySQL connection is not open.", logging.WARN, depth=3)
+            return None
+        _sess_col = interface._TableSchema.SessionIDColumn or "session_id"
+        _filters  : List[str] = []
+        _params   : Tuple[str, ...] = tuple()
+        if interface._config.TableName != interface._game_id:
+            _filters.append("`app_id`=%s")
+            _params += (interface._game_id,)
+        _filters.append(f"`{_sess_col}` IN ({','.join(['%s'] * len(session_ids))})")
+        _params += tuple(session_ids)
+        return SQL.SELECT(cursor=interface._db_cursor, db_name=interface._config.DatabaseName, table=interface._config.TableName,
+                          columns=[f"`{_sess_col}`", "COUNT(*)", "MAX(server_time)"], filter=" AND ".join(_filters),
+                          grouping=f"`{_sess_col}`", params=_params)
+
+    @staticmethod
+    def _fromBigQuery(interface:Any, session_ids:List[str]) -> Optional[List[Tuple[Any, Any, Any]]]:
+        from google.api_core.exceptions import BadRequest
+
+        _id_string = ','.join([f"'{sess_id}'" for sess_id in session_ids])
+        query = f"""
+            SELECT session_id, COUNT(*), MAX(server_time)
+            FROM `{interface.DBPath()}`
+            WHERE session_id IN ({_id_string})
+            GROUP BY session_id
+        """
+        Logger.Log(f"Running query for session stats:\n{query}", logging.DEBUG, depth=3)
+        try:
+            return [tuple(row.values()) for row in interface._client.query(query)]
+        except BadRequest as err:
+            Logger.Log(f"Got a BadRequest error when trying to retrieve session stats from BigQuery, sessions cannot be checked for changes.\n{err}", logging.WARNING)
+            return None
+
+    @staticmethod
+    def _fromDataFrame(interface:Any, session_ids:List[str]) -> Optional[List[Tuple[Any, Any, Any]]]:
+        _data = interface._data
+        if _data.empty:
+            return []
+        _grouped = _data.loc[_data['session_id'].isin(session_ids)].groupby('session_id')['timestamp'].agg(['size', 'max'])
+        return list(_grouped.itertuples(index=True, name=None))
@@ -0,0 +1,187 @@
+## import standard libraries
+import csv
+import logging
+from datetime import datetime
+from pathlib import Path
+from pprint import pformat
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+## import local files
+from ogd.common.interfaces.EventInterface import EventInterface
+from ogd.common.models.Event import Event
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.utils.Logger import Logger
+
+class StreamingFileInterface(EventInterface):
+    """Interface to read events from a CSV or TSV file, one row at a time, rather than loading the whole file into memory.
+
+    For an export, `StreamSessions` makes a single pass over the file, yielding the events of each session as soon as the session ends,
+    so the file must already be sorted (or at least grouped) by session.
+    The other interface functions are also supported, but each one is a full pass over the file,
+    so for files that are not sorted by session, the `CSVInterface` is the better choice.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, game_id:str, config:GameSourceSchema, fail_fast:bool, filepath:Path, delim:str = ','):
+        self._filepath  : Path      = filepath
+        self._delimiter : str       = delim
+        self._header    : List[str] = []
+        super().__init__(game_id=game_id, config=config, fail_fast=fail_fast)
+        self.Open()
+
+    def __str__(self) -> str:
+        return f"StreamingFileInterface({self._filepath})"
+
+    # *** IMPLEMENT ABSTRACT FUNCTIONS ***
+
+    def _open(self) -> bool:
+        try:
+            with open(self._filepath, newline='', encoding='utf-8') as _file:
+                self._header = next(csv.reader(_file, delimiter=self._delimiter), [])
+        except FileNotFoundError:
+            Logger.Log(f"Could not find file {self._filepath}.", logging.ERROR)
+            return False
+        Logger.Log(f"Opened {self._filepath} for streaming, columns are: {self._header}", logging.INFO)
+        self._is_open = True
+        return True
+
+    def _close(self) -> bool:
+        self._is_open = False
+        return True
+
+    def _allIDs(self) -> List[str]:
+        _sess_col = self._columnIndex("session_id")
+        return list(dict.fromkeys(str(row[_sess_col]) for row in self._rows() if row[_sess_col] is not None))
+
+    def _fullDateRange(self) -> Dict[str,datetime]:
+        _time_col = self._columnIndex("timestamp")
+        _times = [_time for _time in (StreamingFileInterface._parseTime(row[_time_col]) for row in self._rows()) if _time is not None]
+        return {'min':min(_times), 'max':max(_times)} if len(_times) > 0 else {'min':None, 'max':None}
+
+    def _rowsFromIDs(self, id_list: List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None, exclude_rows:Optional[List[str]]=None) -> List[Tuple]:
+        _id_col   = self._columnIndex("user_id" if id_mode == IDMode.USER else "session_id")
+        _name_col = self._columnIndex("event_name")
+        _ver_col  = self._columnIndex("app_version")
+        _ids      = set(id_list)
+        _excluded = set(exclude_rows or [])
+        _versions = set(str(version) for version in versions) if versions else None
+        return [row for row in self._rows()
+                if row[_id_col] in _ids and row[_name_col] not in _excluded and (_versions is None or row[_ver_col] in _versions)]
+
+    def _IDsFromDates(self, min:datetime, max:datetime, versions:Optional[List[int]]=None) -> List[str]:
+        _sess_col = self._columnIndex("session_id")
+        _time_col = self._columnIndex("server_time")
+        _ver_col  = self._columnIndex("app_version")
+        _versions = set(str(version) for version in versions) if versions else None
+        ret_val : Dict[str, None] = {}
+        for row in self._rows():
+            _time = StreamingFileInterface._parseTime(row[_time_col])
+            if _time is not None and min <= _time <= max and (_versions is None or row[_ver_col] in _versions):
+                ret_val[row[_sess_col]] = None
+        return list(ret_val.keys())
+
+    def _datesFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None) -> Dict[str, datetime]:
+        _id_col   = self._columnIndex("user_id" if id_mode == IDMode.USER else "session_id")
+        _time_col = self._columnIndex("timestamp")
+        _ids      = set(id_list)
+        _times = [_time for _time in (StreamingFileInterface._parseTime(row[_time_col]) for row in self._rows() if row[_id_col] in _ids) if _time is not None]
+        return {'min':min(_times), 'max':max(_times)} if len(_times) > 0 else {'min':None, 'max':None}
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    def StreamSessions(self, exclude_rows:Optional[List[str]]=None) -> Iterator[List[Event]]:
+        """Read through the file once, yielding the events of each session as soon as its last row has been read.
+
+        :param exclude_rows: The names of any events to leave out, defaults to None
+        :type exclude_rows: Optional[List[str]], optional
+        :raises ValueError: If rows of a session come after rows of a different session, meaning the file is not sorted by session.
+        :yield: The events of each session, in the order the sessions appear in the file.
+        :rtype: Iterator[List[Event]]
+        """
+        if not self.IsOpen():
+            Logger.Log(f"Could not stream sessions from {self._filepath}, the source interface is not open!", logging.WARNING, depth=3)
+            return
+        _sess_col   = self._columnIndex("session_id")
+        _name_col   = self._columnIndex("event_name")
+        _excluded   = set(exclude_rows or [])
+        _fallbacks  = {"app_id":self._game_id}
+        _finished   : Set[str]    = set()
+        _curr_sess  : Optional[str] = None
+        _curr_evts  : List[Event] = []
+        for row in self._rows():
+            _sess_id = row[_sess_col]
+            if _sess_id != _curr_sess:
+                if _sess_id in _finished:
+                    raise ValueError(f"Rows of session {_sess_id} in {self._filepath} are not all together, so the file cannot be streamed. Sort the file by session, or export it without streaming.")
+                if _curr_sess is not None:
+                    _finished.add(_curr_sess)
+                    yield _curr_evts
+                _curr_sess, _curr_evts = _sess_id, []
+            if row[_name_col] in _excluded:
+                continue
+            try:
+                next_event = self._table_schema.RowToEvent(row=row, fallbacks=_fallbacks)
+                # in case event index was not given, fall back on the order of the rows in the file.
+                next_event.FallbackDefaults(index=len(_curr_evts) + 1)
+            except Exception as err:
+                if self._fail_fast:
+                    Logger.Log(f"Error while converting row to Event\nFull error: {err}\nRow data: {pformat(row)}", logging.ERROR, depth=2)
+                    raise err
+                else:
+                    Logger.Log(f"Error while converting row ({row}) to Event. This row will be skipped.\nFull error: {err}", logging.WARNING, depth=2)
+            else:
+                _curr_evts.append(next_event)
+        if _curr_sess is not None:
+            yield _curr_evts
+
+    def SessionStats(self, id_list:List[str]) -> List[Tuple[str, int, Optional[datetime]]]:
+        """Count the rows of each of the given sessions, and find the latest time of each, in a single pass over the file, see `SourceStats`.
+
+        :param id_list: The IDs of the sessions to check.
+        :type id_list: List[str]
+        :return: The ID, row count and latest time of each of the sessions with rows in the file.
+        :rtype: List[Tuple[str, int, Optional[datetime]]]
+        """
+        _sess_col = self._columnIndex("session_id")
+        _time_col = self._columnIndex("timestamp")
+        _ids      = set(id_list)
+        _counts   : Dict[str, int]      = {}
+        _latest   : Dict[str, datetime] = {}
+        for row in self._rows():
+            _sess_id = row[_sess_col]
+            if _sess_id in _ids:
+                _counts[_sess_id] = _counts.get(_sess_id, 0) + 1
+                _time = StreamingFileInterface._parseTime(row[_time_col])
+                if _time is not None and (_sess_id not in _latest or _time > _latest[_sess_id]):
+                    _latest[_sess_id] = _time
+        return [(sess_id, count, _latest.get(sess_id)) for sess_id, count in _counts.items()]
+
+    # *** PROPERTIES ***
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _parseTime(value:Any) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(str(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    # *** PRIVATE METHODS ***
+
+    def _columnIndex(self, name:str) -> int:
+        try:
+            return self._header.index(name)
+        except ValueError:
+            raise ValueError(f"File {self._filepath} does not have a {name} column, found columns {self._header}")
+
+    def _rows(self) -> Iterator[Tuple]:
+        """Read the rows of the file in order, with empty cells read as None, the same as missing values in the `CSVInterface`."""
+        with open(self._filepath, newline='', encoding='utf-8') as _file:
+            _reader = csv.reader(_file, delimiter=self._delimiter)
+            next(_reader, None)
+            for row in _reader:
+                yield tuple(cell if cell != "" else None for cell in row)
@@ -0,0 +1,7 @@
+__all__ = [
+    "outerfaces",
+    "StreamingFileInterface",
+]
+
+from . import outerfaces
+from . import StreamingFileInterface
@@ -0,0 +1,55 @@
+## import standard libraries
+import abc
+import logging
+from typing import Collection, List, Optional
+# import local files
+from ogd.common.interfaces.outerfaces.DataOuterface import DataOuterface
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow
+from ogd.core.processors.RowBatch import RowBatch
+
+class BatchOuterface(DataOuterface):
+    """Base class for outerfaces that can take output as a RowBatch of typed columns, rather than as rows of JSON strings.
+
+    Lines given to `WriteLines` still have to be handled, since not every caller has a batch,
+    but the export code hands batches to these outerfaces whenever it has one, see `WriteBatchTo`.
+    """
+
+    # *** ABSTRACTS ***
+
+    @abc.abstractmethod
+    def _writeBatch(self, batch:RowBatch, mode:ExportMode) -> None:
+        pass
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def WriteBatchTo(outerfaces:Collection[DataOuterface], batch:RowBatch, mode:ExportMode) -> None:
+        """Write a batch to each of the given outerfaces.
+        Outerfaces that take batches get the batch itself, the others get its rows of JSON strings, which are only formatted if needed, and only once.
+
+        :param outerfaces: The outerfaces to write to.
+        :type outerfaces: Collection[DataOuterface]
+        :param batch: The batch of output.
+        :type batch: RowBatch
+        :param mode: The export mode the batch is output for.
+        :type mode: ExportMode
+        """
+        _lines : Optional[List[ExportRow]] = None
+        for outerface in outerfaces:
+            if isinstance(outerface, BatchOuterface):
+                outerface.WriteBatch(batch=batch, mode=mode)
+            else:
+                if _lines is None:
+                    _lines = batch.AsStrings()
+                outerface.WriteLines(lines=_lines, mode=mode)
+
+    # *** PUBLIC METHODS ***
+
+    def WriteBatch(self, batch:RowBatch, mode:ExportMode) -> None:
+        if mode in self.ExportModes:
+            self._writeBatch(batch=batch, mode=mode)
+            Logger.Log(f"Wrote {len(batch)} {self._game_id} {mode.name} lines", depth=3)
+        else:
+            Logger.Log(f"Skipping WriteBatch in {type(self).__name__}, export mode {mode} is not enabled for this outerface", depth=3)
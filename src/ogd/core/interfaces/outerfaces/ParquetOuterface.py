@@ -0,0 +1,383 @@
+## import standard libraries
+import json
+import logging
+from datetime import datetime
+from git.repo import Repo
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+# import 3rd-party libraries
+# pyarrow is slow to import, so it is only imported when a ParquetOuterface is created, see _importArrow.
+pyarrow : Any = None
+
+# import local files
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.configs.IndexingSchema import FileIndexingSchema
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow
+from ogd.core.interfaces.outerfaces.BatchOuterface import BatchOuterface
+from ogd.core.processors.RowBatch import ColumnType, RowBatch
+
+class ParquetOuterface(BatchOuterface):
+    """Outerface to write each export mode to a Parquet file of typed columns, rather than a TSV of JSON-encoded cells.
+
+    The header of each mode (e.g. the feature names from `FeatureManager.GetSessionFeatureNames`) gives the column names,
+    with any repeated names numbered,
+    and the type of each column comes from the types of its values in the RowBatches written in that mode:
+    columns of only booleans are written as booleans, of only ints as 64-bit ints, of only floats (or floats and ints) as floats,
+    and all other columns are written as strings, with any non-string values kept as JSON text.
+    Values are never lost to a column's type: ints too large for the column are written as strings,
+    and if a later batch has values that do not fit a column's type, the column is widened and the file rewritten, see `_rewrite`.
+    Each batch is written as its own row group, so only one slice's-worth of lines is held in memory at a time.
+
+    Requires the `pyarrow` package.
+    """
+
+    # Compression codecs supported for the output files.
+    CODECS = ["snappy", "gzip", "brotli", "zstd", "lz4", "none"]
+
+    _INT64_MIN        = -2**63
+    _INT64_MAX        = 2**63 - 1
+    # largest magnitude up to which every int is exactly representable as a float.
+    _FLOAT_EXACT_MAX  = 2**53
+    # encodes values for string columns the same way the TSV outerface does, with nested datetimes as ISO strings.
+    _ENCODER          = json.JSONEncoder(default=lambda value : value.isoformat() if isinstance(value, datetime) else str(value))
+
+    _FILE_SUFFIXES : Dict[ExportMode, str] = {
+        ExportMode.EVENTS     : "events",
+        ExportMode.DETECTORS  : "all-events",
+        ExportMode.SESSION    : "session-features",
+        ExportMode.PLAYER     : "player-features",
+        ExportMode.POPULATION : "population-features",
+    }
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, game_id:str, config:GameSourceSchema, export_modes:Set[ExportMode], date_range:Dict[str,Optional[datetime]],
+                 file_indexing:FileIndexingSchema, codec:str="snappy", dataset_id:Optional[str]=None):
+        if not ParquetOuterface._importArrow():
+            raise ImportError("The Parquet export format requires the pyarrow package, which is not installed.")
+        if codec not in ParquetOuterface.CODECS:
+            raise ValueError(f"Unrecognized Parquet codec {codec}, expected one of {ParquetOuterface.CODECS}")
+        super().__init__(game_id=game_id, config=config, export_modes=export_modes)
+        self._codec         : str  = codec
+        self._game_data_dir : Path = Path(f"./{file_indexing.LocalDirectory}") / self._game_id
+        self._headers       : Dict[ExportMode, List[str]] = {}
+        self._writers       : Dict[ExportMode, Any]       = {}
+        # path each open writer writes to, if it is not the mode's file path, see _rewrite.
+        self._write_paths   : Dict[ExportMode, Path]      = {}
+        # figure out dataset ID and file names, in the same format as the TSV outerface.
+        start = date_range['min'].strftime("%Y%m%d") if date_range['min'] is not None else "UNKNOWN"
+        end   = date_range['max'].strftime("%Y%m%d") if date_range['max'] is not None else "UNKNOWN"
+        _dataset_id = dataset_id or f"{self._game_id}_{start}_to_{end}"
+        base_file_name = f"{_dataset_id}_{ParquetOuterface._shortHash()}"
+        self._file_paths : Dict[ExportMode, Path] = {
+            mode : self._game_data_dir / f"{base_file_name}_{suffix}.parquet"
+            for mode, suffix in ParquetOuterface._FILE_SUFFIXES.items() if mode in export_modes
+        }
+
+    # *** IMPLEMENT ABSTRACTS ***
+
+    def _open(self) -> bool:
+        self._game_data_dir.mkdir(exist_ok=True, parents=True)
+        return True
+
+    def _close(self) -> bool:
+        Logger.Log(f"Closing Parquet outerface...")
+        for mode in self._file_paths.keys():
+            # a mode with a header but no lines still gets a file, with an empty table of string columns.
+            if mode not in self._writers and mode in self._headers:
+                _schema = pyarrow.schema([pyarrow.field(name, pyarrow.string()) for name in self._headers[mode]])
+                self._writers[mode] = self._openWriter(mode=mode, schema=_schema)
+        for writer in self._writers.values():
+            writer.close()
+        # files that were rewritten with wider columns are still at their temporary paths.
+        for mode, path in self._write_paths.items():
+            if path != self._file_paths[mode]:
+                path.replace(self._file_paths[mode])
+        # the files are complete, so forget the headers as well as the writers, in case the outerface is closed again.
+        self._writers     = {}
+        self._write_paths = {}
+        self._headers     = {}
+        return True
+
+    def _destination(self, mode:ExportMode) -> str:
+        _path = self._file_paths.get(mode)
+        return str(_path) if _path is not None else ""
+
+    def _removeExportMode(self, mode:ExportMode):
+        _writer = self._writers.pop(mode, None)
+        if _writer is not None:
+            _writer.close()
+        _write_path = self._write_paths.pop(mode, None)
+        if _write_path is not None and _write_path != self._file_paths.get(mode):
+            _write_path.unlink(missing_ok=True)
+        self._file_paths.pop(mode, None)
+        self._headers.pop(mode, None)
+
+    def _writeRawEventsHeader(self, header:List[str]) -> None:
+        self._headers[ExportMode.EVENTS] = ParquetOuterface._uniqueNames(header)
+
+    def _writeProcessedEventsHeader(self, header:List[str]) -> None:
+        self._headers[ExportMode.DETECTORS] = ParquetOuterface._uniqueNames(header)
+
+    def _writeSessionHeader(self, header:List[str]) -> None:
+        self._headers[ExportMode.SESSION] = ParquetOuterface._uniqueNames(header)
+
+    def _writePlayerHeader(self, header:List[str]) -> None:
+        self._headers[ExportMode.PLAYER] = ParquetOuterface._uniqueNames(header)
+
+    def _writePopulationHeader(self, header:List[str]) -> None:
+        self._headers[ExportMode.POPULATION] = ParquetOuterface._uniqueNames(header)
+
+    def _writeRawEventLines(self, events:List[ExportRow]) -> None:
+        self._writeLines(lines=events, mode=ExportMode.EVENTS)
+
+    def _writeProcessedEventLines(self, events:List[ExportRow]) -> None:
+        self._writeLines(lines=events, mode=ExportMode.DETECTORS)
+
+    def _writeSessionLines(self, sessions:List[ExportRow]) -> None:
+        self._writeLines(lines=sessions, mode=ExportMode.SESSION)
+
+    def _writePlayerLines(self, players:List[ExportRow]) -> None:
+        self._writeLines(lines=players, mode=ExportMode.PLAYER)
+
+    def _writePopulationLines(self, populations:List[ExportRow]) -> None:
+        self._writeLines(lines=populations, mode=ExportMode.POPULATION)
+
+    def _writeBatch(self, batch:RowBatch, mode:ExportMode) -> None:
+        self._writeRowGroup(batch=batch, mode=mode)
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    # *** PROPERTIES ***
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _importArrow() -> bool:
+        global pyarrow
+        if pyarrow is None:
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                pyarrow = None
+        return pyarrow is not None
+
+    @staticmethod
+    def _shortHash() -> str:
+        ret_val = ""
+        try:
+            repo = Repo(search_parent_directories=True)
+            if repo.git is not None:
+                ret_val = str(repo.git.rev_parse(repo.head.object.hexsha, short=7))
+        except InvalidGitRepositoryError as err:
+            Logger.Log(f"Code is not in a valid Git repository:\n{str(err)}", logging.ERROR)
+        except NoSuchPathError as err:
+            Logger.Log(f"Unable to access proper file paths for Git repository:\n{str(err)}", logging.ERROR)
+        return ret_val
+
+    @staticmethod
+    def _uniqueNames(header:List[str]) -> List[str]:
+        """Rename repeated column names, in the same way pandas does when reading a TSV (e.g. `SessionID`, `SessionID.1`),
+        since columns must have unique names to be read from a Parquet file.
+        """
+        ret_val : List[str] = []
+        _seen   : Set[str]  = set()
+        for name in header:
+            _name, i = name, 0
+            while _name in _seen:
+                i += 1
+                _name = f"{name}.{i}"
+            _seen.add(_name)
+            ret_val.append(_name)
+        return ret_val
+
+    @staticmethod
+    def _decode(cell:Any) -> Any:
+        if not isinstance(cell, str):
+            return cell
+        try:
+            return json.loads(cell)
+        except ValueError:
+            return cell
+
+    @staticmethod
+    def _arrowType(values:Sequence[Any], col_type:ColumnType) -> Any:
+        """Get the type to write a column as, from its values and their type in a RowBatch.
+
+        :param values: The values of the column.
+        :type values: Sequence[Any]
+        :param col_type: The type of the column, as given by the RowBatch.
+        :type col_type: ColumnType
+        :return: The type of the column in the file.
+        :rtype: pyarrow.DataType
+        """
+        match col_type:
+            case ColumnType.NULL:
+                return pyarrow.null()
+            case ColumnType.BOOL:
+                return pyarrow.bool_()
+            case ColumnType.INT:
+                return pyarrow.int64() if ParquetOuterface._fits(values=values, arrow_type=pyarrow.int64()) else pyarrow.string()
+            case ColumnType.FLOAT:
+                return pyarrow.float64()
+            case ColumnType.JSON:
+                # a mix of ints and floats is written as floats, as long as no int is too large to be a float.
+                return pyarrow.float64() if ParquetOuterface._fits(values=values, arrow_type=pyarrow.float64()) else pyarrow.string()
+            case _:
+                return pyarrow.string()
+
+    @staticmethod
+    def _fits(values:Sequence[Any], arrow_type:Any) -> bool:
+        """Check if every value of a column can be written as the given type, without losing anything.
+
+        :param values: The values of the column.
+        :type values: Sequence[Any]
+        :param arrow_type: The type of the column in the file.
+        :type arrow_type: pyarrow.DataType
+        :return: True if every value can be written exactly as the given type, otherwise False.
+        :rtype: bool
+        """
+        if arrow_type == pyarrow.string():
+            return True
+        elif arrow_type == pyarrow.null():
+            return all(value is None for value in values)
+        elif arrow_type == pyarrow.bool_():
+            return all(value is None or type(value) is bool for value in values)
+        elif arrow_type == pyarrow.int64():
+            return all(value is None or (type(value) is int and ParquetOuterface._INT64_MIN <= value <= ParquetOuterface._INT64_MAX) for value in values)
+        elif arrow_type == pyarrow.float64():
+            return all(value is None or type(value) is float or (type(value) is int and abs(value) <= ParquetOuterface._FLOAT_EXACT_MAX) for value in values)
+        else:
+            return False
+
+    @staticmethod
+    def _widen(arrow_type:Any, values:Sequence[Any], col_type:ColumnType) -> Any:
+        """Get a type that can hold both the values already written as the given type, and a new column of values.
+
+        :param arrow_type: The type the column was written as so far.
+        :type arrow_type: pyarrow.DataType
+        :param values: The new values of the column.
+        :type values: Sequence[Any]
+        :param col_type: The type of the new values, as given by the RowBatch.
+        :type col_type: ColumnType
+        :return: The type to write the column as from now on.
+        :rtype: pyarrow.DataType
+        """
+        _new_type = ParquetOuterface._arrowType(values=values, col_type=col_type)
+        if arrow_type == pyarrow.null():
+            return _new_type
+        elif {arrow_type, _new_type} == {pyarrow.int64(), pyarrow.float64()} and ParquetOuterface._fits(values=values, arrow_type=pyarrow.float64()):
+            return pyarrow.float64()
+        else:
+            return pyarrow.string()
+
+    @staticmethod
+    def _toArray(values:Sequence[Any], arrow_type:Any) -> Any:
+        """Convert a column to an array of the given type, which the values must fit, see `_fits`.
+        In string columns, strings are written as they are, datetimes as ISO strings, and anything else as JSON text.
+
+        :param values: The values of the column.
+        :type values: Sequence[Any]
+        :param arrow_type: The type of the column in the file.
+        :type arrow_type: pyarrow.DataType
+        :return: The column, as an array.
+        :rtype: pyarrow.Array
+        """
+        _out : Sequence[Any]
+        if arrow_type == pyarrow.string():
+            _out = [value if (value is None or type(value) is str)
+                    else value.isoformat() if isinstance(value, datetime)
+                    else ParquetOuterface._ENCODER.encode(value)
+                    for value in values]
+        elif arrow_type == pyarrow.float64():
+            _out = [None if value is None else float(value) for value in values]
+        else:
+            _out = values
+        return pyarrow.array(_out, type=arrow_type)
+
+    # *** PRIVATE METHODS ***
+
+    def _openWriter(self, mode:ExportMode, schema:Any, path:Optional[Path]=None) -> Any:
+        return pyarrow.parquet.ParquetWriter(path or self._file_paths[mode], schema=schema,
+                                             compression=None if self._codec == "none" else self._codec)
+
+    def _writeLines(self, lines:List[ExportRow], mode:ExportMode) -> None:
+        # lines from callers without a batch are rows of JSON text, so they are decoded back to values first.
+        self._writeRowGroup(batch=RowBatch.FromRows([[ParquetOuterface._decode(cell) for cell in line] for line in lines]), mode=mode)
+
+    def _writeRowGroup(self, batch:RowBatch, mode:ExportMode) -> None:
+        if len(batch) == 0:
+            return
+        if mode not in self._file_paths:
+            Logger.Log(f"No Parquet file available for {mode.name} lines, skipping.", logging.WARN)
+            return
+        _columns   = list(batch.Columns)
+        _col_types = list(batch.ColumnTypes)
+        _names     = self._headers.get(mode) or [f"column_{i}" for i in range(len(_columns))]
+        _width     = len(_names)
+        if len(_columns) != _width:
+            Logger.Log(f"The {mode.name} lines did not have {_width} columns, they will be padded or truncated to match the header.", logging.WARN)
+            _columns   = (_columns   + [[None] * len(batch)] * _width)[:_width]
+            _col_types = (_col_types + [ColumnType.NULL] * _width)[:_width]
+
+        _writer = self._writers.get(mode)
+        if _writer is None:
+            _schema = pyarrow.schema([pyarrow.field(name, ParquetOuterface._arrowType(values=values, col_type=col_type))
+                                      for name, values, col_type in zip(_names, _columns, _col_types)])
+            _writer = self._writers[mode] = self._openWriter(mode=mode, schema=_schema)
+        else:
+            _types = [field.type for field in _writer.schema]
+            _widened = {
+                i : ParquetOuterface._widen(arrow_type=_types[i], values=values, col_type=col_type)
+                for i, (values, col_type) in enumerate(zip(_columns, _col_types))
+                if not ParquetOuterface._fits(values=values, arrow_type=_types[i])
+            }
+            if len(_widened) > 0:
+                _writer = self._rewrite(mode=mode, widened=_widened)
+        _arrays = [ParquetOuterface._toArray(values=values, arrow_type=field.type) for field, values in zip(_writer.schema, _columns)]
+        _writer.write_table(pyarrow.Table.from_arrays(_arrays, schema=_writer.schema), row_group_size=len(batch))
+
+    def _rewrite(self, mode:ExportMode, widened:Dict[int, Any]) -> Any:
+        """Change the types of some columns of a mode's file, after a row group came in with values that do not fit the columns' types so far.
+        The row groups already written are copied to a new file with the new types, which replaces the old file and takes any further row groups.
+        Each column can only be widened a couple of times (e.g. from null to int, then to float or string), so this is rare.
+
+        :param mode: The export mode whose file is rewritten.
+        :type mode: ExportMode
+        :param widened: The new type of each column that changes, by column index.
+        :type widened: Dict[int, pyarrow.DataType]
+        :return: The writer for the new file, which is open for more row groups to be added.
+        :rtype: pyarrow.parquet.ParquetWriter
+        """
+        # a Parquet file cannot be reopened to add more row groups, so the new file goes to a temporary path, and is moved into place once it is closed.
+        _old_path = self._write_paths.get(mode, self._file_paths[mode])
+        _new_path = self._file_paths[mode] if _old_path != self._file_paths[mode] else _old_path.with_name(f"{_old_path.name}.tmp")
+        self._writers.pop(mode).close()
+        _old_file = pyarrow.parquet.ParquetFile(_old_path)
+        # the old values of a widened column might not fit the new type (e.g. large ints, widened to float), in which case the column becomes strings.
+        for i in range(_old_file.num_row_groups):
+            _group = _old_file.read_row_group(i, columns=[_old_file.schema_arrow.names[col] for col in widened.keys()])
+            for j, col in enumerate(widened.keys()):
+                if not ParquetOuterface._fits(values=_group.column(j).to_pylist(), arrow_type=widened[col]):
+                    widened[col] = pyarrow.string()
+        _schema = _old_file.schema_arrow
+        for col, arrow_type in widened.items():
+            _schema = _schema.set(col, _schema.field(col).with_type(arrow_type))
+        Logger.Log(f"Some {mode.name} columns had values that did not fit their types so far, rewriting with columns {[_schema.field(col).name for col in widened.keys()]} as {[str(arrow_type) for arrow_type in widened.values()]}.", logging.INFO)
+        _writer = self._writers[mode] = self._openWriter(mode=mode, schema=_schema, path=_new_path)
+        self._write_paths[mode] = _new_path
+        for i in range(_old_file.num_row_groups):
+            _group  = _old_file.read_row_group(i)
+            _arrays = [ParquetOuterface._toArray(values=_group.column(col).to_pylist(), arrow_type=field.type) if col in widened else _group.column(col)
+                       for col, field in enumerate(_schema)]
+            _writer.write_table(pyarrow.Table.from_arrays(_arrays, schema=_schema), row_group_size=_group.num_rows)
+        _old_file.close()
+        _old_path.unlink()
+        return _writer
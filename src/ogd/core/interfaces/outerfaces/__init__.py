@@ -0,0 +1,7 @@
+__all__ = [
+    "BatchOuterface",
+    "ParquetOuterface",
+]
+
+from . import BatchOuterface
+from . import ParquetOuterface
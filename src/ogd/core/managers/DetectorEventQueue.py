@@ -0,0 +1,103 @@
+## import standard libraries
+import logging
+from collections import Counter
+from typing import Counter as CounterType, Dict, Iterator, List, Optional
+## import local files
+from ogd.core.generators.detectors.DetectorEvent import DetectorEvent
+from ogd.common.models.Event import Event
+from ogd.common.utils.Logger import Logger
+
+class DetectorEventQueue:
+    """Buffer for events triggered by detectors, so they are processed after the event that triggered them, rather than in the middle of its dispatch.
+
+    Triggered events are grouped by session, and handed out in generations:
+    the first generation is everything triggered while processing an ordinary event,
+    the second is everything triggered while processing the first generation, and so on.
+    Within a generation, each session's events form one batch, in the order they were triggered.
+    Since a detector may trigger on events triggered by another (or itself), generations beyond `max_generations` are dropped,
+    so a feedback loop between detectors cannot run forever.
+
+    Counts of events emitted and dropped are kept per detector, for the whole export.
+    """
+
+    DEFAULT_MAX_GENERATIONS : int = 8
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, max_generations:int=DEFAULT_MAX_GENERATIONS):
+        self._max_generations : int                              = max_generations
+        self._pending         : Dict[Optional[str], List[Event]] = {}
+        # the generation of the events currently being processed, where 0 means ordinary (not triggered) events.
+        self._generation      : int                              = 0
+        self._emitted         : CounterType[str]                 = Counter()
+        self._dropped         : CounterType[str]                 = Counter()
+
+    def __str__(self) -> str:
+        return f"DetectorEventQueue({sum(len(events) for events in self._pending.values())} pending, {sum(self._emitted.values())} emitted, {sum(self._dropped.values())} dropped)"
+
+    @property
+    def Pending(self) -> bool:
+        return len(self._pending) > 0
+
+    @property
+    def Emitted(self) -> Dict[str, int]:
+        """Number of events emitted by each detector, including any that were dropped."""
+        return dict(self._emitted)
+
+    @property
+    def Dropped(self) -> Dict[str, int]:
+        """Number of events from each detector that were dropped, for being too many generations away from an ordinary event."""
+        return dict(self._dropped)
+
+    # *** PUBLIC METHODS ***
+
+    def Push(self, event:Event) -> None:
+        """Add a triggered event to the queue, to be processed once the current event (and the rest of its generation) is done.
+
+        :param event: The event triggered by a detector.
+        :type event: Event
+        """
+        _source = (event.Source if isinstance(event, DetectorEvent) else None) or event.EventName
+        self._emitted[_source] += 1
+        if self._generation >= self._max_generations:
+            if self._dropped[_source] == 0:
+                Logger.Log(f"Dropping {event.EventName} event from {_source}, which was triggered by a chain of {self._generation} detector events in session {event.SessionID}. "
+                           f"This may be a feedback loop between detectors.", logging.WARNING, depth=2)
+            self._dropped[_source] += 1
+        else:
+            self._pending.setdefault(event.SessionID, []).append(event)
+
+    def Batches(self) -> Iterator[List[Event]]:
+        """Hand out the queued events, one batch per session per generation, until no more events are triggered.
+
+        Each batch should be fully processed before the next one is requested,
+        since events triggered while processing a batch are queued as the next generation.
+
+        :return: An iterator over the batches of triggered events.
+        :rtype: Iterator[List[Event]]
+        """
+        try:
+            while len(self._pending) > 0:
+                _generation, self._pending = self._pending, {}
+                self._generation += 1
+                for events in _generation.values():
+                    yield events
+        finally:
+            self._pending    = {}
+            self._generation = 0
+
+    def Merge(self, emitted:Dict[str, int], dropped:Dict[str, int]) -> None:
+        """Add counts from another queue (e.g. from a worker process) to the counts of this queue.
+
+        :param emitted: Number of events emitted by each detector.
+        :type emitted: Dict[str, int]
+        :param dropped: Number of events dropped from each detector.
+        :type dropped: Dict[str, int]
+        """
+        self._emitted.update(emitted)
+        self._dropped.update(dropped)
+
+    def LogCounts(self) -> None:
+        for source, count in self._emitted.most_common():
+            _dropped = f", {self._dropped[source]} dropped" if self._dropped[source] > 0 else ""
+            Logger.Log(f"Detector {source} emitted {count} events{_dropped}.", logging.INFO, depth=2)
@@ -0,0 +1,263 @@
+## import standard libraries
+import hashlib
+import logging
+import marshal
+import mmap
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+## import local files
+from ogd.common.interfaces.EventInterface import EventInterface
+from ogd.core.interfaces.SourceStats import SessionStats
+from ogd.common.models.Event import Event, EventSource
+from ogd.common.utils.Logger import Logger
+
+class EventCache:
+    """Local, on-disk cache of the events of each session, so repeated exports of the same range do not need to retrieve them again.
+
+    Entries are keyed by game, source, and session ID, where the source identifies the interface the events came from
+    (including the path and modification time of file sources), along with any event types left out of the retrieval.
+    Each entry also records a stamp of the session's state at the source, taken just before its events were retrieved:
+    the session's event count and the latest time of its events, see `SourceStats`.
+    An entry is only read back if the session's current stamp matches, so sessions that gained events since they were cached are retrieved again.
+    Each session's events are stored in their own file, named by a hash of the key,
+    in a compact binary form: a marshalled tuple of columns, one per Event attribute.
+    Files are memory-mapped when read, and turned back into Event objects.
+
+    An index of the entries, with their sizes and when each was last used, is kept in a SQLite database in the cache directory.
+    When the total size of the entries goes over the configured maximum, the least-recently used entries are evicted.
+    """
+
+    _MAGIC : bytes = b"OGDEVT1\n"
+    # version of the index layout; indexes from before entries were stamped with event counts are cleared when opened.
+    _INDEX_VERSION : int = 3
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, cache_dir:Path, game_id:str, source:str, max_bytes:int, refresh:bool=False):
+        """Constructor for an EventCache.
+
+        :param cache_dir: The directory in which to keep the cache.
+        :type cache_dir: Path
+        :param game_id: The game whose events are cached.
+        :type game_id: str
+        :param source: An identifier for where the events are retrieved from, see `SourceKey`.
+        :type source: str
+        :param max_bytes: The maximum total size of the cached files, in bytes.
+        :type max_bytes: int
+        :param refresh: Whether to ignore existing entries, so that all events are retrieved again and re-cached. Defaults to False
+        :type refresh: bool, optional
+        """
+        self._dir       : Path = Path(cache_dir) / "events"
+        self._game_id   : str  = game_id
+        self._source    : str  = source
+        self._max_bytes : int  = max_bytes
+        self._refresh   : bool = refresh
+        self._db        : Optional[sqlite3.Connection] = None
+        # slices may be retrieved by a prefetch thread, so access to the index is locked.
+        self._lock      : threading.Lock = threading.Lock()
+        self._hits      : int  = 0
+        self._misses    : int  = 0
+        self._stored    : int  = 0
+        self._evicted   : int  = 0
+
+    def __str__(self) -> str:
+        return f"EventCache({self._game_id}, {self._source}, {self._dir})"
+
+    @property
+    def Stats(self) -> Dict[str, int]:
+        """Counts of sessions read from the cache (hits), sessions that had to be retrieved (misses), sessions written to the cache, and entries evicted."""
+        return {"hits" : self._hits, "misses" : self._misses, "stored" : self._stored, "evicted" : self._evicted}
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def SourceKey(interface:EventInterface, exclude_rows:Optional[List[str]]) -> str:
+        """Work out the source part of the cache keys, for events retrieved from the given interface.
+
+        :param interface: The interface events are retrieved from.
+        :type interface: EventInterface
+        :param exclude_rows: The names of any events left out when retrieving, which are then also missing from the cached events.
+        :type exclude_rows: Optional[List[str]]
+        :return: A string identifying the source of the events.
+        :rtype: str
+        """
+        _config = interface._config
+        ret_val = f"{type(interface).__name__}:{_config.Name}:{_config.DatabaseName}.{_config.TableName}"
+        # file interfaces all share a config, so the file itself identifies the source, and a changed file gets new entries.
+        _filepath = getattr(interface, "_filepath", None)
+        if _filepath is not None:
+            _path = Path(_filepath).resolve()
+            try:
+                _stat = _path.stat()
+                ret_val += f":{_path}@{_stat.st_mtime_ns}.{_stat.st_size}"
+            except OSError:
+                ret_val += f":{_path}"
+        if exclude_rows:
+            ret_val += f":-{','.join(sorted(exclude_rows))}"
+        return ret_val
+
+    # *** PUBLIC METHODS ***
+
+    def Open(self) -> None:
+        """Open the cache index, creating it if needed."""
+        self._dir.mkdir(exist_ok=True, parents=True)
+        self._db = sqlite3.connect(self._dir / "index.sqlite", check_same_thread=False)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < EventCache._INDEX_VERSION:
+            _old = self._db.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'entries'").fetchone() is not None
+            for (key,) in self._db.execute("SELECT key FROM entries").fetchall() if _old else []:
+                self._path(key).unlink(missing_ok=True)
+            self._db.execute("DROP TABLE IF EXISTS entries")
+            self._db.execute(f"PRAGMA user_version = {EventCache._INDEX_VERSION}")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS entries (
+                                key TEXT PRIMARY KEY, game TEXT, source TEXT, session_id TEXT,
+                                stamp TEXT, size INTEGER, last_used REAL)""")
+        self._db.commit()
+
+    def Close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+        Logger.Log(f"Event cache {self._dir}: {self._hits} sessions read, {self._misses} retrieved, {self._stored} stored, {self._evicted} evicted.", logging.INFO, depth=2)
+
+    def Get(self, session_ids:Iterable[str], session_stats:Mapping[str, SessionStats]) -> Dict[str, List[Event]]:
+        """Read the cached events of the given sessions.
+        Sessions without an entry, whose entry is stale, or whose entry could not be read, are left out of the result.
+
+        :param session_ids: The IDs of the sessions to read.
+        :type session_ids: Iterable[str]
+        :param session_stats: The current state of each session at the source, from a single `SourceStats` query for all of the sessions.
+            Entries are only read if the session's state matches the stamp of the entry.
+        :type session_stats: Mapping[str, SessionStats]
+        :return: A mapping from the ID of each cached session to its events.
+        :rtype: Dict[str, List[Event]]
+        """
+        ret_val : Dict[str, List[Event]] = {}
+        _session_ids = list(session_ids)
+        with self._lock:
+            if self._db is not None and not self._refresh:
+                _now = time.time()
+                for sess_id in _session_ids:
+                    _key   = self._key(sess_id)
+                    _entry = self._db.execute("SELECT stamp FROM entries WHERE key = ?", (_key,)).fetchone()
+                    if _entry is None:
+                        continue
+                    _stamp = EventCache._stamp(session_stats.get(sess_id))
+                    if _stamp is None or _entry[0] != _stamp:
+                        Logger.Log(f"Cached events of session {sess_id} are out of date, they will be retrieved again.", logging.DEBUG, depth=3)
+                        continue
+                    try:
+                        ret_val[sess_id] = EventCache._readFile(self._path(_key))
+                    except (OSError, ValueError, EOFError, TypeError) as err:
+                        Logger.Log(f"Could not read cached events of session {sess_id}, they will be retrieved again:\n{err}", logging.WARN, depth=3)
+                        self._db.execute("DELETE FROM entries WHERE key = ?", (_key,))
+                    else:
+                        self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (_now, _key))
+                self._db.commit()
+            self._hits   += len(ret_val)
+            self._misses += len(_session_ids) - len(ret_val)
+        return ret_val
+
+    def Put(self, session_events:Dict[str, List[Event]], session_stats:Mapping[str, SessionStats]) -> None:
+        """Add or replace the cached events of the given sessions, then evict old entries if the cache is over its size limit.
+
+        :param session_events: A mapping from session IDs to the events of each session.
+        :type session_events: Dict[str, List[Event]]
+        :param session_stats: The state of each session at the source, see `SourceStats`, taken before its events were retrieved.
+            Sessions without stats are not cached, since they could not be checked when read.
+        :type session_stats: Mapping[str, SessionStats]
+        """
+        with self._lock:
+            if self._db is None:
+                return
+            _now = time.time()
+            for sess_id, events in session_events.items():
+                _stamp = EventCache._stamp(session_stats.get(sess_id))
+                if _stamp is None:
+                    continue
+                _key = self._key(sess_id)
+                try:
+                    _data = EventCache._MAGIC + marshal.dumps(EventCache._toColumns(events))
+                except (ValueError, TypeError, AttributeError) as err:
+                    Logger.Log(f"Events of session {sess_id} could not be cached:\n{err}", logging.DEBUG, depth=3)
+                    continue
+                _path = self._path(_key)
+                _path.parent.mkdir(exist_ok=True)
+                _path.write_bytes(_data)
+                self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 (_key, self._game_id, self._source, sess_id, _stamp, len(_data), _now))
+                self._stored += 1
+            self._evict()
+            self._db.commit()
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _stamp(stats:Optional[SessionStats]) -> Optional[str]:
+        return f"{stats[0]}@{stats[1]}" if stats is not None else None
+
+    @staticmethod
+    def _toColumns(events:List[Event]) -> Tuple[List[Any], ...]:
+        _timestamps : List[str]             = []
+        _offsets    : List[Optional[float]] = []
+        for event in events:
+            if not isinstance(event.Timestamp, datetime):
+                raise TypeError(f"Timestamp had unexpected type {type(event.Timestamp)}")
+            _timestamps.append(event.Timestamp.isoformat())
+            _offset = event.TimeOffset
+            if _offset is not None and not isinstance(_offset, timezone):
+                raise TypeError(f"Time offset had unexpected type {type(_offset)}")
+            _offsets.append(_offset.utcoffset(None).total_seconds() if _offset is not None else None)
+        return ([event.session_id for event in events],   [event.app_id for event in events],
+                _timestamps,                               [event.event_name for event in events],
+                [event.event_data for event in events],   [int(event.event_source) for event in events],
+                [event.app_version for event in events],  [event.app_branch for event in events],
+                [event.log_version for event in events],  _offsets,
+                [event.user_id for event in events],      [event.user_data for event in events],
+                [event.game_state for event in events],   [event.event_sequence_index for event in events])
+
+    @staticmethod
+    def _readFile(path:Path) -> List[Event]:
+        with open(path, "rb") as _file:
+            with mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ) as _map:
+                if _map[:len(EventCache._MAGIC)] != EventCache._MAGIC:
+                    raise ValueError(f"{path} is not an event cache file")
+                with memoryview(_map) as _view:
+                    _columns = marshal.loads(_view[len(EventCache._MAGIC):])
+        (_sess_ids, _app_ids, _timestamps, _names, _data, _sources, _app_versions, _app_branches,
+         _log_versions, _offsets, _user_ids, _user_data, _game_states, _indices) = _columns
+        _tzs : Dict[float, timezone] = {}
+        return [Event(session_id=_sess_ids[i], app_id=_app_ids[i], timestamp=datetime.fromisoformat(_timestamps[i]),
+                      event_name=_names[i], event_data=_data[i], event_source=EventSource(_sources[i]),
+                      app_version=_app_versions[i], app_branch=_app_branches[i], log_version=_log_versions[i],
+                      time_offset=None if _offsets[i] is None else _tzs.setdefault(_offsets[i], timezone(timedelta(seconds=_offsets[i]))),
+                      user_id=_user_ids[i], user_data=_user_data[i], game_state=_game_states[i], event_sequence_index=_indices[i])
+                for i in range(len(_sess_ids))]
+
+    # *** PRIVATE METHODS ***
+
+    def _key(self, session_id:str) -> str:
+        return hashlib.sha256(f"{self._game_id}\x00{self._source}\x00{session_id}".encode()).hexdigest()
+
+    def _path(self, key:str) -> Path:
+        return self._dir / key[:2] / f"{key}.evt"
+
+    def _evict(self) -> None:
+        """Remove the least-recently used entries, until the cached files fit in the maximum size. Expects the lock to be held."""
+        if self._db is None:
+            return
+        _total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if _total <= self._max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_used ASC").fetchall():
+            if _total <= self._max_bytes:
+                break
+            self._path(key).unlink(missing_ok=True)
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            _total -= size
+            self._evicted += 1
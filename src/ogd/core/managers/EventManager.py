@@ -6,8 +6,10 @@ from typing import Any, Callable, List, Type, Optional, Set
 ## import local files
 from ogd.core.registries.DetectorRegistry import DetectorRegistry
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
+from ogd.core.managers.EventStreamWriter import EventStreamWriter
 from ogd.core.processors.DetectorProcessor import DetectorProcessor
 from ogd.core.processors.EventProcessor import EventProcessor
+from ogd.core.processors.RowBatch import RowBatch
 from ogd.common.models.Event import Event, EventSource
 from ogd.common.schemas.games.GameSchema import GameSchema
 from ogd.common.utils import utils
@@ -18,14 +20,17 @@ from ogd.common.utils.typing import ExportRow
 #  Class to manage data for a csv events file.
 class EventManager:
     def __init__(self, game_schema: GameSchema, trigger_callback:Callable[[Event], None],
-                 LoaderClass:Optional[Type[GeneratorLoader]], feature_overrides:Optional[List[str]]=None):
+                 LoaderClass:Optional[Type[GeneratorLoader]], feature_overrides:Optional[List[str]]=None,
+                 writer:Optional[EventStreamWriter]=None):
         """Constructor for EventManager.
         Just creates empty list of lines and generates list of column names.
+        If a writer is given, events are streamed to it as they are processed, instead of being held until the slice is output.
         """
         # define instance vars
         self._columns     : List[str]      = Event.ColumnNames()
         self._raw_events  : EventProcessor = EventProcessor(game_schema=game_schema)
         self._all_events  : EventProcessor = EventProcessor(game_schema=game_schema)
+        self._writer      : Optional[EventStreamWriter] = writer
         self._detector_processor : Optional[DetectorProcessor] = None
         if LoaderClass is not None:
             self._detector_processor = DetectorProcessor(game_schema=game_schema,           LoaderClass=LoaderClass,
@@ -34,25 +39,52 @@ class EventManager:
     def ProcessEvent(self, event:Event, separator:str = "\t") -> None:
         # event.EventData = json.dumps(event.EventData)
         # TODO: double-check if the remote_addr is there to be dropped/ignored.
-        self._all_events.ProcessEvent(event=event)
-        if event.EventSource == EventSource.GAME:
-            self._raw_events.ProcessEvent(event=event)
+        if self._writer is not None:
+            self._writer.Write(event=event)
+        else:
+            self._all_events.ProcessEvent(event=event)
+            if event.EventSource == EventSource.GAME:
+                self._raw_events.ProcessEvent(event=event)
         if self._detector_processor is not None:
             self._detector_processor.ProcessEvent(event=event)
 
+    def FinishSession(self, session_id:Optional[str]) -> None:
+        """Let the EventManager know a session has no more events, so any per-session state (e.g. the session's detectors) can be freed.
+
+        :param session_id: The ID of the finished session.
+        :type session_id: Optional[str]
+        """
+        if self._detector_processor is not None:
+            self._detector_processor.FinishSession(session_id=session_id)
+
+    @property
+    def Streaming(self) -> bool:
+        return self._writer is not None
+
+    def Flush(self) -> None:
+        """Write out any events still waiting in the stream writer's current chunk. Does nothing if events are not being streamed."""
+        if self._writer is not None:
+            self._writer.Flush()
+
     def GetColumnNames(self) -> List[str]:
         return self._columns
 
     def GetRawLines(self, slice_num:int, slice_count:int) -> List[ExportRow]:
+        return self.GetRawBatch(slice_num=slice_num, slice_count=slice_count).AsStrings()
+
+    def GetRawBatch(self, slice_num:int, slice_count:int) -> RowBatch:
         start   : datetime = datetime.now()
-        ret_val : List[Any] = self._raw_events.Lines
+        ret_val : RowBatch = self._raw_events.Batch
         time_delta = datetime.now() - start
         Logger.Log(f"Time to retrieve raw Event lines for slice [{slice_num}/{slice_count}]: {time_delta} to get {len(ret_val)} lines", logging.INFO, depth=2)
         return ret_val
 
     def GetAllLines(self, slice_num:int, slice_count:int) -> List[ExportRow]:
+        return self.GetAllBatch(slice_num=slice_num, slice_count=slice_count).AsStrings()
+
+    def GetAllBatch(self, slice_num:int, slice_count:int) -> RowBatch:
         start   : datetime = datetime.now()
-        ret_val : List[Any] = self._all_events.Lines
+        ret_val : RowBatch = self._all_events.Batch
         time_delta = datetime.now() - start
         Logger.Log(f"Time to retrieve all Event lines for slice [{slice_num}/{slice_count}]: {time_delta} to get {len(ret_val)} lines", logging.INFO, depth=2)
         return ret_val
@@ -61,6 +93,6 @@ class EventManager:
     #  This is helpful if we're processing a lot of data and want to avoid
     #  Eating too much memory.
     def ClearLines(self):
-        Logger.Log(f"Clearing {len(self._raw_events.Lines)} raw event and {len(self._all_events.Lines)} processed event entries from EventManager.", logging.DEBUG, depth=2)
+        Logger.Log(f"Clearing {len(self._raw_events.Rows)} raw event and {len(self._all_events.Rows)} processed event entries from EventManager.", logging.DEBUG, depth=2)
         self._raw_events.ClearLines()
         self._all_events.ClearLines()
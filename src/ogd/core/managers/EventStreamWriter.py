@@ -0,0 +1,82 @@
+## import standard libraries
+from typing import Any, Collection, List
+## import local files
+from ogd.core.interfaces.outerfaces.BatchOuterface import BatchOuterface
+from ogd.core.processors.RowBatch import RowBatch
+from ogd.common.interfaces.outerfaces.DataOuterface import DataOuterface
+from ogd.common.models.Event import Event, EventSource
+from ogd.common.models.enums.ExportMode import ExportMode
+
+class EventStreamWriter:
+    """Writer that sends events to the outerfaces as they are processed, in fixed-size chunks, rather than holding a slice's events until it is output.
+
+    Each chunk is handed to the outerfaces as a RowBatch, formatted once for any outerfaces that take rows of strings,
+    and the rows are shared between the raw events and processed events outputs:
+    every event goes to the processed events output, and only events that came from the game go to the raw events output.
+    Only one chunk of encoded events is held at a time, so memory use does not grow with the size of a slice.
+    """
+
+    DEFAULT_CHUNK_SIZE : int = 1000
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, outerfaces:Collection[DataOuterface], raw_events:bool, processed_events:bool, chunk_size:int=DEFAULT_CHUNK_SIZE):
+        """Constructor for an EventStreamWriter.
+
+        :param outerfaces: The outerfaces to write events to.
+        :type outerfaces: Collection[DataOuterface]
+        :param raw_events: Whether to write the raw events output.
+        :type raw_events: bool
+        :param processed_events: Whether to write the processed events output, which includes events generated by detectors.
+        :type processed_events: bool
+        :param chunk_size: The number of events to encode and write at a time, defaults to DEFAULT_CHUNK_SIZE
+        :type chunk_size: int, optional
+        """
+        self._outerfaces       : Collection[DataOuterface] = outerfaces
+        self._raw_events       : bool                      = raw_events
+        self._processed_events : bool                      = processed_events
+        self._chunk_size       : int                       = max(1, chunk_size)
+        # the unformatted rows of the current chunk, and whether each is a raw (game) event.
+        self._rows             : List[List[Any]]           = []
+        self._is_raw           : List[bool]                = []
+        self._written          : int                       = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __str__(self) -> str:
+        return f"EventStreamWriter({len(self._rows)} pending, {self._written} written)"
+
+    @property
+    def Written(self) -> int:
+        """The number of events written so far, not counting those still pending in the current chunk."""
+        return self._written
+
+    # *** PUBLIC METHODS ***
+
+    def Write(self, event:Event) -> None:
+        """Add an event to the current chunk, writing the chunk out if it is full.
+
+        :param event: The event to be written.
+        :type event: Event
+        """
+        _is_raw = event.EventSource == EventSource.GAME
+        if self._processed_events or (self._raw_events and _is_raw):
+            self._rows.append(event.ColumnValues())
+            self._is_raw.append(_is_raw)
+            if len(self._rows) >= self._chunk_size:
+                self.Flush()
+
+    def Flush(self) -> None:
+        """Write out any events in the current chunk."""
+        if len(self._rows) == 0:
+            return
+        _batch = RowBatch.FromRows(self._rows)
+        if self._raw_events:
+            _raw_batch = _batch if all(self._is_raw) else RowBatch.FromRows([row for row, is_raw in zip(self._rows, self._is_raw) if is_raw])
+            BatchOuterface.WriteBatchTo(outerfaces=self._outerfaces, batch=_raw_batch, mode=ExportMode.EVENTS)
+        if self._processed_events:
+            BatchOuterface.WriteBatchTo(outerfaces=self._outerfaces, batch=_batch, mode=ExportMode.DETECTORS)
+        self._written += len(self._rows)
+        self._rows     = []
+        self._is_raw   = []
@@ -6,17 +6,31 @@
 import logging
 import math
 import subprocess
+import threading
 import traceback
-from datetime import datetime
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Type, Optional
+from typing import Any, Callable, Collection, Counter as CounterType, Deque, Dict, Iterator, List, Set, Tuple, Type, Optional
 
 ## import local files
 from ogd import games
+from ogd.core.generators.Generator import Generator
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
+from ogd.core.interfaces.SourceStats import SessionStats, SourceStats
+from ogd.core.interfaces.StreamingFileInterface import StreamingFileInterface
+from ogd.core.interfaces.outerfaces.BatchOuterface import BatchOuterface
+from ogd.core.managers.DetectorEventQueue import DetectorEventQueue
+from ogd.core.managers.EventCache import EventCache
 from ogd.core.managers.EventManager import EventManager
+from ogd.core.managers.EventStreamWriter import EventStreamWriter
 from ogd.core.managers.FeatureManager import FeatureManager
+from ogd.core.managers.SessionCache import SessionCache
+from ogd.core.processors.RowBatch import RowBatch
 from ogd.common.models.Event import Event
+from ogd.common.models.FeatureData import FeatureData
 from ogd.common.models.enums.ExportMode import ExportMode
 from ogd.common.models.enums.IDMode import IDMode
 from ogd.common.schemas.games.GameSchema import GameSchema
@@ -26,6 +40,117 @@ from ogd.core.requests.RequestResult import RequestResult
 from ogd.common.utils.Logger import Logger
 
 Slice = List[str]
+# the state of each session of a slice at the source, with the cached first-order FeatureData of the sessions that had not changed.
+_SessionCheck = Tuple[Dict[str, SessionStats], Dict[str, List[FeatureData]]]
+
+class _SliceResult:
+    """Simple container for everything a worker process sends back to the main process, after processing a single slice.
+    """
+    def __init__(self, raw_events:RowBatch, all_events:RowBatch,
+                 session_data:Dict[str, List[FeatureData]], processed_events:List[Event], event_count:int,
+                 profile:Optional[Dict[Tuple[str, str], List[float]]]=None,
+                 triggers_emitted:Optional[Dict[str, int]]=None, triggers_dropped:Optional[Dict[str, int]]=None):
+        self.RawEvents       : RowBatch          = raw_events
+        self.AllEvents       : RowBatch          = all_events
+        self.SessionData     : Dict[str, List[FeatureData]] = session_data
+        self.ProcessedEvents : List[Event]       = processed_events
+        self.EventCount      : int               = event_count
+        self.Profile         : Optional[Dict[Tuple[str, str], List[float]]] = profile
+        self.TriggersEmitted : Dict[str, int]    = triggers_emitted or {}
+        self.TriggersDropped : Dict[str, int]    = triggers_dropped or {}
+
+class _SlicePrefetcher:
+    """Background loader for slices, which retrieves upcoming slices on a separate thread while the current slice is processed.
+
+    Slices are handed out strictly in order.
+    The number of slices held at once is bounded by `max_slices`, and the number of events held is bounded by `max_events`,
+    though at least one slice is always prefetched, so a single oversized slice cannot stall the export.
+    """
+    def __init__(self, load_func:Callable[[int], Optional[List[Event]]], slice_count:int, max_slices:int, max_events:int):
+        """Constructor for a _SlicePrefetcher.
+
+        :param load_func: Function to load a slice, given the slice's index.
+        :type load_func: Callable[[int], Optional[List[Event]]]
+        :param slice_count: The total number of slices to load.
+        :type slice_count: int
+        :param max_slices: The maximum number of loaded slices to hold at once.
+        :type max_slices: int
+        :param max_events: The maximum number of events to hold at once, or 0 for no cap.
+        :type max_events: int
+        """
+        self._load_func   : Callable[[int], Optional[List[Event]]] = load_func
+        self._slice_count : int = slice_count
+        self._max_slices  : int = max(1, max_slices)
+        self._max_events  : int = max_events
+        self._cond        : threading.Condition = threading.Condition()
+        self._ready       : Deque[Optional[List[Event]]] = deque()
+        self._held_events : int = 0
+        self._stopped     : bool = False
+        self._error       : Optional[BaseException] = None
+        self._load_time   : timedelta = timedelta(0)
+        self._thread      : threading.Thread = threading.Thread(target=self._run, name="SlicePrefetcher", daemon=True)
+
+    @property
+    def LoadTime(self) -> timedelta:
+        """The total time the background thread spent retrieving slices."""
+        return self._load_time
+
+    def Start(self) -> None:
+        self._thread.start()
+
+    def Stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._ready.clear()
+            self._held_events = 0
+            self._cond.notify_all()
+        self._thread.join()
+
+    def Next(self) -> Optional[List[Event]]:
+        """Get the next slice, waiting for it to be retrieved if needed.
+
+        :raises: Any error raised while retrieving the slice.
+        :return: The events of the next slice, or None if the slice could not be retrieved.
+        :rtype: Optional[List[Event]]
+        """
+        with self._cond:
+            while len(self._ready) == 0 and self._error is None:
+                self._cond.wait()
+            if len(self._ready) == 0 and self._error is not None:
+                raise self._error
+            ret_val = self._ready.popleft()
+            self._held_events -= len(ret_val) if ret_val is not None else 0
+            self._cond.notify_all()
+        return ret_val
+
+    def _run(self) -> None:
+        for i in range(self._slice_count):
+            with self._cond:
+                while not self._stopped and self._isFull():
+                    self._cond.wait()
+                if self._stopped:
+                    return
+            start = datetime.now()
+            try:
+                _slice = self._load_func(i)
+            except BaseException as err:
+                with self._cond:
+                    self._error = err
+                    self._cond.notify_all()
+                return
+            self._load_time += datetime.now() - start
+            with self._cond:
+                if self._stopped:
+                    return
+                self._ready.append(_slice)
+                self._held_events += len(_slice) if _slice is not None else 0
+                self._cond.notify_all()
+
+    def _isFull(self) -> bool:
+        if len(self._ready) == 0:
+            return False
+        return len(self._ready) >= self._max_slices \
+            or (self._max_events > 0 and self._held_events >= self._max_events)
 
 ## @class ExportManager
 #  A class to export features and raw data, given a Request object.
@@ -34,6 +159,12 @@ class ExportManager:
     Use this class to carry out a request for a data export, by passing along an instance of the `Request` class to the ExecuteRequest function.
     """
 
+    # Per-process state for worker processes, set up once by _initWorker when the process pool starts.
+    _worker_config    : Optional[ConfigSchema]            = None
+    _worker_schema    : Optional[GameSchema]              = None
+    _worker_loader    : Optional[Type[GeneratorLoader]]   = None
+    _worker_overrides : Optional[List[str]]               = None
+
     # *** BUILT-INS & PROPERTIES ***
 
     def __init__(self, config:ConfigSchema):
@@ -47,10 +178,33 @@ class ExportManager:
         self._event_mgr   : Optional[EventManager]   = None
         self._feat_mgr    : Optional[FeatureManager] = None
         self._debug_count : int                      = 0
+        # events triggered by detectors, waiting to be processed once the event that triggered them is done.
+        self._detector_queue : DetectorEventQueue    = DetectorEventQueue()
+        # when not None, every event handed to the feature manager (including detector-triggered events) is recorded here, in order,
+        # so a worker can send them back to the main process.
+        self._processed_events : Optional[List[Event]] = None
+        # when not None, events for the feature manager are collected here while a slice is processed, and handed over as one batch at the end of the slice.
+        self._feature_batch : Optional[List[Event]] = None
+        # running totals of time spent in each stage of slice handling, to show how well retrieval overlaps with processing.
+        self._stage_times : Dict[str, timedelta] = {}
+        # for incremental exports, the cache of session features, along with the manifest entry of each session in the current slice that is not served from the cache.
+        self._session_cache : Optional[SessionCache]         = None
+        self._slice_stats   : Dict[str, SessionStats]        = {}
+        # for incremental exports, the sessions of each retrieved slice that were checked at the source, with the cached features of those that had not changed, by slice number.
+        self._slice_checks  : Dict[int, _SessionCheck]       = {}
+        # whether the events of sessions served from the session cache still have to be retrieved.
+        self._cached_need_events : bool                      = True
+        # when not None, the local cache that session events are read from and stored in, instead of always retrieving them from the interface.
+        self._event_cache   : Optional[EventCache]           = None
 
     def __str__(self):
         return f"ExportManager"
 
+    @property
+    def StageTimes(self) -> Dict[str, timedelta]:
+        """The time spent in each stage of slice handling (retrieve, wait, process and output) during the last request."""
+        return dict(self._stage_times)
+
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
@@ -76,21 +230,33 @@ class ExportManager:
             self._preProcess(request=request)
             Logger.Log(f"Done", logging.INFO)
             Logger.Log(f"Executing...", logging.INFO)
-            _sess_ids : List[str] = request.RetrieveIDs() or []
-            for outerface in request.Outerfaces:
-                outerface.SessionCount = len(_sess_ids)
 
         # 2. Process slices
-            Logger.Log(f"Preparing to process {len(_sess_ids)} sessions...", logging.INFO, depth=1)
-            self._processSlices(request=request, ids=_sess_ids)
+            _sess_count : int
+            if isinstance(request.Interface, StreamingFileInterface):
+                # sessions are only counted as they are streamed from the file, so the outerfaces get the count afterwards.
+                Logger.Log(f"Preparing to stream sessions from {request.Interface}...", logging.INFO, depth=1)
+                _sess_count = self._processStreamedSlices(request=request, interface=request.Interface)
+                for outerface in request.Outerfaces:
+                    outerface.SessionCount = _sess_count
+            else:
+                _sess_ids : List[str] = request.RetrieveIDs() or []
+                _sess_count = len(_sess_ids)
+                for outerface in request.Outerfaces:
+                    outerface.SessionCount = _sess_count
+                Logger.Log(f"Preparing to process {len(_sess_ids)} sessions...", logging.INFO, depth=1)
+                self._processSlices(request=request, ids=_sess_ids)
             Logger.Log(f"Done", logging.INFO, depth=1)
 
         # 3. Output population/player features as post-slicing data.
             Logger.Log(f"Outputting post-process data...", logging.INFO, depth=2)
             self._postProcess(request=request)
             Logger.Log(f"Done", logging.INFO)
+            self._detector_queue.LogCounts()
+            if self._config.WithProfiling:
+                self._outputProfile(request=request)
 
-            ret_val.SessionCount = len(_sess_ids)
+            ret_val.SessionCount = _sess_count
             ret_val.RequestSucceeded(msg=f"Successfully executed data request {request}.")
         except ValueError as err:
             msg = f"Failed to execute data request {str(request)}, an invalid value was found:\n{str(err)}\n{traceback.format_exc()}"
@@ -99,6 +265,13 @@ class ExportManager:
             msg = f"Failed to execute data request {str(request)}, an unexpected error occurred:\n{type(err)} {str(err)}\n{traceback.format_exc()}"
             ret_val.RequestErrored(msg=msg)
         finally:
+            if self._session_cache is not None:
+                self._session_cache.Close()
+                self._session_cache = None
+            if self._event_cache is not None:
+                self._event_cache.Close()
+                self._event_cache = None
+            GeneratorProfiler.Disable()
             time_delta = datetime.now() - start
             ret_val.Duration = time_delta
             return ret_val
@@ -112,7 +285,7 @@ class ExportManager:
         if self._debug_count < 5:
             Logger.Log(f"{self} received an event trigger.", logging.DEBUG)
             self._debug_count += 1
-        self._processEvent(next_event=event)
+        self._detector_queue.Push(event=event)
 
     def _preProcess(self, request:Request) -> None:
         """
@@ -126,8 +299,11 @@ class ExportManager:
         :param request: The export request being processed
         :type request: Request
         """
-        _games_path  = Path(games.__file__) if Path(games.__file__).is_dir() else Path(games.__file__).parent
-        _game_schema  : GameSchema  = GameSchema.FromFile(game_id=request.GameID, schema_path=_games_path / request.GameID / "schemas")
+        _game_schema  : GameSchema  = ExportManager._loadGameSchema(request.GameID)
+        # profiling has to be on before the managers are set up, so their registries compile timed dispatchers.
+        if self._config.WithProfiling:
+            GeneratorProfiler.Reset()
+            GeneratorProfiler.Enable()
     # 1. Get LoaderClass
         load_class = ExportManager._loadLoaderClass(request.GameID)
         if load_class is None:
@@ -137,35 +313,113 @@ class ExportManager:
             request.RemoveExportMode(ExportMode.PLAYER)
             request.RemoveExportMode(ExportMode.POPULATION)
 
-    # 2. Set up EventManager, assuming it was requested.
-        if request.ExportRawEvents or request.ExportProcessedEvents:
-            self._event_mgr = EventManager(game_schema=_game_schema, LoaderClass=load_class,
-                                           trigger_callback=self._receiveEventTrigger, feature_overrides=request._feat_overrides)
-        else:
-            Logger.Log("Event data not requested, skipping event manager.", logging.INFO, depth=1)
-    # 3. Set up FeatureManager, assuming it was requested.
-        if request.ExportSessions or request.ExportPlayers or request.ExportPopulation:
-            self._feat_mgr = FeatureManager(game_schema=_game_schema, LoaderClass=load_class, feature_overrides=request._feat_overrides)
-        else:
-            Logger.Log("Feature data not requested, or extractor loader unavailable, skipping feature manager.", logging.INFO, depth=1)
+    # 2 & 3. Set up EventManager and FeatureManager, assuming they were requested.
+        #        When slices are processed by worker processes, events are run through detectors in the workers.
+        #        Streamed slices are always processed in this process.
+        #        Events processed in this process are streamed straight to the outerfaces, rather than held until their slice is output.
+        _in_process = self._config.WorkerCount <= 1 or isinstance(request.Interface, StreamingFileInterface)
+        _writer = EventStreamWriter(outerfaces=request.Outerfaces, raw_events=request.ExportRawEvents, processed_events=request.ExportProcessedEvents) \
+                  if _in_process else None
+        self._setupManagers(game_schema=_game_schema, load_class=load_class, feature_overrides=request._feat_overrides,
+                            with_events=request.ExportRawEvents or request.ExportProcessedEvents,
+                            with_features=request.ExportSessions or request.ExportPlayers or request.ExportPopulation,
+                            event_writer=_writer)
+        if request.Incremental:
+            self._setupSessionCache(request=request)
+        if request.UseEventCache:
+            self._setupEventCache(request=request)
     # 4. Open the outerfaces
         for outerface in request.Outerfaces:
             outerface.Open()
         self._outputHeaders(request=request)
 
+    def _setupManagers(self, game_schema:GameSchema, load_class:Optional[Type[GeneratorLoader]], feature_overrides:Optional[List[str]],
+                       with_events:bool, with_features:bool, event_writer:Optional[EventStreamWriter]=None) -> None:
+        """Set up the EventManager and FeatureManager of the ExportManager.
+
+        :param game_schema: The schema of the game being exported.
+        :type game_schema: GameSchema
+        :param load_class: The GeneratorLoader subclass for the game, if any.
+        :type load_class: Optional[Type[GeneratorLoader]]
+        :param feature_overrides: An optional list of features to use in place of the game's configured features.
+        :type feature_overrides: Optional[List[str]]
+        :param with_events: Whether to set up an EventManager.
+        :type with_events: bool
+        :param with_features: Whether to set up a FeatureManager.
+        :type with_features: bool
+        :param event_writer: A writer to stream events to as they are processed, defaults to None, in which case events are held until their slice is output.
+        :type event_writer: Optional[EventStreamWriter], optional
+        """
+        if with_events:
+            self._event_mgr = EventManager(game_schema=game_schema, LoaderClass=load_class,
+                                           trigger_callback=self._receiveEventTrigger, feature_overrides=feature_overrides, writer=event_writer)
+        else:
+            Logger.Log("Event data not requested, skipping event manager.", logging.INFO, depth=1)
+        if with_features:
+            self._feat_mgr = FeatureManager(game_schema=game_schema, LoaderClass=load_class, feature_overrides=feature_overrides)
+        else:
+            Logger.Log("Feature data not requested, or extractor loader unavailable, skipping feature manager.", logging.INFO, depth=1)
+
+    def _setupSessionCache(self, request:Request) -> None:
+        """Open the session cache for an incremental export.
+
+        :param request: The export request being processed
+        :type request: Request
+        """
+        if self._feat_mgr is None:
+            Logger.Log("Incremental export requested, but no features are being exported, so there is nothing to cache.", logging.INFO, depth=1)
+        elif self._config.WorkerCount > 1:
+            Logger.Log("Incremental export is not supported with multiple worker processes, all sessions will be processed.", logging.WARN, depth=1)
+        else:
+            self._session_cache = SessionCache(cache_dir=self._config.CacheDirectory, game_id=request.GameID,
+                                               schema_hash=SessionCache.SchemaHash(game_id=request.GameID, feature_overrides=request._feat_overrides))
+            self._session_cache.Open()
+            self._slice_checks = {}
+            Logger.Log(f"Using {self._session_cache} for incremental export.", logging.INFO, depth=1)
+            # population and player features get the events of every session, so unchanged sessions' events are only skipped if nothing else needs them.
+            self._cached_need_events = self._event_mgr is not None or self._feat_mgr.RestoredSessionsNeedEvents()
+            if self._cached_need_events:
+                Logger.Log("Events of sessions served from the session cache will still be retrieved, since they are exported, "
+                           "or population, player, or second-order session features are calculated from them.", logging.INFO, depth=1)
+
+    def _setupEventCache(self, request:Request) -> None:
+        """Open the local event cache, which slices of session events are read from and stored in.
+
+        :param request: The export request being processed
+        :type request: Request
+        """
+        if self._config.EventCacheSize <= 0:
+            Logger.Log("Event cache size is configured as 0, events will not be cached.", logging.INFO, depth=1)
+        elif isinstance(request.Interface, StreamingFileInterface):
+            Logger.Log("Events streamed from a file are not cached.", logging.INFO, depth=1)
+        elif request.Range.IDMode != IDMode.SESSION:
+            Logger.Log(f"Events are only cached for exports by session ID, not {request.Range.IDMode.name} ID.", logging.INFO, depth=1)
+        else:
+            self._event_cache = EventCache(cache_dir=self._config.CacheDirectory, game_id=request.GameID,
+                                           source=EventCache.SourceKey(interface=request.Interface, exclude_rows=ExportManager._excludeRows(request.GameID)),
+                                           max_bytes=self._config.EventCacheSize * 1024 * 1024, refresh=request.RefreshEventCache)
+            self._event_cache.Open()
+            Logger.Log(f"Using {self._event_cache} for session events.", logging.INFO, depth=1)
+
     def _processSlices(self, request:Request, ids:List[str]) -> None:
+        if self._config.WorkerCount > 1:
+            self._processSlicesParallel(request=request, ids=ids)
+            return
         start  : datetime
         slices : List[Slice] = self._generateSlices(sess_ids=ids)
+        # hash the requested IDs once, rather than searching the list for every event of every slice.
+        _id_index : Set[str] = set(ids)
 
-        _next_slice_data : Optional[List[Event]] = None
-        for i, next_slice_ids in enumerate(slices):
-            _next_slice_data = self._loadSlice(request=request, next_slice_ids=next_slice_ids, slice_num=i+1, slice_count=len(slices))
+        self._stage_times = { "retrieve" : timedelta(0), "wait" : timedelta(0), "process" : timedelta(0), "output" : timedelta(0) }
+        for i, _next_slice_data in self._iterateSlices(request=request, slices=slices):
             if _next_slice_data is not None:
             # 1. Process the slice.
                 start = datetime.now()
                 Logger.Log(f"Processing slice [{i+1}/{len(slices)}]...", logging.INFO, depth=2)
-                self._processSlice(next_slice_data=_next_slice_data, request=request, ids=ids)
+                self._processSlice(next_slice_data=_next_slice_data, id_mode=request.Range.IDMode, ids=_id_index,
+                                   session_check=self._slice_checks.pop(i+1, None))
                 time_delta = datetime.now() - start
+                self._stage_times["process"] += time_delta
                 Logger.Log(f"Processing time for slice [{i+1}/{len(slices)}]: {time_delta} to handle {len(_next_slice_data)} events", logging.INFO, depth=2)
 
             # 2. Write out the session data and reset for next slice.
@@ -173,26 +427,281 @@ class ExportManager:
                 Logger.Log(f"Outputting slice [{i+1}/{len(slices)}]...", logging.INFO, depth=2)
                 self._outputSlice(request=request, slice_num=i+1, slice_count=len(slices))
                 time_delta = datetime.now() - start
+                self._stage_times["output"] += time_delta
                 Logger.Log(f"Output time for slice [{i+1}/{len(slices)}]: {time_delta} to handle {len(_next_slice_data)} events", logging.INFO, depth=2)
+        self._logStageTimes(slice_count=len(slices))
+
+    def _processStreamedSlices(self, request:Request, interface:StreamingFileInterface) -> int:
+        """Process slices as they are read from a file, in a single pass over the file.
+
+        Sessions are gathered into slices of `self._config.BatchSize` sessions, as they are streamed from the file,
+        and each slice is processed and output before the next is read, so only one slice of events is held in memory at a time.
+        Streamed slices are always processed in this process, even if multiple workers are configured.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param interface: The interface to stream sessions from.
+        :type interface: StreamingFileInterface
+        :return: The number of sessions that were processed.
+        :rtype: int
+        """
+        if self._config.WorkerCount > 1:
+            Logger.Log("Streamed exports are processed in a single process, the configured worker count will not be used.", logging.WARN, depth=1)
+        _sess_count : int = 0
+        _slice_num  : int = 0
+        _slice_ids  : Set[str]    = set()
+        _slice_data : List[Event] = []
+
+        self._stage_times = { "retrieve" : timedelta(0), "wait" : timedelta(0), "process" : timedelta(0), "output" : timedelta(0) }
+        start = datetime.now()
+        for session_events in interface.StreamSessions(exclude_rows=ExportManager._excludeRows(request.GameID)):
+            if len(session_events) > 0:
+                _slice_ids.add(session_events[0].SessionID)
+                _slice_data.extend(session_events)
+            _sess_count += 1
+            if len(_slice_ids) >= self._config.BatchSize:
+                self._stage_times["retrieve"] += datetime.now() - start
+                _slice_num += 1
+                self._processStreamedSlice(request=request, slice_data=_slice_data, slice_ids=_slice_ids, slice_num=_slice_num)
+                _slice_ids, _slice_data = set(), []
+                start = datetime.now()
+        self._stage_times["retrieve"] += datetime.now() - start
+        if len(_slice_ids) > 0:
+            _slice_num += 1
+            self._processStreamedSlice(request=request, slice_data=_slice_data, slice_ids=_slice_ids, slice_num=_slice_num)
+        # there was no retrieval in the background, so all retrieval time was spent waiting.
+        self._stage_times["wait"] = self._stage_times["retrieve"]
+        self._logStageTimes(slice_count=_slice_num)
+        return _sess_count
+
+    def _processStreamedSlice(self, request:Request, slice_data:List[Event], slice_ids:Set[str], slice_num:int) -> None:
+        # the number of slices in a stream isn't known until the end, so output is logged against a slice count of 0.
+        start = datetime.now()
+        Logger.Log(f"Processing streamed slice [{slice_num}]...", logging.INFO, depth=2)
+        self._processSlice(next_slice_data=slice_data, id_mode=IDMode.SESSION, ids=slice_ids)
+        time_delta = datetime.now() - start
+        self._stage_times["process"] += time_delta
+        Logger.Log(f"Processing time for streamed slice [{slice_num}]: {time_delta} to handle {len(slice_data)} events", logging.INFO, depth=2)
+        start = datetime.now()
+        self._outputSlice(request=request, slice_num=slice_num, slice_count=0)
+        self._stage_times["output"] += datetime.now() - start
+
+    def _iterateSlices(self, request:Request, slices:List[Slice]) -> Iterator[Tuple[int, Optional[List[Event]]]]:
+        """Retrieve each slice of the request, in order.
+
+        If prefetching is configured, upcoming slices are retrieved in the background while the caller works on the current slice.
+        Time spent retrieving, and time the caller spent waiting on retrieval, are added to the stage times.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param slices: The list of slices to retrieve.
+        :type slices: List[Slice]
+        :yield: The index of each slice, along with the slice's events (or None if the slice could not be retrieved).
+        :rtype: Iterator[Tuple[int, Optional[List[Event]]]]
+        """
+        if self._config.PrefetchSlices <= 0:
+            for i, next_slice_ids in enumerate(slices):
+                start = datetime.now()
+                _next_slice_data = self._loadSlice(request=request, next_slice_ids=next_slice_ids, slice_num=i+1, slice_count=len(slices))
+                time_delta = datetime.now() - start
+                self._stage_times["retrieve"] += time_delta
+                self._stage_times["wait"]     += time_delta
+                yield i, _next_slice_data
+        else:
+            prefetcher = _SlicePrefetcher(load_func=lambda i: self._loadSlice(request=request, next_slice_ids=slices[i], slice_num=i+1, slice_count=len(slices)),
+                                          slice_count=len(slices), max_slices=self._config.PrefetchSlices, max_events=self._config.PrefetchMaxEvents)
+            prefetcher.Start()
+            try:
+                for i in range(len(slices)):
+                    start = datetime.now()
+                    _next_slice_data = prefetcher.Next()
+                    self._stage_times["wait"] += datetime.now() - start
+                    yield i, _next_slice_data
+            finally:
+                prefetcher.Stop()
+                self._stage_times["retrieve"] += prefetcher.LoadTime
+
+    def _logStageTimes(self, slice_count:int) -> None:
+        _times = self._stage_times
+        _overlap = _times["retrieve"] - _times["wait"]
+        Logger.Log(f"Stage times for {slice_count} slices: retrieve={_times['retrieve']}, waiting on retrieval={_times['wait']}, "
+                   f"process={_times['process']}, output={_times['output']}; retrieval overlapped with other work for {_overlap}", logging.INFO, depth=1)
+        _stats = Generator.ValidationCacheStats()
+        Logger.Log(f"Event validation cache: {_stats['version_hits']} version hits / {_stats['version_misses']} misses, "
+                   f"{_stats['event_type_hits']} event type hits / {_stats['event_type_misses']} misses", logging.DEBUG, depth=1)
+
+    def _processSlicesParallel(self, request:Request, ids:List[str]) -> None:
+        """Process slices in a pool of `self._config.WorkerCount` worker processes.
+
+        Slices are still loaded from the interface in the main process, then handed off to the workers,
+        which run the slice's events through detectors, and calculate the first-order features of the slice's sessions.
+        Results are merged back in slice order, and each slice is then handled by the main process just as in a sequential export,
+        except that session processors are restored from the workers' first-order features, rather than calculating them from the events.
+        So second-order features, at every level, are calculated from the same data, in the same order, and the output is the same as a sequential export.
+
+        This means only detectors and first-order session features run in the workers.
+        Population and player features, higher-order session features, and the second-order pass all still run in the main process,
+        since their state cannot be split between workers and merged again, so they bound how much faster a parallel export can be.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param ids: The list of all IDs in the request.
+        :type ids: List[str]
+        """
+        slices : List[Slice] = self._generateSlices(sess_ids=ids)
+        _max_in_flight : int = 2 * self._config.WorkerCount
+        _pending       : Deque[Tuple[int, Future]] = deque()
+
+        self._stage_times = { "retrieve" : timedelta(0), "wait" : timedelta(0), "process" : timedelta(0), "output" : timedelta(0) }
+        Logger.Log(f"Processing {len(slices)} slices with {self._config.WorkerCount} worker processes...", logging.INFO, depth=1)
+        with ProcessPoolExecutor(max_workers=self._config.WorkerCount, initializer=ExportManager._initWorker,
+                                 initargs=(self._config, request.GameID, request._feat_overrides)) as pool:
+            for i, _next_slice_data in self._iterateSlices(request=request, slices=slices):
+                if _next_slice_data is not None:
+                    _future = pool.submit(ExportManager._runWorkerSlice, _next_slice_data, request.Range.IDMode, slices[i],
+                                          set(request._exports), i+1, len(slices))
+                    _pending.append((i+1, _future))
+                # keep a bounded number of slices in flight, so we don't load the whole dataset into memory at once.
+                while len(_pending) >= _max_in_flight:
+                    self._awaitSliceResult(request=request, pending=_pending, slice_count=len(slices))
+            while len(_pending) > 0:
+                self._awaitSliceResult(request=request, pending=_pending, slice_count=len(slices))
+        self._logStageTimes(slice_count=len(slices))
+
+    def _awaitSliceResult(self, request:Request, pending:Deque[Tuple[int, Future]], slice_count:int) -> None:
+        start = datetime.now()
+        _slice_num, _future = pending.popleft()
+        _result = _future.result()
+        self._stage_times["process"] += datetime.now() - start
+        start = datetime.now()
+        self._mergeSliceResult(request=request, result=_result, slice_num=_slice_num, slice_count=slice_count)
+        self._stage_times["output"] += datetime.now() - start
+
+    def _mergeSliceResult(self, request:Request, result:_SliceResult, slice_num:int, slice_count:int) -> None:
+        start = datetime.now()
+        Logger.Log(f"Merging results of slice [{slice_num}/{slice_count}]...", logging.INFO, depth=2)
+        if request.ExportRawEvents:
+            BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=result.RawEvents, mode=ExportMode.EVENTS)
+        if request.ExportProcessedEvents:
+            BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=result.AllEvents, mode=ExportMode.DETECTORS)
+        if self._feat_mgr is not None:
+            # events were already run through detectors in the worker, and detector-triggered events are included in the list,
+            # so we skip the EventManager and only send the events to the feature manager, in the order the worker sent them to its own.
+            self._feat_mgr.ProcessEvents(events=result.ProcessedEvents, error_handler=self._handleEventError, restored_sessions=result.SessionData)
+            self._outputSessions(request=request, slice_num=slice_num, slice_count=slice_count)
+        if result.Profile is not None:
+            GeneratorProfiler.Merge(result.Profile)
+        self._detector_queue.Merge(emitted=result.TriggersEmitted, dropped=result.TriggersDropped)
+        time_delta = datetime.now() - start
+        Logger.Log(f"Merge time for slice [{slice_num}/{slice_count}]: {time_delta} to handle {result.EventCount} events", logging.INFO, depth=2)
 
     def _postProcess(self, request:Request):
         start = datetime.now()
         if self._feat_mgr is not None:
             if request.ExportPopulation:
-                _pop_feats = self._feat_mgr.GetPopulationFeatures(as_str=True)
-                for outerface in request.Outerfaces:
-                    outerface.WriteLines(lines=_pop_feats, mode=ExportMode.POPULATION)
+                BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=self._feat_mgr.GetPopulationBatch(), mode=ExportMode.POPULATION)
                 self._feat_mgr.ClearPopulationLines()
             if request.ExportPlayers:
-                _player_feats = self._feat_mgr.GetPlayerFeatures(as_str=True)
-                for outerface in request.Outerfaces:
-                    outerface.WriteLines(lines=_player_feats, mode=ExportMode.PLAYER)
+                BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=self._feat_mgr.GetPlayerBatch(), mode=ExportMode.PLAYER)
                 self._feat_mgr.ClearPlayerLines()
         else:
             Logger.Log(f"Skipping feature output for post-process, no FeatureManager exists!", logging.DEBUG, depth=3)
         time_delta = datetime.now() - start
         Logger.Log(f"Output time for population: {time_delta}", logging.INFO, depth=2)
 
+    def _outputProfile(self, request:Request) -> None:
+        """Write the ranked report of time spent in each generator, next to the exported data files, and log the top few generators.
+
+        :param request: The export request being processed
+        :type request: Request
+        """
+        _rows = GeneratorProfiler.Report()
+        for row in _rows[:10]:
+            Logger.Log(f"{row['rank']:>3}. {row['instance']} ({row['class']}): {row['total_seconds']:.3f}s ({row['percent']}%), "
+                       f"{row['event_calls']} events, {row['rejected_events']} rejected", logging.INFO, depth=2)
+        _dates = request.Range.DateRange
+        _start = _dates['min'].strftime("%Y%m%d") if _dates['min'] is not None else "UNKNOWN"
+        _end   = _dates['max'].strftime("%Y%m%d") if _dates['max'] is not None else "UNKNOWN"
+        _base_name = f"{request.GameID}_{_start}_to_{_end}_{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        GeneratorProfiler.WriteReport(directory=Path(f"./{self._config.FileIndexConfig.LocalDirectory}") / request.GameID, base_name=_base_name)
+
+    @staticmethod
+    def _loadGameSchema(game_id:str) -> GameSchema:
+        _games_path  = Path(games.__file__) if Path(games.__file__).is_dir() else Path(games.__file__).parent
+        return GameSchema.FromFile(game_id=game_id, schema_path=_games_path / game_id / "schemas")
+
+    @staticmethod
+    def _excludeRows(game_id:str) -> Optional[List[str]]:
+        # HACK : setting to skip algae and nudge hint events here directly
+        # TODO : Add a way to configure what to exclude at higher level, here. So we can easily choose to leave out certain events.
+        match game_id:
+            case 'BLOOM':
+                return ['algae_growth_end', 'algae_growth_begin']
+            case 'THERMOLAB' | 'THERMOVR':
+                return ['nudge_hint_displayed', 'nudge_hint_hidden', 'simulation_data']
+            case 'LAKELAND':
+                return ['CUSTOM.24']
+            case _:
+                return None
+
+    @staticmethod
+    def _initWorker(config:ConfigSchema, game_id:str, feature_overrides:Optional[List[str]]) -> None:
+        """Set up the per-process state of a worker process, so the game schema and loader are only loaded once per worker.
+        """
+        ExportManager._worker_config    = config
+        ExportManager._worker_schema    = ExportManager._loadGameSchema(game_id)
+        ExportManager._worker_loader    = ExportManager._loadLoaderClass(game_id)
+        ExportManager._worker_overrides = feature_overrides
+        if config.WithProfiling:
+            GeneratorProfiler.Reset()
+            GeneratorProfiler.Enable()
+
+    @staticmethod
+    def _runWorkerSlice(next_slice_data:List[Event], id_mode:IDMode, ids:List[str], export_modes:Set[ExportMode],
+                        slice_num:int, slice_count:int) -> _SliceResult:
+        """Process a single slice in a worker process.
+
+        A fresh set of managers is created for each slice, since nothing at the session level carries over between slices.
+
+        :param next_slice_data: The events of the slice.
+        :type next_slice_data: List[Event]
+        :param id_mode: Whether the slice IDs are session or player IDs.
+        :type id_mode: IDMode
+        :param ids: The IDs of the slice.
+        :type ids: List[str]
+        :param export_modes: The export modes of the request.
+        :type export_modes: Set[ExportMode]
+        :return: The event batches and first-order session FeatureData of the slice, along with all events that were processed.
+        :rtype: _SliceResult
+        """
+        if ExportManager._worker_config is None or ExportManager._worker_schema is None:
+            raise RuntimeError("ExportManager worker process was not initialized!")
+        _raw_events : RowBatch                     = RowBatch.FromRows([])
+        _all_events : RowBatch                     = RowBatch.FromRows([])
+        _sess_data  : Dict[str, List[FeatureData]] = {}
+
+        worker = ExportManager(config=ExportManager._worker_config)
+        worker._setupManagers(game_schema=ExportManager._worker_schema, load_class=ExportManager._worker_loader,
+                              feature_overrides=ExportManager._worker_overrides,
+                              with_events=ExportMode.EVENTS in export_modes or ExportMode.DETECTORS in export_modes,
+                              with_features=ExportManager._worker_loader is not None and \
+                                            len(export_modes & {ExportMode.SESSION, ExportMode.PLAYER, ExportMode.POPULATION}) > 0)
+        worker._processed_events = []
+        worker._processSlice(next_slice_data=next_slice_data, id_mode=id_mode, ids=ids)
+        if worker._event_mgr is not None:
+            if ExportMode.EVENTS in export_modes:
+                _raw_events = worker._event_mgr.GetRawBatch(slice_num=slice_num, slice_count=slice_count)
+            if ExportMode.DETECTORS in export_modes:
+                _all_events = worker._event_mgr.GetAllBatch(slice_num=slice_num, slice_count=slice_count)
+        if worker._feat_mgr is not None:
+            # session output lines are made in the main process, once the first-order data is combined with player and population data.
+            for feature in worker._feat_mgr.GetSessionFeatureData():
+                _sess_data.setdefault(feature.SessionID, []).append(feature)
+        return _SliceResult(raw_events=_raw_events, all_events=_all_events, session_data=_sess_data,
+                            processed_events=worker._processed_events, event_count=len(next_slice_data),
+                            profile=GeneratorProfiler.Drain() if GeneratorProfiler.Enabled else None,
+                            triggers_emitted=worker._detector_queue.Emitted, triggers_dropped=worker._detector_queue.Dropped)
+
     @staticmethod
     def _loadLoaderClass(game_id:str) -> Optional[Type[GeneratorLoader]]:
         _loader_class: Optional[Type[GeneratorLoader]] = None
@@ -268,18 +777,21 @@ class ExportManager:
 
         Logger.Log(f"Retrieving slice [{slice_num}/{slice_count}]...", logging.INFO, depth=2)
         start : datetime = datetime.now()
-        # HACK : setting to skip algae and nudge hint events here directly
-        # TODO : Add a way to configure what to exclude at higher level, here. So we can easily choose to leave out certain events.
-        match request.GameID:
-            case 'BLOOM':
-                _exclude_rows = ['algae_growth_end', 'algae_growth_begin']
-            case 'THERMOLAB' | 'THERMOVR':
-                _exclude_rows = ['nudge_hint_displayed', 'nudge_hint_hidden', 'simulation_data']
-            case 'LAKELAND':
-                _exclude_rows = ['CUSTOM.24']
-            case _:
-                _exclude_rows = None
-        ret_val = request.Interface.EventsFromIDs(id_list=next_slice_ids, id_mode=request.Range.IDMode, exclude_rows=_exclude_rows)
+        _exclude_rows = ExportManager._excludeRows(request.GameID)
+        _stats : Optional[Dict[str, SessionStats]] = None
+        if self._session_cache is not None and request.Range.IDMode == IDMode.SESSION:
+            _check = self._checkSessions(request=request, next_slice_ids=next_slice_ids)
+            if _check is not None:
+                self._slice_checks[slice_num] = _check
+                _stats = _check[0]
+                if not self._cached_need_events:
+                    next_slice_ids = [sess_id for sess_id in next_slice_ids if sess_id not in _check[1]]
+        if self._event_cache is not None:
+            ret_val = self._loadCachedSlice(request=request, next_slice_ids=next_slice_ids, exclude_rows=_exclude_rows, session_stats=_stats)
+        elif len(next_slice_ids) == 0:
+            ret_val = []
+        else:
+            ret_val = request.Interface.EventsFromIDs(id_list=next_slice_ids, id_mode=request.Range.IDMode, exclude_rows=_exclude_rows)
         time_delta = datetime.now() - start
         if ret_val is not None:
             Logger.Log(f"Retrieval time for slice [{slice_num}/{slice_count}]: {time_delta} to get {len(ret_val)} events", logging.INFO, depth=2)
@@ -287,41 +799,208 @@ class ExportManager:
             Logger.Log(f"Could not retrieve data set for slice [{slice_num}/{slice_count}].", logging.WARN, depth=2)
         return ret_val
 
-    def _processSlice(self, next_slice_data:List[Event], request: Request, ids:List[str]):
-        _unsessioned_event_count : int = 0
-        _sampled_an_event = False
-        # 3a) If next slice yielded valid data from the interface, process row-by-row.
-        # TODO: instead of separating everything out into one call per event, turn this into a list comprehension using a validation function, so we can pass whole list down a level.
+    def _checkSessions(self, request:Request, next_slice_ids:List[str]) -> Optional[_SessionCheck]:
+        """For an incremental export, check the sessions of a slice for changes at the source, before their events are retrieved,
+        and load the cached features of the sessions that did not change.
+
+        The state of every session in the slice is found with a single grouped query, see `SourceStats`.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param next_slice_ids: The session IDs of the slice.
+        :type next_slice_ids: List[str]
+        :return: The state of each session at the source, along with the cached first-order FeatureData of each unchanged session,
+            or None if the interface could not give the state of the sessions, in which case they are checked once their events are retrieved.
+        :rtype: Optional[_SessionCheck]
+        """
+        if self._session_cache is None:
+            return None
+        _stats = SourceStats.SessionStats(interface=request.Interface, session_ids=next_slice_ids)
+        if _stats is None:
+            return None
+        _unchanged = self._session_cache.Unchanged(session_stats=_stats)
+        return _stats, self._session_cache.Load(session_ids=_unchanged)
+
+    def _loadCachedSlice(self, request:Request, next_slice_ids:List[str], exclude_rows:Optional[List[str]],
+                         session_stats:Optional[Dict[str, SessionStats]]=None) -> Optional[List[Event]]:
+        """Get the events of a slice from the event cache, retrieving only the sessions that are not cached (or whose cached events are out of date) from the interface,
+        and adding those to the cache.
+
+        The state of every session in the slice is found at the source with a single grouped query, see `SourceStats`, before anything is retrieved,
+        so events added to a session while the slice is being retrieved make its new entry out of date, rather than hiding them.
+        The events are grouped by session, with sessions in the order of the slice's IDs.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param next_slice_ids: The session IDs of the slice.
+        :type next_slice_ids: List[str]
+        :param exclude_rows: The names of any events to leave out when retrieving from the interface.
+        :type exclude_rows: Optional[List[str]]
+        :param session_stats: The state of the slice's sessions at the source, if it was already found, defaults to None, in which case it is queried here.
+        :type session_stats: Optional[Dict[str, SessionStats]], optional
+        :return: The events of the slice, or None if the uncached sessions could not be retrieved.
+        :rtype: Optional[List[Event]]
+        """
+        if self._event_cache is None:
+            return None
+        if len(next_slice_ids) == 0:
+            return []
+        if session_stats is None:
+            # if the interface can't report the state of its sessions, there are no stats, and every session is retrieved and left uncached.
+            session_stats = SourceStats.SessionStats(interface=request.Interface, session_ids=next_slice_ids) or {}
+        _sessions = self._event_cache.Get(session_ids=next_slice_ids, session_stats=session_stats)
+        _missing  = [sess_id for sess_id in next_slice_ids if sess_id not in _sessions]
+        if len(_missing) > 0:
+            _retrieved = request.Interface.EventsFromIDs(id_list=_missing, id_mode=IDMode.SESSION, exclude_rows=exclude_rows)
+            if _retrieved is None:
+                return None
+            _new_sessions : Dict[str, List[Event]] = {sess_id : [] for sess_id in _missing}
+            for event in _retrieved:
+                _new_sessions.setdefault(event.SessionID, []).append(event)
+            self._event_cache.Put(session_events=_new_sessions, session_stats=session_stats)
+            _sessions.update(_new_sessions)
+        Logger.Log(f"Read {len(next_slice_ids) - len(_missing)} sessions from the event cache, retrieved {len(_missing)}.", logging.DEBUG, depth=3)
+        return [event for sess_id in dict.fromkeys(next_slice_ids) for event in _sessions.get(sess_id, [])]
+
+    def _processSlice(self, next_slice_data:List[Event], id_mode:IDMode, ids:Collection[str], session_check:Optional[_SessionCheck]=None):
+        """Process the events of a slice, skipping any whose session (or player, in player mode) is not among the requested IDs.
+
+        :param next_slice_data: The events of the slice.
+        :type next_slice_data: List[Event]
+        :param id_mode: Whether the IDs are session or player IDs.
+        :type id_mode: IDMode
+        :param ids: The requested IDs. A set should be given when processing many slices, so it isn't rebuilt for every slice.
+        :type ids: Collection[str]
+        :param session_check: For incremental exports, the result of checking the slice's sessions at the source, see `_checkSessions`.
+            If None, sessions are checked against their retrieved events instead. Defaults to None
+        :type session_check: Optional[_SessionCheck], optional
+        """
+        _id_index : Collection[str] = ids if isinstance(ids, (set, frozenset)) else set(ids)
+        if len(next_slice_data) > 0:
+            Logger.Log(f"First event of slice is:\n{next_slice_data[0]}", logging.DEBUG, depth=2)
+        # 3a) Filter the slice in a single pass, counting up anything we skip, so it can be summarized once.
+        _rejected_sessions : CounterType[str] = Counter()
+        _rejected_users    : CounterType[str] = Counter()
+        _unsessioned_count : int          = 0
+        _accepted          : List[Event]  = []
         for event in next_slice_data:
-            if not _sampled_an_event:
-                Logger.Log(f"First event of slice is:\n{event}", logging.DEBUG, depth=2)
-                _sampled_an_event = True
-            if (request._range._id_mode==IDMode.SESSION and event.SessionID in ids) \
-            or (request._range._id_mode==IDMode.USER    and event.UserID    in ids):
-                self._processEvent(next_event=event)
+            if (id_mode == IDMode.SESSION and event.SessionID in _id_index) \
+            or (id_mode == IDMode.USER    and event.UserID    in _id_index):
+                _accepted.append(event)
             elif event.SessionID is not None and event.SessionID.upper() != "NONE":
-                Logger.Log(f"Found a session ({event.SessionID}, type {type(event.SessionID)}) which was in the slice but not in the list of sessions for processing ({ids[:5]}..., type {type(ids[0])}).", logging.WARNING, depth=2)
+                _rejected_sessions[event.SessionID] += 1
             elif event.UserID is not None and event.UserID.upper() != "NONE":
-                Logger.Log(f"Found a user ({event.UserID}) which was in the slice but not in the list of players for processing.", logging.WARNING, depth=2)
+                _rejected_users[event.UserID] += 1
             else:
-                _unsessioned_event_count += 1
-                if _unsessioned_event_count < 10:
+                _unsessioned_count += 1
+                if _unsessioned_count < 10:
                     Logger.Log(f"Found an event with no session/player ID, event is: {event}", logging.WARNING, depth=2)
-        if _unsessioned_event_count > 0:
-            Logger.Log(f"Found {_unsessioned_event_count} events without session IDs.", logging.WARNING, depth=2)
+        if len(_rejected_sessions) > 0:
+            Logger.Log(f"Skipped {sum(_rejected_sessions.values())} events from {len(_rejected_sessions)} sessions which were in the slice but not in the list for processing, "
+                       f"such as {', '.join(list(_rejected_sessions.keys())[:5])}.", logging.WARNING, depth=2)
+        if len(_rejected_users) > 0:
+            Logger.Log(f"Skipped {sum(_rejected_users.values())} events from {len(_rejected_users)} players which were in the slice but not in the list for processing, "
+                       f"such as {', '.join(list(_rejected_users.keys())[:5])}.", logging.WARNING, depth=2)
+        if _unsessioned_count > 0:
+            Logger.Log(f"Found {_unsessioned_count} events without session IDs.", logging.WARNING, depth=2)
+        # 3b) For incremental exports, find sessions whose events are unchanged since they were cached, and use their cached first-order features.
+        _cached_sessions : Dict[str, List[FeatureData]] = self._loadCachedSessions(events=_accepted, session_check=session_check)
+        # 3c) Process the accepted events.
+        #     Events still go through the event manager one at a time, since detectors may trigger new events,
+        #     but events for the feature manager are collected, and handed over as a single batch afterwards.
+        #     Each session's detectors are freed after the session's last event, so only the sessions still in progress hold detector state.
+        if self._feat_mgr is not None:
+            self._feature_batch = []
+        _last_events : Dict[Optional[str], int] = {event.SessionID : i for i, event in enumerate(_accepted)} if self._event_mgr is not None else {}
+        for i, event in enumerate(_accepted):
+            self._processEvent(next_event=event)
+            if _last_events.get(event.SessionID) == i and self._event_mgr is not None:
+                self._event_mgr.FinishSession(session_id=event.SessionID)
+        # 3d) Process the collected events at population, player, and session level.
+        #     Cached sessions are restored from their first-order features, and their events (if they were retrieved) are still processed by higher-order features.
+        if self._feat_mgr is not None and self._feature_batch is not None:
+            _batch, self._feature_batch = self._feature_batch, None
+            self._feat_mgr.ProcessEvents(events=_batch, error_handler=self._handleEventError, restored_sessions=_cached_sessions)
+
+    def _loadCachedSessions(self, events:List[Event], session_check:Optional[_SessionCheck]) -> Dict[str, List[FeatureData]]:
+        """For an incremental export, find the sessions of a slice whose cached features can be reused, and load them.
+
+        The manifest entries of the slice's other sessions are kept, so the sessions can be added to the cache once they are processed.
+
+        :param events: The accepted events of the slice.
+        :type events: List[Event]
+        :param session_check: The result of checking the slice's sessions at the source, or None to check them against their events.
+        :type session_check: Optional[_SessionCheck]
+        :return: The cached first-order FeatureData of each session that can be served from the cache, by session ID.
+        :rtype: Dict[str, List[FeatureData]]
+        """
+        ret_val : Dict[str, List[FeatureData]] = {}
+        if self._session_cache is not None and self._feat_mgr is not None:
+            if session_check is not None:
+                self._slice_stats = dict(session_check[0])
+                ret_val = session_check[1]
+            else:
+                self._slice_stats = SessionCache.StatsFromEvents(events=events)
+                _unchanged = self._session_cache.Unchanged(session_stats={sess_id : stats for sess_id, stats in self._slice_stats.items()
+                                                                          if sess_id is not None and sess_id.upper() not in {"NULL", "NONE"}})
+                ret_val = self._session_cache.Load(session_ids=_unchanged)
+            for sess_id in ret_val.keys():
+                self._slice_stats.pop(sess_id, None)
+            if len(ret_val) > 0:
+                Logger.Log(f"Reusing cached features for {len(ret_val)} of {len(ret_val) + len(self._slice_stats)} sessions in slice.", logging.INFO, depth=2)
+        return ret_val
+
+    def _storeCachedSessions(self) -> None:
+        """For an incremental export, add the sessions processed in the current slice to the cache."""
+        if self._session_cache is not None and self._feat_mgr is not None:
+            _sessions : Dict[str, List[FeatureData]] = {}
+            for feature in self._feat_mgr.GetSessionFeatureData():
+                if feature.SessionID in self._slice_stats:
+                    _sessions.setdefault(feature.SessionID, []).append(feature)
+            self._session_cache.Store(sessions=_sessions, session_stats=self._slice_stats)
+            self._session_cache.Commit()
+        self._slice_stats = {}
 
     def _processEvent(self, next_event:Event):
+        """Process an event, followed by any events that detectors triggered from it, and from those events in turn.
+
+        :param next_event: The event to be processed.
+        :type next_event: Event
+        """
+        self._dispatchEvent(next_event=next_event)
+        if self._detector_queue.Pending:
+            for batch in self._detector_queue.Batches():
+                for event in batch:
+                    self._dispatchEvent(next_event=event)
+
+    def _dispatchEvent(self, next_event:Event):
         try:
             if self._event_mgr is not None:
                 self._event_mgr.ProcessEvent(event=next_event)
-            if self._feat_mgr is not None:
+            if self._processed_events is not None:
+                self._processed_events.append(next_event)
+            if self._feature_batch is not None:
+                self._feature_batch.append(next_event)
+            elif self._feat_mgr is not None:
                 self._feat_mgr.ProcessEvent(event=next_event)
         except Exception as err:
-            if self._config.FailFast:
-                Logger.Log(f"Error while processing event {next_event.EventName}:\n{next_event}", logging.ERROR, depth=2)
-                raise err
-            else:
-                Logger.Log(f"Error while processing event {next_event.EventName}. This event will be skipped. \nFull error: {traceback.format_exc()}", logging.WARNING, depth=2)
+            self._handleEventError(event=next_event, err=err)
+
+    def _handleEventError(self, event:Event, err:Exception) -> None:
+        """Handle an error raised while processing an event, either by re-raising it (when configured to fail fast), or by logging it and skipping the event.
+
+        Must be called from within the `except` block that caught the error.
+
+        :param event: The event that was being processed.
+        :type event: Event
+        :param err: The error that was raised.
+        :type err: Exception
+        """
+        if self._config.FailFast:
+            Logger.Log(f"Error while processing event {event.EventName}:\n{event}", logging.ERROR, depth=2)
+            raise err
+        else:
+            Logger.Log(f"Error while processing event {event.EventName}. This event will be skipped. \nFull error: {traceback.format_exc()}", logging.WARNING, depth=2)
 
     def _outputHeaders(self, request:Request):
         if self._event_mgr is not None:
@@ -361,7 +1040,10 @@ class ExportManager:
         """
         Output all genearted data for a slice's-worth of raw data
 
-        TODO : Find better solution that does not involve discarding session features, which likely messes up some second-order features.
+        Session processors are discarded after each slice, whether or not session features were requested.
+        The FeatureManager keeps the sessions' first-order data, so it can still be used by player and population features.
+        In an incremental export, the sessions processed in the slice are added to the cache.
+
         :param request: _description_
         :type request: Request
         :param slice_num: _description_
@@ -369,26 +1051,39 @@ class ExportManager:
         :param slice_count: _description_
         :type slice_count: int
         """
-        if self._event_mgr is not None:
+        if self._event_mgr is not None and self._event_mgr.Streaming:
+        # 1 & 2. Events were already streamed to the outerfaces as they were processed, so just write out the last chunk.
+            self._event_mgr.Flush()
+            self._event_mgr.ClearLines()
+        elif self._event_mgr is not None:
         # 1. Output raw events, if requested
             if request.ExportRawEvents:
-                _events = self._event_mgr.GetRawLines(slice_num=slice_num, slice_count=slice_count)
-                for outerface in request.Outerfaces:
-                    outerface.WriteLines(lines=_events, mode=ExportMode.EVENTS)
+                _events = self._event_mgr.GetRawBatch(slice_num=slice_num, slice_count=slice_count)
+                BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=_events, mode=ExportMode.EVENTS)
         # 2. Output combined raw & detected events, if requested
             if request.ExportProcessedEvents:
-                _events = self._event_mgr.GetAllLines(slice_num=slice_num, slice_count=slice_count)
-                for outerface in request.Outerfaces:
-                    outerface.WriteLines(lines=_events, mode=ExportMode.DETECTORS)
+                _events = self._event_mgr.GetAllBatch(slice_num=slice_num, slice_count=slice_count)
+                BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=_events, mode=ExportMode.DETECTORS)
             self._event_mgr.ClearLines()
         else:
             Logger.Log(f"Skipping event output for slice [{slice_num}/{slice_count}], no EventManager exists!", logging.DEBUG, depth=3)
+        self._outputSessions(request=request, slice_num=slice_num, slice_count=slice_count)
+
+    def _outputSessions(self, request:Request, slice_num:int, slice_count:int):
+        """Output the session features of a slice, if requested, and discard the slice's session processors.
+
+        :param request: The export request being processed
+        :type request: Request
+        :param slice_num: The number of the slice, counting from 1.
+        :type slice_num: int
+        :param slice_count: The total number of slices in the export.
+        :type slice_count: int
+        """
         if self._feat_mgr is not None:
-        # 3. Output session features, if requested
             if request.ExportSessions:
-                _sess_feats = self._feat_mgr.GetSessionFeatures(slice_num=slice_num, slice_count=slice_count, as_str=True)
-                for outerface in request.Outerfaces:
-                    outerface.WriteLines(lines=_sess_feats, mode=ExportMode.SESSION)
-                self._feat_mgr.ClearSessionLines()
+                _sess_feats = self._feat_mgr.GetSessionBatch(slice_num=slice_num, slice_count=slice_count)
+                BatchOuterface.WriteBatchTo(outerfaces=request.Outerfaces, batch=_sess_feats, mode=ExportMode.SESSION)
+            self._storeCachedSessions()
+            self._feat_mgr.ClearSessionLines()
         else:
             Logger.Log(f"Skipping feature output for slice [{slice_num}/{slice_count}], no FeatureManager exists!", logging.DEBUG, depth=3)
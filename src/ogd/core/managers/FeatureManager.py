@@ -2,15 +2,19 @@
 import itertools
 import logging
 from datetime import datetime
-from typing import Dict, List, Type, Optional, Set, Tuple, Union
+from typing import Dict, List, Mapping, Type, Optional, Set, Tuple, Union
 ## import local files
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
+from ogd.core.managers.SessionFeatureStore import SessionFeatureStore
 from ogd.core.processors.ExtractorProcessor import ExtractorProcessor
+from ogd.core.processors.Processor import EventErrorHandler
+from ogd.core.processors.RowBatch import RowBatch
 from ogd.core.processors.PopulationProcessor import PopulationProcessor
 from ogd.core.processors.PlayerProcessor import PlayerProcessor
 from ogd.core.processors.SessionProcessor import SessionProcessor
 from ogd.common.schemas.games.GameSchema import GameSchema
 from ogd.common.models.Event import Event
+from ogd.common.models.FeatureData import FeatureData
 from ogd.common.utils.Logger import Logger
 from ogd.common.utils.typing import ExportRow
 
@@ -19,9 +23,12 @@ class FeatureManager:
         self._game_schema    : GameSchema                 = game_schema
         self._LoaderClass    : Optional[Type[GeneratorLoader]] = LoaderClass
         self._overrides      : Optional[List[str]]        = feature_overrides
+        # first-order data of sessions whose processors were cleared before their data was handed up to players and population.
+        self._session_store  : SessionFeatureStore        = SessionFeatureStore()
         # local tracking of whether we're up-to-date on getting feature values.
         self._up_to_date     : bool                       = True
-        self._latest_values  : Dict[str,List[ExportRow]]  = {}
+        # the latest lines of each kind of processor, as unformatted batches, so they can be handed to outerfaces as typed columns.
+        self._latest_values  : Dict[str,RowBatch]         = {}
         # local tracking of whether we used null instances in our processor hierarchies or not.
         self._used_null_play : bool                       = False
         self._used_null_sess : Dict[str, bool]            = { "null" : False }
@@ -47,33 +54,80 @@ class FeatureManager:
         else:
             Logger.Log(f"FeatureManager did not set up any Processors, no LoaderClass was given!", logging.WARN, depth=3)
 
-    # TODO: make this function take list of events, and do the loop over events as low in the hierarchy as possible, which technically should be faster.
     def ProcessEvent(self, event:Event) -> None:
-        # 1. process at population level.
-        # NOTE: We don't skip modes that were not requested for final export, because second-order features may need them.
-        if self._population is not None and self._players is not None and self._sessions is not None:
-            self._population.ProcessEvent(event=event)
+        self.ProcessEvents(events=[event])
+
+    def ProcessEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]=None,
+                      restored_sessions:Optional[Mapping[str, List[FeatureData]]]=None) -> None:
+        """Process a batch of events at population, player, and session level.
+
+        The batch is grouped by player and by session once,
+        and each processor then handles all of its events in a single call.
+        Each processor still sees its events in the same order as they appear in the batch.
+
+        :param events: The events to be processed, in order.
+        :type events: List[Event]
+        :param error_handler: Function to handle an error from a single event in one of the processors, after which processing continues.
+            If None, the error is raised. Defaults to None
+        :type error_handler: Optional[EventErrorHandler], optional
+        :param restored_sessions: First-order FeatureData of sessions whose first-order features were already calculated elsewhere (e.g. by a worker process, or in an earlier export), by session ID.
+            The processors of these sessions are restored from the data, rather than calculating first-order features from the events,
+            but their events are still processed by any higher-order session features. If None, no sessions are restored. Defaults to None.
+            Restored sessions need not have any events in the batch, when nothing needs them, see `RestoredSessionsNeedEvents`.
+            Processors of those sessions are added after the sessions with events, with the player ID of their FeatureData.
+        :type restored_sessions: Optional[Mapping[str, List[FeatureData]]], optional
+        """
+        restored_sessions = restored_sessions or {}
+        if self._population is not None and self._players is not None and self._sessions is not None and (len(events) > 0 or len(restored_sessions) > 0):
+            # 0. group the batch by player and session, in order of first appearance.
+            _player_events  : Dict[str, List[Event]]             = {}
+            _session_events : Dict[Tuple[str, str], List[Event]] = {}
+            for event in events:
+                _player_id = event.UserID or "null"
+                _player_events.setdefault(_player_id, []).append(event)
+                _session_events.setdefault((_player_id, event.SessionID), []).append(event)
+            # 1. process at population level.
+            # NOTE: We don't skip modes that were not requested for final export, because second-order features may need them.
+            self._population.ProcessEvents(events=events, error_handler=error_handler)
             # 2. process at player level, adding player if needed.
-            _player_id = event.UserID or "null"
-            if self._LoaderClass is not None and _player_id not in self._players.keys():
-                self._players[_player_id] = PlayerProcessor(LoaderClass=self._LoaderClass, game_schema=self._game_schema,
-                                                            player_id=_player_id,          feature_overrides=self._overrides)
-            if self._LoaderClass is not None and _player_id not in self._sessions.keys():
-                self._sessions[_player_id] = {}
-                self._used_null_sess[_player_id] = False
-
-            self._players[_player_id].ProcessEvent(event=event)
-            if _player_id == "null":
-                self._used_null_play = True
+            for _player_id, _events in _player_events.items():
+                self._addPlayer(player_id=_player_id)
+                self._players[_player_id].ProcessEvents(events=_events, error_handler=error_handler)
+                if _player_id == "null":
+                    self._used_null_play = True
             # 3. process at session level, adding session if needed.
-            if self._LoaderClass is not None and event.SessionID not in self._sessions[_player_id].keys():
-                self._sessions[_player_id][event.SessionID] = SessionProcessor(LoaderClass=self._LoaderClass, game_schema=self._game_schema,
-                                                                    player_id=_player_id,          session_id=event.SessionID,    feature_overrides=self._overrides)
-            self._sessions[_player_id][event.SessionID].ProcessEvent(event=event)
-            if event.SessionID == None or event.SessionID.upper() == "NULL":
-                self._used_null_sess[_player_id] = True
+            for (_player_id, _session_id), _events in _session_events.items():
+                self._addSession(player_id=_player_id, session_id=_session_id, restored=restored_sessions.get(_session_id))
+                self._sessions[_player_id][_session_id].ProcessEvents(events=_events, error_handler=error_handler)
+                if _session_id == None or _session_id.upper() == "NULL":
+                    self._used_null_sess[_player_id] = True
+            # 4. add restored sessions that had no events in the batch, and count them in their player and the population.
+            _batch_sessions = {_session_id for (_, _session_id) in _session_events.keys()}
+            for _session_id, _feature_list in restored_sessions.items():
+                if _session_id not in _batch_sessions:
+                    _player_id = (_feature_list[0].PlayerID if len(_feature_list) > 0 else None) or "null"
+                    self._population.AddSession(session_id=_session_id, player_id=_player_id if _player_id != "null" else None)
+                    self._addPlayer(player_id=_player_id)
+                    self._players[_player_id].AddSession(session_id=_session_id)
+                    self._addSession(player_id=_player_id, session_id=_session_id, restored=_feature_list)
+                    if _player_id == "null":
+                        self._used_null_play = True
             self._up_to_date = False
 
+    def RestoredSessionsNeedEvents(self) -> bool:
+        """Check whether the events of sessions restored from first-order FeatureData are still needed, see ProcessEvents.
+
+        They are needed if any population or player feature is calculated from events,
+        since those features see the events of every session, or if any higher-order session feature is.
+
+        :return: True if restored sessions' events should still be given to ProcessEvents.
+        :rtype: bool
+        """
+        if self._population is None or self._players is None or self._sessions is None:
+            return False
+        return self._population.ListensToEvents() or self._players["null"].ListensToEvents() \
+            or self._sessions["null"]["null"].ListensToEvents(order=2)
+
     def ProcessFeatureData(self) -> None:
         start = datetime.now()
         Logger.Log(f"Processing FeatureData...", logging.INFO, depth=3)
@@ -109,22 +163,33 @@ class FeatureManager:
                     if player is not None:
                         player.ProcessFeatureData(feature_list=sess_data)
                     session.ProcessFeatureData(feature_list=sess_data)
+            # 7. Distribute any stored session data that hasn't been distributed yet,
+            #    i.e. from sessions that were cleared before their data was handed up.
+            _pending_data = self._session_store.TakePending()
+            if len(_pending_data) > 0:
+                self._population.ProcessFeatureData(feature_list=_pending_data)
+                for feature in _pending_data:
+                    player = self._players.get(feature.PlayerID or "null", None)
+                    if player is not None:
+                        player.ProcessFeatureData(feature_list=[feature])
             Logger.Log(f"Time to process FeatureData: {datetime.now() - start}", logging.INFO, depth=3)
         else:
             Logger.Log(f"Skipped second-order FeatureData processing, no feature Processors available!", logging.INFO, depth=3)
 
     def GetFeatureValues(self, as_str:bool = False) -> Dict[str, List[ExportRow]]:
         start = datetime.now()
-        self._try_update(as_str=as_str)
+        self._try_update()
         Logger.Log(f"Time to retrieve all feature values: {datetime.now() - start}", logging.INFO, depth=2)
-        return self._latest_values
+        return { kind : batch.AsStrings() for kind, batch in self._latest_values.items() }
 
     def GetPopulationFeatureNames(self) -> List[str]:
         return self._population.GeneratorNames if self._population is not None else []
     def GetPopulationFeatures(self, as_str:bool = False) -> List[ExportRow]:
+        return self.GetPopulationBatch().AsStrings()
+    def GetPopulationBatch(self) -> RowBatch:
         start = datetime.now()
-        self._try_update(as_str=as_str)
-        ret_val = self._latest_values.get('population', [])
+        self._try_update()
+        ret_val = self._latest_values.get('population', RowBatch.FromRows([]))
         Logger.Log(f"Time to retrieve Population lines: {datetime.now() - start} to get {len(ret_val)} lines", logging.INFO, depth=2)
         return ret_val
 
@@ -132,36 +197,49 @@ class FeatureManager:
         return self._players["null"].GeneratorNames if self._players is not None else []
     
     def GetPlayerFeatures(self, as_str:bool = False) -> List[ExportRow]:
+        return self.GetPlayerBatch().AsStrings()
+    def GetPlayerBatch(self) -> RowBatch:
         start   : datetime = datetime.now()
-        self._try_update(as_str=as_str)
-        ret_val = self._latest_values.get('players', [])
+        self._try_update()
+        ret_val = self._latest_values.get('players', RowBatch.FromRows([]))
         Logger.Log(f"Time to retrieve Player lines: {datetime.now() - start} to get {len(ret_val)} lines", logging.INFO, depth=2)
         return ret_val
 
     def GetSessionFeatureNames(self) -> List[str]:
         return self._sessions["null"]["null"].GeneratorNames if self._sessions is not None else []
     def GetSessionFeatures(self, slice_num:int, slice_count:int, as_str:bool = False) -> List[ExportRow]:
+        return self.GetSessionBatch(slice_num=slice_num, slice_count=slice_count).AsStrings()
+    def GetSessionBatch(self, slice_num:int, slice_count:int) -> RowBatch:
         start   : datetime = datetime.now()
-        self._try_update(as_str=as_str)
-        ret_val = self._latest_values.get('sessions', [])
+        self._try_update()
+        ret_val = self._latest_values.get('sessions', RowBatch.FromRows([]))
         time_delta = datetime.now() - start
         Logger.Log(f"Time to retrieve Session lines for slice [{slice_num}/{slice_count}]: {time_delta} to get {len(ret_val)} lines", logging.INFO, depth=2)
         return ret_val
     
+
     #new
     # def GetPopulationFeatureData(self) -> List[FeatureData]:
     #     if self._population is not None:
     #         population_data = self._population.GetFeatureData(order=1)
     #     return population_data if self._population is not None else []
-    
-    # def GetSessionFeatureData(self) -> List[FeatureData]:
-    #     session_data=[]
-    #     if self._sessions is not None:
-    #         for sess_list in self._sessions.values():
-    #             for session in sess_list.values():
-    #                  session_data += session.GetFeatureData(order=1)
-    #     return session_data
-    
+
+    def GetSessionFeatureData(self) -> List[FeatureData]:
+        """Get the first-order FeatureData of all sessions currently held by the manager.
+
+        The "null" session is only included if it actually received events.
+
+        :return: A list of first-order FeatureData, for every session.
+        :rtype: List[FeatureData]
+        """
+        session_data : List[FeatureData] = []
+        if self._sessions is not None:
+            for player_name,sess_list in self._sessions.items():
+                for session_id,session in sess_list.items():
+                    if session_id != "null" or self._used_null_sess.get(player_name, False):
+                        session_data += session.GetFeatureData(order=1)
+        return session_data
+
 
     def ClearPopulationLines(self) -> None:
         if self._population is not None:
@@ -174,7 +252,14 @@ class FeatureManager:
             self._players["null"] = PlayerProcessor(LoaderClass=self._LoaderClass, game_schema=self._game_schema,
                                                     player_id="null", feature_overrides=self._overrides)
     def ClearSessionLines(self) -> None:
+        """Discard all session processors.
+
+        If the sessions' latest data was not yet handed up to the player and population processors,
+        their first-order FeatureData is kept in the session store, and handed up at the next update.
+        """
         if self._sessions is not None and self._LoaderClass is not None:
+            if not self._up_to_date:
+                self._session_store.Add(feature_list=self.GetSessionFeatureData())
             for sess_list in self._sessions.values():
                 for sess in sess_list.values():
                     sess.ClearLines()
@@ -184,6 +269,22 @@ class FeatureManager:
                                         player_id="null", session_id="null", feature_overrides=self._overrides)
             }
 
+    def _addPlayer(self, player_id:str) -> None:
+        if self._players is not None and self._sessions is not None and self._LoaderClass is not None:
+            if player_id not in self._players.keys():
+                self._players[player_id] = PlayerProcessor(LoaderClass=self._LoaderClass, game_schema=self._game_schema,
+                                                           player_id=player_id,           feature_overrides=self._overrides)
+            if player_id not in self._sessions.keys():
+                self._sessions[player_id] = {}
+                self._used_null_sess[player_id] = False
+
+    def _addSession(self, player_id:str, session_id:str, restored:Optional[List[FeatureData]]) -> None:
+        if self._sessions is not None and self._LoaderClass is not None and session_id not in self._sessions[player_id].keys():
+            self._sessions[player_id][session_id] = SessionProcessor(LoaderClass=self._LoaderClass, game_schema=self._game_schema,
+                                                                     player_id=player_id,           session_id=session_id,         feature_overrides=self._overrides)
+            if restored is not None:
+                self._sessions[player_id][session_id].RestoreFeatureData(feature_list=restored)
+
     def _flatHierarchy(self) -> List[ExtractorProcessor]:
         ret_val : List[ExtractorProcessor] = []
         if self._population is not None:
@@ -195,17 +296,17 @@ class FeatureManager:
                 ret_val += sess_list.values()
         return ret_val
 
-    def _try_update(self, as_str:bool = False):
+    def _try_update(self):
         if not self._up_to_date:
             self.ProcessFeatureData()
             # for some reason, this didn't work as sum over list of lists, so get sessions manually with a normal loop:
-            list_o_playlists : List[List[ExportRow]]       = [player.Lines for player_id,player in self._players.items() if (player_id != "null" or self._used_null_play)] if self._players is not None else []
+            list_o_playlists : List[List[ExportRow]]       = [player.Rows for player_id,player in self._players.items() if (player_id != "null" or self._used_null_play)] if self._players is not None else []
             flat_playlist    : List[ExportRow]             = list(itertools.chain.from_iterable(list_o_playlists))
-            list_o_sesslists : List[List[List[ExportRow]]] = [[session.Lines for session_id,session in session_list.items() if (session_id != "null" or self._used_null_sess[player_name])] for player_name,session_list in self._sessions.items()] if self._sessions is not None else []
+            list_o_sesslists : List[List[List[ExportRow]]] = [[session.Rows for session_id,session in session_list.items() if (session_id != "null" or self._used_null_sess[player_name])] for player_name,session_list in self._sessions.items()] if self._sessions is not None else []
             flat_sesslist    : List[ExportRow]             = list(itertools.chain.from_iterable(itertools.chain.from_iterable(list_o_sesslists)))
             self._latest_values = {
-                "population" : self._population.Lines if self._population is not None else [],
-                "players"    : flat_playlist,
-                "sessions"   : flat_sesslist
+                "population" : self._population.Batch if self._population is not None else RowBatch.FromRows([]),
+                "players"    : RowBatch.FromRows(flat_playlist),
+                "sessions"   : RowBatch.FromRows(flat_sesslist)
             }
             self._up_to_date = True
@@ -0,0 +1,283 @@
+## import standard libraries
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+## import local files
+from ogd import games
+from ogd.core import generators
+from ogd.core.interfaces.SourceStats import SessionStats
+from ogd.common.models.Event import Event
+from ogd.common.models.FeatureData import FeatureData
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+from ogd.common.utils.Logger import Logger
+
+class SessionCache:
+    """Local cache of each session's computed features, for incremental exports.
+
+    For every session it has seen, the cache keeps a manifest entry, with the session's event count and latest event timestamp,
+    along with the session's first-order FeatureData.
+    Entries are keyed by game, schema hash, and session ID, where the schema hash covers the game's schema,
+    its feature code, and any feature overrides, so entries are not reused after the features change.
+
+    Only first-order features are cached, since they depend on nothing but the session's own events.
+    Second-order features may depend on other sessions, players, or the whole population,
+    so they are calculated again in every export, from the cached first-order data.
+
+    The cache is stored in a SQLite database in the configured cache directory.
+    FeatureData is stored as JSON, so reading the cache never runs code.
+    Feature values that JSON has no type for (dicts with non-string keys, defaultdicts, tuples, sets, dates and times) are stored as tagged objects,
+    and sessions with values of any other type are not cached.
+    """
+
+    # version of the database layout; databases from before FeatureData was stored as JSON are cleared when opened.
+    _DB_VERSION : int = 2
+    # the most session IDs given to one query, to stay well under SQLite's limit on query parameters.
+    _QUERY_SIZE : int = 500
+    _TAG        : str = "__ogd_type__"
+    # the default factories of defaultdicts that can be stored, by name.
+    _FACTORIES  : Dict[str, type] = {factory.__name__ : factory for factory in (list, dict, set, tuple, int, float, str)}
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, cache_dir:Path, game_id:str, schema_hash:str):
+        self._path        : Path = Path(cache_dir) / "session_cache.sqlite"
+        self._game_id     : str  = game_id
+        self._schema_hash : str  = schema_hash
+        self._db          : Optional[sqlite3.Connection] = None
+        # slices may be checked by a prefetch thread, so access to the database is locked.
+        self._lock        : threading.Lock = threading.Lock()
+        self._hits        : int  = 0
+        self._misses      : int  = 0
+        self._stored      : int  = 0
+
+    def __str__(self) -> str:
+        return f"SessionCache({self._game_id}, schema {self._schema_hash[:8]}, {self._path})"
+
+    @property
+    def Stats(self) -> Dict[str, int]:
+        """Counts of sessions served from the cache (hits), sessions that had to be processed (misses), and sessions written to the cache."""
+        return {"hits" : self._hits, "misses" : self._misses, "stored" : self._stored}
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def SchemaHash(game_id:str, feature_overrides:Optional[List[str]]) -> str:
+        """Hash everything that determines how a game's session features are computed:
+        the game's schema and feature code, the shared generator code, and the feature overrides of the request.
+
+        :param game_id: The game being exported.
+        :type game_id: str
+        :param feature_overrides: The request's feature overrides, if any.
+        :type feature_overrides: Optional[List[str]]
+        :return: A hex digest identifying the feature definitions.
+        :rtype: str
+        """
+        _games_path = Path(games.__file__) if Path(games.__file__).is_dir() else Path(games.__file__).parent
+        _gen_path   = Path(generators.__file__).parent
+        _files = sorted((_games_path / game_id).rglob("*.py")) + sorted(_gen_path.rglob("*.py")) \
+               + sorted((_games_path / game_id / "schemas").glob("*.json*"))
+        ret_val = hashlib.sha256()
+        ret_val.update(json.dumps(sorted(feature_overrides) if feature_overrides is not None else None).encode())
+        for path in _files:
+            ret_val.update(str(path.relative_to(_games_path.parent)).encode())
+            ret_val.update(path.read_bytes())
+        return ret_val.hexdigest()
+
+    @staticmethod
+    def StatsFromEvents(events:Iterable[Event]) -> Dict[str, SessionStats]:
+        """Work out the manifest entry of each session with events in the given list.
+        This is only for events that were already retrieved, the state of sessions at the source should be checked with `SourceStats` instead.
+
+        :param events: The events of one or more sessions.
+        :type events: Iterable[Event]
+        :return: A mapping from session IDs to their event counts and latest timestamps.
+        :rtype: Dict[str, SessionStats]
+        """
+        _counts : Dict[str, int] = {}
+        _latest : Dict[str, str] = {}
+        for event in events:
+            _sess_id = event.SessionID
+            _counts[_sess_id] = _counts.get(_sess_id, 0) + 1
+            _time = event.Timestamp.isoformat()
+            if _time > _latest.get(_sess_id, ""):
+                _latest[_sess_id] = _time
+        return {sess_id : (count, _latest[sess_id]) for sess_id, count in _counts.items()}
+
+    # *** PUBLIC METHODS ***
+
+    def Open(self) -> None:
+        """Open the cache database, creating it if needed, and drop any entries of the game made with a different schema hash."""
+        self._path.parent.mkdir(exist_ok=True, parents=True)
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < SessionCache._DB_VERSION:
+            # earlier versions of the cache stored pickled FeatureData, and before that also output lines, which could hold stale second-order values.
+            self._db.execute("DROP TABLE IF EXISTS sessions")
+            self._db.execute("DROP TABLE IF EXISTS session_features")
+            self._db.execute(f"PRAGMA user_version = {SessionCache._DB_VERSION}")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS session_features (
+                                game TEXT, schema_hash TEXT, session_id TEXT, player_id TEXT,
+                                event_count INTEGER, max_time TEXT, feature_data TEXT,
+                                PRIMARY KEY (game, schema_hash, session_id))""")
+        _dropped = self._db.execute("DELETE FROM session_features WHERE game = ? AND schema_hash != ?", (self._game_id, self._schema_hash)).rowcount
+        self._db.commit()
+        if _dropped > 0:
+            Logger.Log(f"Dropped {_dropped} cached {self._game_id} sessions, which were computed with different feature definitions.", logging.INFO, depth=2)
+
+    def Close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+        Logger.Log(f"Session cache {self._path}: {self._hits} sessions reused, {self._misses} processed, {self._stored} stored.", logging.INFO, depth=2)
+
+    def Unchanged(self, session_stats:Mapping[str, SessionStats]) -> Set[str]:
+        """Find which of the given sessions have the same event count and latest timestamp as in the manifest.
+
+        :param session_stats: The current manifest entry of each session.
+        :type session_stats: Mapping[str, SessionStats]
+        :return: The IDs of sessions whose cached features can be reused.
+        :rtype: Set[str]
+        """
+        ret_val : Set[str] = set()
+        with self._lock:
+            if self._db is not None:
+                for sess_id, count, max_time in self._select(columns="session_id, event_count, max_time", session_ids=list(session_stats.keys())):
+                    if (count, max_time) == tuple(session_stats[sess_id]):
+                        ret_val.add(sess_id)
+            self._hits   += len(ret_val)
+            self._misses += len(session_stats) - len(ret_val)
+        return ret_val
+
+    def Load(self, session_ids:Iterable[str]) -> Dict[str, List[FeatureData]]:
+        """Get the cached first-order FeatureData of the given sessions.
+
+        :param session_ids: The IDs of sessions to load, which should have been returned by `Unchanged`.
+        :type session_ids: Iterable[str]
+        :return: The FeatureData of each session that was found, by session ID.
+        :rtype: Dict[str, List[FeatureData]]
+        """
+        ret_val : Dict[str, List[FeatureData]] = {}
+        with self._lock:
+            if self._db is not None:
+                for sess_id, player_id, feature_data in self._select(columns="session_id, player_id, feature_data", session_ids=list(session_ids)):
+                    try:
+                        ret_val[sess_id] = SessionCache._fromJSON(text=feature_data, player_id=player_id, session_id=sess_id)
+                    except (ValueError, TypeError, KeyError) as err:
+                        Logger.Log(f"Could not read cached features of session {sess_id}, it will be processed again:\n{err}", logging.WARN, depth=3)
+        return ret_val
+
+    def Store(self, sessions:Mapping[str, List[FeatureData]], session_stats:Mapping[str, SessionStats]) -> None:
+        """Add or replace the entries of the given sessions in the cache.
+        Sessions without a manifest entry, or with feature values that can't be stored, are not cached.
+
+        :param sessions: The first-order FeatureData of each session, by session ID.
+        :type sessions: Mapping[str, List[FeatureData]]
+        :param session_stats: The event count and latest timestamp of each session.
+        :type session_stats: Mapping[str, SessionStats]
+        """
+        _rows : List[Tuple[str, str, str, str, int, str, str]] = []
+        for sess_id, feature_data in sessions.items():
+            _stats = session_stats.get(sess_id)
+            if _stats is None or len(feature_data) == 0:
+                continue
+            try:
+                _text = SessionCache._toJSON(feature_data)
+            except (TypeError, ValueError) as err:
+                Logger.Log(f"Features of session {sess_id} could not be cached, it will be processed again next time:\n{err}", logging.DEBUG, depth=3)
+                continue
+            _rows.append((self._game_id, self._schema_hash, sess_id, feature_data[0].PlayerID or "null", _stats[0], _stats[1], _text))
+        with self._lock:
+            if self._db is not None:
+                self._db.executemany("INSERT OR REPLACE INTO session_features VALUES (?, ?, ?, ?, ?, ?, ?)", _rows)
+                self._stored += len(_rows)
+
+    def Commit(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _toJSON(feature_data:List[FeatureData]) -> str:
+        # player and session IDs are the same for every feature of a session, so they are stored in their own columns.
+        return json.dumps([[feature.Name, feature.FeatureType, feature.CountIndex, feature.FeatureNames,
+                            SessionCache._encode(feature.FeatureValues), feature.ExportMode.name]
+                           for feature in feature_data])
+
+    @staticmethod
+    def _fromJSON(text:str, player_id:Optional[str], session_id:str) -> List[FeatureData]:
+        return [FeatureData(name=name, feature_type=feature_type, count_index=count_index, cols=cols,
+                            vals=SessionCache._decode(vals), mode=ExtractionMode[mode], player_id=player_id, sess_id=session_id)
+                for name, feature_type, count_index, cols, vals, mode in json.loads(text)]
+
+    @staticmethod
+    def _encode(value:Any) -> Any:
+        """Turn a feature value into something JSON can hold, keeping enough type information for `_decode` to give back an equal value.
+        Types are checked exactly, so subclasses (such as enums, or numpy numbers) are not silently turned into their base types.
+        """
+        _type = type(value)
+        if value is None or _type in (bool, int, float, str):
+            return value
+        elif _type == list:
+            return [SessionCache._encode(item) for item in value]
+        elif _type == dict:
+            return {SessionCache._TAG : "dict", "items" : [[SessionCache._encode(key), SessionCache._encode(item)] for key, item in value.items()]}
+        elif _type == defaultdict and value.default_factory in SessionCache._FACTORIES.values():
+            return {SessionCache._TAG : "defaultdict", "factory" : value.default_factory.__name__,
+                    "items" : [[SessionCache._encode(key), SessionCache._encode(item)] for key, item in value.items()]}
+        elif _type in (tuple, set, frozenset):
+            return {SessionCache._TAG : _type.__name__, "items" : [SessionCache._encode(item) for item in value]}
+        elif _type in (datetime, date):
+            return {SessionCache._TAG : _type.__name__, "value" : value.isoformat()}
+        elif _type == timedelta:
+            return {SessionCache._TAG : "timedelta", "value" : [value.days, value.seconds, value.microseconds]}
+        else:
+            raise TypeError(f"Feature value {value!r} has type {_type.__name__}, which can't be stored in the session cache")
+
+    @staticmethod
+    def _decode(value:Any) -> Any:
+        if type(value) == list:
+            return [SessionCache._decode(item) for item in value]
+        elif type(value) != dict:
+            return value
+        match value[SessionCache._TAG]:
+            case "dict":
+                return {SessionCache._decode(key) : SessionCache._decode(item) for key, item in value["items"]}
+            case "defaultdict":
+                return defaultdict(SessionCache._FACTORIES[value["factory"]],
+                                   {SessionCache._decode(key) : SessionCache._decode(item) for key, item in value["items"]})
+            case "tuple":
+                return tuple(SessionCache._decode(item) for item in value["items"])
+            case "set":
+                return {SessionCache._decode(item) for item in value["items"]}
+            case "frozenset":
+                return frozenset(SessionCache._decode(item) for item in value["items"])
+            case "datetime":
+                return datetime.fromisoformat(value["value"])
+            case "date":
+                return date.fromisoformat(value["value"])
+            case "timedelta":
+                return timedelta(days=value["value"][0], seconds=value["value"][1], microseconds=value["value"][2])
+            case _tag:
+                raise ValueError(f"Unknown type {_tag} in cached feature value")
+
+    # *** PRIVATE METHODS ***
+
+    def _select(self, columns:str, session_ids:List[str]) -> List[Tuple[Any, ...]]:
+        """Get the given columns of the cached entries of many sessions, in queries of up to `_QUERY_SIZE` sessions. Expects the lock to be held."""
+        ret_val : List[Tuple[Any, ...]] = []
+        if self._db is not None:
+            for start in range(0, len(session_ids), SessionCache._QUERY_SIZE):
+                _ids = session_ids[start:start + SessionCache._QUERY_SIZE]
+                ret_val += self._db.execute(f"SELECT {columns} FROM session_features WHERE game = ? AND schema_hash = ? "
+                                            f"AND session_id IN ({','.join(['?'] * len(_ids))})",
+                                            (self._game_id, self._schema_hash, *_ids)).fetchall()
+        return ret_val
@@ -0,0 +1,85 @@
+## import standard libraries
+from typing import Any, Dict, List, Optional, Tuple
+## import local files
+from ogd.common.models.FeatureData import FeatureData
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+
+# The parts of a FeatureData that are the same for every session: name, feature type, count index, columns, and mode.
+Layout = Tuple[Tuple[str, str, Optional[int], Tuple[str, ...], ExtractionMode], ...]
+
+class SessionFeatureStore:
+    """Compact store for the first-order FeatureData of discarded session processors, until it is handed up to the player and population processors.
+
+    Every session processor in an export has the same set of features,
+    so the feature names, types, count indices and columns are stored once, as a shared layout,
+    and each session only stores its player ID, session ID, and a tuple of feature values.
+    Sessions are only held until their data is taken with TakePending, so the store never holds more than the sessions cleared since the last update.
+    """
+    class _Row:
+        __slots__ = ("player_id", "session_id", "layout", "values")
+
+        def __init__(self, player_id:Optional[str], session_id:Optional[str], layout:int, values:Tuple[List[Any], ...]):
+            self.player_id  = player_id
+            self.session_id = session_id
+            self.layout     = layout
+            self.values     = values
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self):
+        self._layouts      : List[Layout]      = []
+        self._layout_index : Dict[Layout, int] = {}
+        self._rows         : List[SessionFeatureStore._Row] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __str__(self) -> str:
+        return f"SessionFeatureStore({len(self._rows)} sessions pending, {len(self._layouts)} layouts)"
+
+    # *** PUBLIC METHODS ***
+
+    def Add(self, feature_list:List[FeatureData]) -> None:
+        """Store the first-order FeatureData of one or more sessions, until it is taken with TakePending.
+
+        :param feature_list: The FeatureData to store. Consecutive FeatureData with the same player and session ID are treated as one session.
+        :type feature_list: List[FeatureData]
+        """
+        _start = 0
+        for i in range(1, len(feature_list) + 1):
+            if i == len(feature_list) \
+            or (feature_list[i].PlayerID, feature_list[i].SessionID) != (feature_list[_start].PlayerID, feature_list[_start].SessionID):
+                self._addSession(feature_list=feature_list[_start:i])
+                _start = i
+
+    def TakePending(self) -> List[FeatureData]:
+        """Get the data of every stored session, in the order it was added, and remove it from the store.
+
+        :return: The FeatureData of the stored sessions.
+        :rtype: List[FeatureData]
+        """
+        ret_val : List[FeatureData] = []
+        for row in self._rows:
+            ret_val += self._unpack(row)
+        self._rows = []
+        return ret_val
+
+    # *** PRIVATE METHODS ***
+
+    def _addSession(self, feature_list:List[FeatureData]) -> None:
+        if len(feature_list) == 0:
+            return
+        _layout : Layout = tuple((feature.Name, feature.FeatureType, feature.CountIndex, tuple(feature.FeatureNames), feature.ExportMode) for feature in feature_list)
+        _layout_id = self._layout_index.get(_layout)
+        if _layout_id is None:
+            _layout_id = self._layout_index[_layout] = len(self._layouts)
+            self._layouts.append(_layout)
+        self._rows.append(SessionFeatureStore._Row(player_id=feature_list[0].PlayerID, session_id=feature_list[0].SessionID,
+                                                   layout=_layout_id, values=tuple(feature.FeatureValues for feature in feature_list)))
+
+    def _unpack(self, row:_Row) -> List[FeatureData]:
+        return [
+            FeatureData(name=name, feature_type=feature_type, count_index=count_index, cols=list(cols), vals=vals, mode=mode,
+                        player_id=row.player_id, sess_id=row.session_id)
+            for (name, feature_type, count_index, cols, mode), vals in zip(self._layouts[row.layout], row.values)
+        ]
@@ -16,10 +16,13 @@ class DetectorProcessor(GeneratorProcessor):
 
     def __init__(self, game_schema: GameSchema, LoaderClass: Type[GeneratorLoader], trigger_callback:Callable[[Event], None],
                  feature_overrides:Optional[List[str]]=None):
-        # TODO: Consider having multiple registries for per-player or per-session kinds of things.
         super().__init__(game_schema=game_schema, LoaderClass=LoaderClass, feature_overrides=feature_overrides)
-        self._registry = DetectorRegistry(mode=self._mode, trigger_callback=trigger_callback)
-        self._registry.LoadFromSchema(schema=game_schema, loader=self._loader, overrides=feature_overrides)
+        self._trigger_callback : Callable[[Event], None] = trigger_callback
+        # Each session gets its own detectors, stamped from the registry template, so detector state never leaks between sessions,
+        # and sessions may be processed in any order, or interleaved.
+        # The first registry compiles the template, and stands in for the detectors when no session is active.
+        self._registry = self._newRegistry()
+        self._sessions : Dict[Optional[str], DetectorRegistry] = {}
 
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
@@ -39,22 +42,42 @@ class DetectorProcessor(GeneratorProcessor):
         raise NotImplementedError("Function stub! Haven't written name getter for detector processor.")
 
     def _processEvent(self, event:Event):
-        if self._registry is not None:
-            self._registry.UpdateFromEvent(event)
+        _registry = self._sessions.get(event.SessionID)
+        if _registry is None:
+            _registry = self._sessions[event.SessionID] = self._newRegistry()
+        _registry.UpdateFromEvent(event)
 
     def _getLines(self) -> List[ExportRow]:
         return []
 
     def _clearLines(self):
-        if self._registry is not None:
-            self._registry.LoadFromSchema(schema=self._game_schema, loader=self._loader, overrides=self._overrides)
+        self._sessions = {}
 
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
 
+    def FinishSession(self, session_id:Optional[str]) -> None:
+        """Free the detectors of a session once all of its events have been processed.
+
+        If more events of the session arrive later, they go to a fresh set of detectors.
+
+        :param session_id: The ID of the finished session.
+        :type session_id: Optional[str]
+        """
+        self._sessions.pop(session_id, None)
+
     # *** PROPERTIES ***
 
+    @property
+    def ActiveSessions(self) -> int:
+        return len(self._sessions)
+
     # *** PRIVATE STATICS ***
 
     # *** PRIVATE METHODS ***
+
+    def _newRegistry(self) -> DetectorRegistry:
+        ret_val = DetectorRegistry(mode=self._mode, trigger_callback=self._trigger_callback)
+        ret_val.LoadFromSchema(schema=self._game_schema, loader=self._loader, overrides=self._overrides)
+        return ret_val
@@ -39,6 +39,24 @@ class ExtractorProcessor(GeneratorProcessor):
         # TODO: add error handling code, if applicable.
         return self._getFeatureData(order=order)
 
+    def RestoreFeatureData(self, feature_list:List[FeatureData]) -> None:
+        """Restore the processor's first-order features from FeatureData calculated earlier, see ExtractorRegistry.RestoreFeatureData.
+
+        :param feature_list: First-order FeatureData, as returned by GetFeatureData(order=1) of an earlier processor for the same data.
+        :type feature_list: List[FeatureData]
+        """
+        self._registry.RestoreFeatureData(feature_list=feature_list)
+
+    def ListensToEvents(self, order:Optional[int]=None) -> bool:
+        """Check whether any of the processor's features is calculated from events, see ExtractorRegistry.ListensToEvents.
+
+        :param order: The order of features to check, counting from 1, or None to check features of every order. Defaults to None
+        :type order: Optional[int], optional
+        :return: True if any feature of the given order(s) takes events.
+        :rtype: bool
+        """
+        return self._registry.ListensToEvents(order=order)
+
     # *** PRIVATE STATICS ***
 
     # *** PRIVATE METHODS ***
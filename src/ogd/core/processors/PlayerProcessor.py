@@ -6,6 +6,7 @@ from typing import List, Dict, Type, Optional, Set
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.registries.ExtractorRegistry import ExtractorRegistry
 from ogd.core.processors.ExtractorProcessor import ExtractorProcessor
+from ogd.core.processors.Processor import EventErrorHandler
 from ogd.core.processors.SessionProcessor import SessionProcessor
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExportMode import ExportMode
@@ -80,6 +81,10 @@ class PlayerProcessor(ExtractorProcessor):
         self._sessions.add(event.SessionID)
         self._registry.UpdateFromEvent(event=event)
 
+    def _processEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]):
+        self._sessions.update(event.SessionID for event in events)
+        self._registry.UpdateFromEvents(events=events, error_handler=error_handler)
+
     def _getLines(self) -> List[ExportRow]:
         ret_val : ExportRow
         # if as_str:
@@ -103,6 +108,15 @@ class PlayerProcessor(ExtractorProcessor):
 
     # *** PUBLIC METHODS ***
 
+    def AddSession(self, session_id:str) -> None:
+        """Count a session among the player's sessions, without processing any of its events,
+        such as a session restored from cached features, whose events were not retrieved.
+
+        :param session_id: The ID of the session.
+        :type session_id: str
+        """
+        self._sessions.add(session_id)
+
     # *** PROPERTIES ***
 
     # *** PRIVATE STATICS ***
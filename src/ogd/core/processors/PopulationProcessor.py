@@ -6,6 +6,7 @@ from ogd.common.models.FeatureData import FeatureData
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.registries.ExtractorRegistry import ExtractorRegistry
 from ogd.core.processors.ExtractorProcessor import ExtractorProcessor
+from ogd.core.processors.Processor import EventErrorHandler
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.schemas.games.GameSchema import GameSchema
@@ -75,6 +76,11 @@ class PopulationProcessor(ExtractorProcessor):
         self._sessions.add(event.SessionID)
         self._registry.UpdateFromEvent(event=event)
 
+    def _processEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]):
+        self._players.update(event.UserID for event in events if event.UserID)
+        self._sessions.update(event.SessionID for event in events)
+        self._registry.UpdateFromEvents(events=events, error_handler=error_handler)
+
     def _getLines(self) -> List[ExportRow]:
         ret_val : ExportRow
         # if as_str:
@@ -97,6 +103,19 @@ class PopulationProcessor(ExtractorProcessor):
 
     # *** PUBLIC METHODS ***
 
+    def AddSession(self, session_id:str, player_id:Optional[str]) -> None:
+        """Count a session, and its player, in the population, without processing any of its events,
+        such as a session restored from cached features, whose events were not retrieved.
+
+        :param session_id: The ID of the session.
+        :type session_id: str
+        :param player_id: The ID of the session's player, if it has one.
+        :type player_id: Optional[str]
+        """
+        if player_id:
+            self._players.add(player_id)
+        self._sessions.add(session_id)
+
     # *** PROPERTIES ***
 
     # *** PRIVATE STATICS ***
@@ -1,15 +1,17 @@
 ## import standard libraries
 import abc
-import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Type, Optional
+from typing import Any, Callable, Dict, List, Type, Optional
 # import locals
 from ogd.common.models.FeatureData import FeatureData
 from ogd.common.schemas.games.GameSchema import GameSchema
 from ogd.common.models.Event import Event
 from ogd.common.utils.typing import ExportRow
 from ogd.common.utils.utils import Logger
+from ogd.core.processors.RowBatch import RowBatch
+
+# Function to handle an error raised while processing one event from a batch of events.
+EventErrorHandler = Callable[[Event, Exception], None]
 
 ## @class Processor
 class Processor(abc.ABC):
@@ -44,17 +46,41 @@ class Processor(abc.ABC):
     def ProcessEvent(self, event:Event) -> None:
         # TODO: add error handling code, if applicable.
         self._processEvent(event=event)
+
+    def ProcessEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]=None) -> None:
+        """Process a batch of events, in order.
+
+        :param events: The events to be processed.
+        :type events: List[Event]
+        :param error_handler: Function to handle an error from a single event, after which processing continues with the next event.
+            If None, the error is raised, and the rest of the batch is not processed. Defaults to None
+        :type error_handler: Optional[EventErrorHandler], optional
+        """
+        self._processEvents(events=events, error_handler=error_handler)
     
     @property
-    def Lines(self) -> List[ExportRow]:
-        ret_val : List[ExportRow] = []
+    def Rows(self) -> List[ExportRow]:
+        """The processor's current lines, as rows of unformatted values.
 
-        # TODO: Should do list of events instead, and put it on outerface to do this part.
-        # When retrieving lines, ensure all lines have values in appropriate format for output to file/web response/whatever.
-        _dumps_default = lambda x : x.isoformat() if isinstance(x, datetime) else str(x)
-        ret_val = [[json.dumps(_col, default=_dumps_default) for _col in _line] for _line in self._getLines()]
+        :return: The lines, with each value as calculated.
+        :rtype: List[ExportRow]
+        """
+        return self._getLines()
+
+    @property
+    def Batch(self) -> RowBatch:
+        """The processor's current lines, as a typed, columnar batch of unformatted values.
+
+        :return: The lines, as a RowBatch.
+        :rtype: RowBatch
+        """
+        return RowBatch.FromRows(self.Rows)
 
-        return ret_val
+    @property
+    def Lines(self) -> List[ExportRow]:
+        # When retrieving lines, ensure all lines have values in appropriate format for output to file/web response/whatever.
+        # Each column is formatted as a whole, giving the same text as json.dumps on each value, with datetimes as ISO strings.
+        return self.Batch.AsStrings()
 
     def ClearLines(self):
         self._clearLines()
@@ -62,3 +88,20 @@ class Processor(abc.ABC):
     # *** PRIVATE STATICS ***
 
     # *** PRIVATE METHODS ***
+
+    def _processEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]) -> None:
+        """Base function to process a batch of events, which just processes each one in turn.
+        Subclasses may override this to handle the whole batch at once.
+
+        :param events: The events to be processed.
+        :type events: List[Event]
+        :param error_handler: Function to handle an error from a single event, or None to raise errors.
+        :type error_handler: Optional[EventErrorHandler]
+        """
+        for event in events:
+            try:
+                self._processEvent(event=event)
+            except Exception as err:
+                if error_handler is None:
+                    raise err
+                error_handler(event, err)
@@ -0,0 +1,157 @@
+## import standard libraries
+import json
+import math
+from datetime import datetime
+from enum import IntEnum
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+# import locals
+from ogd.common.utils.typing import ExportRow
+
+class ColumnType(IntEnum):
+    """The type of the values in a column of a RowBatch.
+
+    A column is only given a specific type if every non-null value in it has exactly that type,
+    anything else is treated as a generic JSON column.
+    """
+    NULL     = 0
+    INT      = 1
+    FLOAT    = 2
+    STR      = 3
+    BOOL     = 4
+    DATETIME = 5
+    JSON     = 6
+
+def _dumpsDefault(value:Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def _formatFloat(value:float) -> str:
+    # Matches the float formatting of the json module, including its non-standard NaN and Infinity.
+    if value != value:
+        return "NaN"
+    elif math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+def _nullable(formatter:Callable[[Any], str]) -> Callable[[Any], str]:
+    return lambda value : "null" if value is None else formatter(value)
+
+# Formatter for each ColumnType, in order of the enum values.
+# Each gives the same text as json.dumps(value, default=_dumpsDefault) for any value a column of that type can hold.
+_FORMATTERS : List[Callable[[Any], str]] = [
+    lambda value : "null",                                                 # NULL
+    _nullable(int.__repr__),                                               # INT
+    _nullable(_formatFloat),                                               # FLOAT
+    _nullable(encode_basestring_ascii),                                    # STR
+    _nullable(lambda value : "true" if value else "false"),                # BOOL
+    _nullable(lambda value : encode_basestring_ascii(value.isoformat())),  # DATETIME
+    json.JSONEncoder(default=_dumpsDefault).encode,                        # JSON
+]
+
+## @class RowBatch
+class RowBatch:
+    """Typed, columnar representation of a batch of output rows.
+
+    Processors build their rows as lists of Python values.
+    RowBatch transposes those into columns, works out a type for each column once,
+    and formats each column with a function specialized for its type,
+    rather than calling `json.dumps` on every cell.
+    The formatted text is exactly what `json.dumps` would give for each value,
+    with datetimes written as ISO strings and any other non-JSON value written with `str`.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, columns:List[Sequence[Any]], row_count:int, column_names:Optional[List[str]]=None):
+        self._columns      : List[Sequence[Any]] = columns
+        self._row_count    : int                 = row_count
+        self._column_names : Optional[List[str]] = column_names
+        self._types        : Optional[List[ColumnType]] = None
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def __str__(self) -> str:
+        return f"RowBatch({self._row_count} rows, {len(self._columns)} columns)"
+
+    @property
+    def Columns(self) -> List[Sequence[Any]]:
+        return self._columns
+
+    @property
+    def ColumnNames(self) -> Optional[List[str]]:
+        return self._column_names
+
+    @property
+    def ColumnTypes(self) -> List[ColumnType]:
+        """The type of each column, worked out from its values the first time it is requested."""
+        if self._types is None:
+            self._types = [RowBatch._columnType(column) for column in self._columns]
+        return self._types
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def FromRows(rows:List[ExportRow], column_names:Optional[List[str]]=None) -> "RowBatch":
+        """Build a batch from a list of rows.
+        Rows shorter than the longest row are padded with None, so every column has one value per row.
+
+        :param rows: The rows of values, as built by a processor.
+        :type rows: List[ExportRow]
+        :param column_names: Names of the columns, if known. Defaults to None
+        :type column_names: Optional[List[str]], optional
+        :return: The rows, as a batch of columns.
+        :rtype: RowBatch
+        """
+        if len(rows) == 0:
+            return RowBatch(columns=[[] for _ in column_names or []], row_count=0, column_names=column_names)
+        _width = max(len(row) for row in rows)
+        if any(len(row) != _width for row in rows):
+            rows = [list(row) + [None] * (_width - len(row)) for row in rows]
+        return RowBatch(columns=list(zip(*rows)), row_count=len(rows), column_names=column_names)
+
+    # *** PUBLIC METHODS ***
+
+    def FormatColumns(self) -> List[List[str]]:
+        """Format every column as a list of JSON strings, with the formatter for the column's type.
+
+        :return: The formatted columns.
+        :rtype: List[List[str]]
+        """
+        return [list(map(_FORMATTERS[col_type], column)) for col_type, column in zip(self.ColumnTypes, self._columns)]
+
+    def AsStrings(self) -> List[ExportRow]:
+        """Format the batch back into rows of JSON strings, as expected by the outerfaces.
+
+        :return: The formatted rows.
+        :rtype: List[ExportRow]
+        """
+        if len(self._columns) == 0:
+            return [[] for _ in range(self._row_count)]
+        return [list(row) for row in zip(*self.FormatColumns())]
+
+    def Rows(self) -> Iterator[List[Any]]:
+        """Iterate over the unformatted values of each row."""
+        return (list(row) for row in zip(*self._columns))
+
+    # *** PRIVATE STATICS ***
+
+    _typeOf = {
+        type(None) : ColumnType.NULL,
+        int        : ColumnType.INT,
+        float      : ColumnType.FLOAT,
+        str        : ColumnType.STR,
+        bool       : ColumnType.BOOL,
+        datetime   : ColumnType.DATETIME,
+    }
+
+    @staticmethod
+    def _columnType(column:Sequence[Any]) -> ColumnType:
+        _types = set(map(type, column))
+        _types.discard(type(None))
+        if len(_types) == 0:
+            return ColumnType.NULL
+        elif len(_types) == 1:
+            return RowBatch._typeOf.get(_types.pop(), ColumnType.JSON)
+        else:
+            return ColumnType.JSON
@@ -7,6 +7,7 @@ from ogd.common.models.FeatureData import FeatureData
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.registries.ExtractorRegistry import ExtractorRegistry
 from ogd.core.processors.ExtractorProcessor import ExtractorProcessor
+from ogd.core.processors.Processor import EventErrorHandler
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExportMode import ExportMode
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
@@ -81,6 +82,9 @@ class SessionProcessor(ExtractorProcessor):
         """
         self._registry.UpdateFromEvent(event)
 
+    def _processEvents(self, events:List[Event], error_handler:Optional[EventErrorHandler]):
+        self._registry.UpdateFromEvents(events=events, error_handler=error_handler)
+
     def _getLines(self) -> List[ExportRow]:
         ret_val : ExportRow
         # if as_str:
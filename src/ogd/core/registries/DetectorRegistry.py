@@ -7,12 +7,14 @@ from ogd.core.generators.detectors.Detector import Detector
 from ogd.core.generators.Generator import Generator
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.registries.GeneratorRegistry import GeneratorRegistry
+from ogd.core.registries.RegistryTemplate import RegistryTemplate
 from ogd.common.models.Event import Event
 from ogd.common.models.FeatureData import FeatureData
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.schemas.games.DetectorSchema import DetectorSchema
 from ogd.common.schemas.games.GameSchema import GameSchema
 from ogd.common.models.enums.IterationMode import IterationMode
+from ogd.common.utils.Logger import Logger
 
 ## @class Extractor
 #  Abstract base class for game feature extractors.
@@ -97,8 +99,39 @@ class DetectorRegistry(GeneratorRegistry):
         return ret_val
 
     def _loadFromSchema(self, schema:GameSchema, loader:GeneratorLoader, overrides:Optional[List[str]]=None):
+        # Detectors are loaded once for every session, so as with extractors,
+        # we compile a template the first time, and stamp every later registry from it.
+        template = RegistryTemplate.Find(schema=schema, LoaderClass=type(loader), mode=self._mode, overrides=overrides)
+        if template is not None:
+            self._loadFromTemplate(template=template, loader=loader)
+        else:
+            template = self._compileTemplate(schema=schema, loader=loader, overrides=overrides)
+            RegistryTemplate.Store(template=template, LoaderClass=type(loader), mode=self._mode, overrides=overrides)
+
+    def _loadFromTemplate(self, template:RegistryTemplate, loader:GeneratorLoader):
+        for entry in template.Entries:
+            detector = loader.LoadDetector(detector_type=entry.feature_type, name=entry.name, schema_args=entry.schema_args, trigger_callback=self._trigger_callback, params=entry.params)
+            if detector is not None:
+                self._detectors[entry.name] = detector
+            else:
+                Logger.Log(f"Could not load {entry} from template, though it was loaded when the template was compiled!", logging.WARN)
+        self._event_registry = template.CopyEventRegistry(bind=lambda name : None)
+        self._dispatch_table = None
+
+    def _compileTemplate(self, schema:GameSchema, loader:GeneratorLoader, overrides:Optional[List[str]]=None) -> RegistryTemplate:
+        """Load and register detectors from the schema, recording what was loaded as a RegistryTemplate.
+
+        :param schema: The game schema from which to load detectors.
+        :type schema: GameSchema
+        :param loader: The loader to use for creating detectors.
+        :type loader: GeneratorLoader
+        :param overrides: An optional list of detectors to load in place of the schema's enabled detectors, defaults to None
+        :type overrides: Optional[List[str]], optional
+        :return: A template recording every detector that was registered.
+        :rtype: RegistryTemplate
+        """
+        entries : List[RegistryTemplate.Entry] = []
         # first, get list of what should actually be loaded.
-        # TODO : move this logic as high up as possible, so that we only need to do it once for each kind of processor.
         # 1. Start with overrides, else list of enabled features in schema.
         agg_load_set : Set[DetectorSchema]
         per_load_set : Set[DetectorSchema]
@@ -115,12 +148,18 @@ class DetectorRegistry(GeneratorRegistry):
             detector = loader.LoadDetector(detector_type=agg_schema.TypeName, name=agg_schema.Name, schema_args=agg_schema.NonStandardElements, trigger_callback=self._trigger_callback)
             if detector is not None and self._mode in detector.AvailableModes():
                     self.Register(extractor=detector, iter_mode=IterationMode.AGGREGATE)
+                    entries.append(RegistryTemplate.Entry(feature_type=agg_schema.TypeName, name=agg_schema.Name, schema_args=agg_schema.NonStandardElements,
+                                                          count_index=None, iter_mode=IterationMode.AGGREGATE, order=0, params=detector.Params))
         for per_schema in per_load_set:
             for i in schema.GetCountRange(count=per_schema.NonStandardElements.get('count', 1)):
                 instance_name = f"{per_schema.NonStandardElements.get('prefix', '')}{i}_{per_schema.Name}"
                 detector = loader.LoadDetector(detector_type=per_schema.TypeName, name=per_schema.Name, schema_args=per_schema.NonStandardElements, trigger_callback=self._trigger_callback)
                 if detector is not None and self._mode in detector.AvailableModes():
                         self.Register(extractor=detector, iter_mode=IterationMode.PERCOUNT)
+                        entries.append(RegistryTemplate.Entry(feature_type=per_schema.TypeName, name=per_schema.Name, schema_args=per_schema.NonStandardElements,
+                                                              count_index=None, iter_mode=IterationMode.PERCOUNT, order=0, params=detector.Params))
+        return RegistryTemplate(schema=schema, entries=entries, event_registry=self._event_registry, feature_registry={},
+                                generator_names=self._getGeneratorNames())
 
     def _updateFromEvent(self, event:Event) -> None:
         """Perform extraction of features from a row.
@@ -131,19 +170,17 @@ class DetectorRegistry(GeneratorRegistry):
                              table assiciated with this game is structured.
         :type table_schema: TableSchema
         """
-        if event.EventName in self._event_registry.keys():
-            # send event to every listener for the given event name.
-            for listener in self._event_registry[event.EventName]:
-                if listener.name in self._detectors.keys():
-                    self._detectors[listener.name].UpdateFromEvent(event)
-        # don't forget to send to any features listening for "all" events
-        for listener in self._event_registry["all_events"]:
-            if listener.name in self._detectors.keys():
-                self._detectors[listener.name].UpdateFromEvent(event)
+        # send event to every listener for the given event name, as well as any detectors listening for "all" events.
+        for _, update in self._dispatchersFor(event.EventName):
+            update(event)
 
     def _updateFromFeatureData(self, feature:FeatureData) -> None:
         return
 
+    def _resolveListener(self, listener:GeneratorRegistry.Listener) -> Optional[Callable[[Event], None]]:
+        _detector = self._detectors.get(listener.name)
+        return _detector.UpdateFromEvent if _detector is not None else None
+
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
@@ -4,12 +4,15 @@ import json
 import logging
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 ## import local files
 from ogd.core.generators.Generator import Generator
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
 from ogd.core.registries.GeneratorRegistry import GeneratorRegistry
+from ogd.core.registries.RegistryTemplate import RegistryTemplate
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.extractors.Extractor import Extractor
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
@@ -53,6 +56,12 @@ class ExtractorRegistry(GeneratorRegistry):
         super().__init__(mode=mode)
         self._features : List[OrderedDict[str, Extractor]] = [OrderedDict() for i in range(order)]
         self._feature_registry: Dict[str,List[GeneratorRegistry.Listener]] = {}
+        # listeners standing in for all instances of an indexed per-count feature, see PerCountFeature.IndexesEvents.
+        self._count_listeners : Dict[Tuple[type, str, str], GeneratorRegistry.CountListener] = {}
+        # column names, when known up-front from a RegistryTemplate.
+        self._generator_names : Optional[List[str]] = None
+        # names of first-order features whose values were restored, and which no longer receive events, see RestoreFeatureData.
+        self._restored        : Set[str] = set()
         # self._features : Dict[str, OrderedDict[str, Feature]] = {
         #     "first_order" : OrderedDict(),
         #     "second_order" : OrderedDict()
@@ -109,13 +118,16 @@ class ExtractorRegistry(GeneratorRegistry):
                 if _feature_dep not in self._feature_registry.keys():
                     self._feature_registry[_feature_dep] = []
                 self._feature_registry[_feature_dep].append(_listener)
+            # Per-count features that can index events are registered once, through a listener for all their instances.
+            if iter_mode == IterationMode.PERCOUNT and isinstance(extractor, PerCountFeature) and extractor.IndexesEvents():
+                _listener = self._countListener(extractor=extractor, listener=_listener)
             # Finally, register feature's requested events.
             if "all_events" in _event_deps:
-                self._event_registry["all_events"].append(_listener)
-            else:
-                for event in _event_deps:
-                    if event not in self._event_registry.keys():
-                        self._event_registry[event] = []
+                _event_deps = ["all_events"]
+            for event in _event_deps:
+                if event not in self._event_registry.keys():
+                    self._event_registry[event] = []
+                if not any(_existing is _listener for _existing in self._event_registry[event]):
                     self._event_registry[event].append(_listener)
         else:
             raise TypeError("ExtractorRegistry was given an Extractor which was not a Feature!")
@@ -126,6 +138,8 @@ class ExtractorRegistry(GeneratorRegistry):
         :return: A list of all currently-registered features.
         :rtype: List[str]
         """
+        if self._generator_names is not None:
+            return list(self._generator_names)
         ret_val : List[str] = []
         for order in self._features:
             for feature in order.values():
@@ -133,8 +147,41 @@ class ExtractorRegistry(GeneratorRegistry):
         return ret_val
 
     def _loadFromSchema(self, schema:GameSchema, loader:GeneratorLoader, overrides:Optional[List[str]]=None):
+        # Working out what to load only needs to happen once for each kind of processor,
+        # so we compile a template the first time, and stamp every later registry from it.
+        template = RegistryTemplate.Find(schema=schema, LoaderClass=type(loader), mode=self._mode, overrides=overrides)
+        if template is not None:
+            self._loadFromTemplate(template=template, loader=loader)
+        else:
+            template = self._compileTemplate(schema=schema, loader=loader, overrides=overrides)
+            RegistryTemplate.Store(template=template, LoaderClass=type(loader), mode=self._mode, overrides=overrides)
+
+    def _loadFromTemplate(self, template:RegistryTemplate, loader:GeneratorLoader):
+        for entry in template.Entries:
+            feature = loader.LoadFeature(feature_type=entry.feature_type, name=entry.name, schema_args=entry.schema_args, count_index=entry.count_index, validate=False, params=entry.params)
+            if feature is not None:
+                self._features[entry.order][entry.name] = feature
+            else:
+                Logger.Log(f"Could not load {entry} from template, though it was loaded when the template was compiled!", logging.WARN)
+        self._event_registry   = template.CopyEventRegistry(bind=self._countIndexer)
+        self._dispatch_table   = None
+        self._feature_registry = template.CopyFeatureRegistry()
+        self._generator_names  = template.GeneratorNames
+
+    def _compileTemplate(self, schema:GameSchema, loader:GeneratorLoader, overrides:Optional[List[str]]=None) -> RegistryTemplate:
+        """Load and register extractors from the schema, recording what was loaded as a RegistryTemplate.
+
+        :param schema: The game schema from which to load extractors.
+        :type schema: GameSchema
+        :param loader: The loader to use for creating extractors.
+        :type loader: GeneratorLoader
+        :param overrides: An optional list of features to load in place of the schema's enabled features, defaults to None
+        :type overrides: Optional[List[str]], optional
+        :return: A template recording every extractor that was registered.
+        :rtype: RegistryTemplate
+        """
+        entries : List[RegistryTemplate.Entry] = []
         # first, get list of what should actually be loaded.
-        # TODO : move this logic as high up as possible, so that we only need to do it once for each kind of processor.
         # 1. Start with overrides, else list of enabled features in schema.
         agg_load_set : Set[AggregateSchema]
         per_load_set : Set[PerCountSchema]
@@ -162,12 +209,59 @@ class ExtractorRegistry(GeneratorRegistry):
             feature = loader.LoadFeature(feature_type=agg_schema.TypeName, name=agg_schema.Name, schema_args=agg_schema.NonStandardElements)
             if feature is not None and self._mode in feature.AvailableModes():
                     self.Register(extractor=feature, iter_mode=IterationMode.AGGREGATE)
+                    entries.append(RegistryTemplate.Entry(feature_type=agg_schema.TypeName, name=agg_schema.Name, schema_args=agg_schema.NonStandardElements,
+                                                          count_index=None, iter_mode=IterationMode.AGGREGATE, order=self._orderOf(name=agg_schema.Name), params=feature.Params))
         for per_schema in sorted(per_load_set, key=lambda x : x.Name):
             for i in schema.GetCountRange(count=per_schema.Count):
                 instance_name = f"{per_schema.Prefix}{i}_{per_schema.Name}"
                 feature = loader.LoadFeature(feature_type=per_schema.TypeName, name=instance_name, schema_args=per_schema.NonStandardElements, count_index=i)
                 if feature is not None and self._mode in feature.AvailableModes():
                         self.Register(extractor=feature, iter_mode=IterationMode.PERCOUNT)
+                        entries.append(RegistryTemplate.Entry(feature_type=per_schema.TypeName, name=instance_name, schema_args=per_schema.NonStandardElements,
+                                                              count_index=i, iter_mode=IterationMode.PERCOUNT, order=self._orderOf(name=instance_name), params=feature.Params))
+        return RegistryTemplate(schema=schema, entries=entries, event_registry=self._event_registry, feature_registry=self._feature_registry,
+                                generator_names=self._getGeneratorNames())
+
+    def _countListener(self, extractor:PerCountFeature, listener:GeneratorRegistry.Listener) -> GeneratorRegistry.CountListener:
+        """Get the listener for all instances of the given per-count feature, and add the given instance's listener to it.
+
+        :param extractor: An instance of an indexed per-count feature.
+        :type extractor: PerCountFeature
+        :param listener: The listener for the instance.
+        :type listener: GeneratorRegistry.Listener
+        :return: The listener for all instances of the feature.
+        :rtype: GeneratorRegistry.CountListener
+        """
+        # instance names are f"{prefix}{count_index}_{name}", so strip out the index to group instances by feature.
+        _prefix, _, _base = extractor.Name.partition(f"{extractor.CountIndex}_")
+        _key = (type(extractor), _prefix, _base)
+        if _key not in self._count_listeners:
+            self._count_listeners[_key] = GeneratorRegistry.CountListener(name=_base, mode=IterationMode.PERCOUNT,
+                                                                          indexer_name=extractor.Name, indexer=extractor.CountIndicesForEvent)
+        ret_val = self._count_listeners[_key]
+        ret_val.Add(listener=listener, count_index=extractor.CountIndex)
+        return ret_val
+
+    def _countIndexer(self, name:str):
+        for order in self._features:
+            if name in order.keys():
+                _extractor = order[name]
+                return _extractor.CountIndicesForEvent if isinstance(_extractor, PerCountFeature) else None
+        return None
+
+    def _resolveListener(self, listener:GeneratorRegistry.Listener) -> Optional[Callable[[Event], None]]:
+        if listener.name in self._restored:
+            return None
+        for order in self._features:
+            if listener.name in order.keys():
+                return order[listener.name].UpdateFromEvent
+        return None
+
+    def _orderOf(self, name:str) -> int:
+        for order_key in range(len(self._features)):
+            if name in self._features[order_key].keys():
+                return order_key
+        raise KeyError(f"{name} is not registered in the ExtractorRegistry!")
 
     def _updateFromEvent(self, event:Event) -> None:
         """Perform extraction of features from a row.
@@ -178,20 +272,29 @@ class ExtractorRegistry(GeneratorRegistry):
                              table assiciated with this game is structured.
         :type table_schema: TableSchema
         """
-        listener : GeneratorRegistry.Listener = GeneratorRegistry.Listener("EMPTY", IterationMode.AGGREGATE)
+        listener_name : str = "EMPTY"
         try:
-            # send event to every listener for the given event name.
-            for listener in self._event_registry.get(event.EventName, []):
-                for order_key in range(len(self._features)):
-                    if listener.name in self._features[order_key].keys():
-                        self._features[order_key][listener.name].UpdateFromEvent(event)
-            # don't forget to send to any features listening for "all" events
-            for listener in self._event_registry["all_events"]:
-                for order_key in range(len(self._features)):
-                    if listener.name in self._features[order_key].keys():
-                        self._features[order_key][listener.name].UpdateFromEvent(event)
+            # send event to every listener for the given event name, as well as any features listening for "all" events.
+            for listener_name, update in self._dispatchersFor(event.EventName):
+                update(event)
         except KeyError as err:
-            Logger.Log(f"{listener.name} found event {event} missing expected key: {err}", logging.ERROR)
+            Logger.Log(f"{listener_name} found event {event} missing expected key: {err}", logging.ERROR)
+
+    def _updateFromEvents(self, events:List[Event], error_handler:Optional[Callable[[Event, Exception], None]]) -> None:
+        # look up the dispatchers for each kind of event once per batch, rather than once per event.
+        _dispatchers = {event_name : self._dispatchersFor(event_name) for event_name in {event.EventName for event in events}}
+        listener_name : str = "EMPTY"
+        for event in events:
+            try:
+                EventFields.Attach(event)
+                for listener_name, update in _dispatchers[event.EventName]:
+                    update(event)
+            except KeyError as err:
+                Logger.Log(f"{listener_name} found event {event} missing expected key: {err}", logging.ERROR)
+            except Exception as err:
+                if error_handler is None:
+                    raise err
+                error_handler(event, err)
 
     def _updateFromFeatureData(self, feature:FeatureData) -> None:
         """Perform extraction of features from a row.
@@ -209,7 +312,10 @@ class ExtractorRegistry(GeneratorRegistry):
                 if listener.name in self._features[order_key].keys():
                     _extractor = self._features[order_key][listener.name]
                     if feature.ExportMode in _extractor.FeatureDependencyModes():
-                        self._features[order_key][listener.name].UpdateFromFeatureData(feature)
+                        if GeneratorProfiler.Enabled:
+                            GeneratorProfiler.Call(_extractor, GeneratorProfiler.FEATURES, _extractor.UpdateFromFeatureData, feature)
+                        else:
+                            _extractor.UpdateFromFeatureData(feature)
 
 
     # *** PUBLIC STATICS ***
@@ -232,6 +338,44 @@ class ExtractorRegistry(GeneratorRegistry):
             ret_val.append(feature.ToFeatureData(player_id=player_id, sess_id=sess_id))
         return ret_val
 
+    def RestoreFeatureData(self, feature_list:List[FeatureData]) -> None:
+        """Restore first-order features from FeatureData calculated earlier, instead of calculating them from events.
+
+        Restored features no longer receive events, but higher-order features still do,
+        and still receive the restored data (along with any other FeatureData) in the usual way,
+        so they are calculated the same as if the first-order features had processed the events.
+
+        :param feature_list: First-order FeatureData from an earlier registry for the same session, player, or population.
+        :type feature_list: List[FeatureData]
+        """
+        _first_order = self._features[ExtractorRegistry.FeatureOrders.FIRST_ORDER.value]
+        for feature in feature_list:
+            _extractor = _first_order.get(feature.Name)
+            if _extractor is not None:
+                _extractor.Restore(values=feature.FeatureValues)
+                self._restored.add(feature.Name)
+            else:
+                Logger.Log(f"Could not restore {feature.Name}, it is not a first-order feature in the {self._mode.name} registry.", logging.WARN)
+        self._dispatch_table = None
+
+    def ListensToEvents(self, order:Optional[int]=None) -> bool:
+        """Check whether any feature of the registry is calculated from events, rather than only from other features' FeatureData.
+
+        :param order: The order of features to check, counting from 1, or None to check features of every order. Defaults to None
+        :type order: Optional[int], optional
+        :return: True if any feature of the given order(s) is registered for at least one kind of event.
+        :rtype: bool
+        """
+        _orders = range(len(self._features)) if order is None else [order - 1]
+        _names  = {name for order_index in _orders for name in self._features[order_index].keys()}
+        for listeners in self._event_registry.values():
+            for listener in listeners:
+                # a count listener stands in for every instance of its feature, and only the instances have the names of features in the registry.
+                _instances = listener.listeners if isinstance(listener, GeneratorRegistry.CountListener) else [listener]
+                if any(instance.name in _names for instance in _instances):
+                    return True
+        return False
+
     def GetFeatureValues(self) -> List[Any]:
         ret_val : List[Any] = []
         for order in self._features:
@@ -1,11 +1,13 @@
 ## import standard libraries
 import abc
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 ## import local files
 from ogd.common.utils.Logger import Logger
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.Generator import Generator
+from ogd.core.generators.GeneratorProfiler import GeneratorProfiler
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
@@ -22,7 +24,12 @@ class GeneratorRegistry(abc.ABC):
     :return: [description]
     :rtype: [type]
     """
+    # A compiled listener: the listener's name, and the function that sends an event to it.
+    Dispatcher = Tuple[str, Callable[[Event], None]]
+
     class Listener:
+        __slots__ = ("name", "mode")
+
         def __init__(self, name:str, mode:IterationMode):
             self.name = name
             self.mode = mode
@@ -33,6 +40,62 @@ class GeneratorRegistry(abc.ABC):
         def __repr__(self) -> str:
             return str(self)
 
+    class CountListener(Listener):
+        """Listener standing in for every instance of a per-count feature.
+
+        Rather than asking each instance whether an event belongs to its count index,
+        the registry asks the indexer (one representative instance) which indices the event belongs to,
+        and only sends the event to those instances.
+        """
+        __slots__ = ("indexer_name", "indexer", "listeners", "by_index")
+
+        def __init__(self, name:str, mode:IterationMode, indexer_name:str, indexer:Optional[Callable[[Event], Optional[Iterable[int]]]]):
+            super().__init__(name=name, mode=mode)
+            self.indexer_name : str = indexer_name
+            self.indexer      : Optional[Callable[[Event], Optional[Iterable[int]]]] = indexer
+            self.listeners    : List[GeneratorRegistry.Listener] = []
+            self.by_index     : Dict[int, List[GeneratorRegistry.Listener]] = {}
+
+        def __str__(self) -> str:
+            return f"{self.name} ({self.mode.name}, {len(self.listeners)} instances)"
+
+        def Add(self, listener:"GeneratorRegistry.Listener", count_index:int):
+            self.listeners.append(listener)
+            self.by_index.setdefault(count_index, []).append(listener)
+
+        def Compile(self, resolve:Callable[["GeneratorRegistry.Listener"], Optional[Callable[[Event], None]]]) -> Callable[[Event], None]:
+            """Build a function that sends an event to the instances whose count index matches the event.
+
+            If the indices could not be determined, the event goes to every instance.
+
+            :param resolve: Function to get the update function for one of the listeners, or None if the listener has no extractor.
+            :type resolve: Callable[[GeneratorRegistry.Listener], Optional[Callable[[Event], None]]]
+            :return: The dispatch function for the instances.
+            :rtype: Callable[[Event], None]
+            """
+            def _resolveAll(listeners:List[GeneratorRegistry.Listener]) -> Tuple[Callable[[Event], None], ...]:
+                return tuple(update for update in (resolve(listener) for listener in listeners) if update is not None)
+
+            _indexer  = self.indexer
+            _all      = _resolveAll(self.listeners)
+            _by_index = {index : _resolveAll(listeners) for index, listeners in self.by_index.items()}
+            def _dispatch(event:Event) -> None:
+                indices = _indexer(event) if _indexer is not None else None
+                if indices is None:
+                    for update in _all:
+                        update(event)
+                else:
+                    for index in sorted(set(indices)):
+                        for update in _by_index.get(index, ()):
+                            update(event)
+            return _dispatch
+
+        def Copy(self, indexer:Optional[Callable[[Event], Optional[Iterable[int]]]]) -> "GeneratorRegistry.CountListener":
+            ret_val = GeneratorRegistry.CountListener(name=self.name, mode=self.mode, indexer_name=self.indexer_name, indexer=indexer)
+            ret_val.listeners = self.listeners
+            ret_val.by_index  = self.by_index
+            return ret_val
+
     # *** ABSTRACTS ***
 
     @abc.abstractmethod
@@ -68,6 +131,8 @@ class GeneratorRegistry(abc.ABC):
         """
         self._event_registry : Dict[str,List[GeneratorRegistry.Listener]] = {"all_events":[]}
         self._mode           : ExtractionMode = mode
+        # _event_registry, compiled down to the functions each event should be sent to. Rebuilt on the first event after registration changes.
+        self._dispatch_table : Optional[Dict[str, Tuple[GeneratorRegistry.Dispatcher, ...]]] = None
 
     # *** PUBLIC STATICS ***
 
@@ -75,6 +140,7 @@ class GeneratorRegistry(abc.ABC):
 
     def Register(self, extractor:Generator, iter_mode:IterationMode):
         self._register(extractor=extractor, iter_mode=iter_mode)
+        self._dispatch_table = None
 
     def GetGeneratorNames(self) -> List[str]:
         """Function to generate a list names of all enabled features, given a GameSchema
@@ -104,9 +170,22 @@ class GeneratorRegistry(abc.ABC):
                              table assiciated with this game is structured.
         :type table_schema: TableSchema
         """
-        # TODO : Add error handling and/or timing and/or profiling
+        # TODO : Add error handling
+        # When profiling is enabled, the dispatch table is compiled with timed dispatchers, see _compileDispatchTable.
+        EventFields.Attach(event)
         self._updateFromEvent(event=event)
 
+    def UpdateFromEvents(self, events:List[Event], error_handler:Optional[Callable[[Event, Exception], None]]=None) -> None:
+        """Perform extraction of features from a batch of events, in order.
+
+        :param events: The events to be processed.
+        :type events: List[Event]
+        :param error_handler: Function to handle an error from a single event, after which processing continues with the next event.
+            If None, the error is raised, and the rest of the batch is not processed. Defaults to None
+        :type error_handler: Optional[Callable[[Event, Exception], None]], optional
+        """
+        self._updateFromEvents(events=events, error_handler=error_handler)
+
     def UpdateFromFeatureData(self, feature:FeatureData) -> None:
         """Perform extraction of features from a row.
 
@@ -127,6 +206,80 @@ class GeneratorRegistry(abc.ABC):
 
     # *** PRIVATE METHODS ***
 
+    def _updateFromEvents(self, events:List[Event], error_handler:Optional[Callable[[Event, Exception], None]]) -> None:
+        """Base function to update from a batch of events, which just updates from each one in turn.
+
+        :param events: The events to be processed.
+        :type events: List[Event]
+        :param error_handler: Function to handle an error from a single event, or None to raise errors.
+        :type error_handler: Optional[Callable[[Event, Exception], None]]
+        """
+        for event in events:
+            try:
+                EventFields.Attach(event)
+                self._updateFromEvent(event=event)
+            except Exception as err:
+                if error_handler is None:
+                    raise err
+                error_handler(event, err)
+
+    def _resolveListener(self, listener:Listener) -> Optional[Callable[[Event], None]]:
+        """Get the function that sends an event to the generator a listener stands for.
+
+        Registries override this to look the listener up in their own collection of generators.
+
+        :param listener: The listener to resolve.
+        :type listener: GeneratorRegistry.Listener
+        :return: The generator's update function, or None if no generator is registered under the listener's name.
+        :rtype: Optional[Callable[[Event], None]]
+        """
+        return None
+
+    def _dispatchersFor(self, event_name:str) -> Tuple[Dispatcher, ...]:
+        """Get the dispatchers for every listener of the given event, including those listening for all events.
+
+        :param event_name: The name of the event to be dispatched.
+        :type event_name: str
+        :return: The dispatchers for the event, in the order they should receive it.
+        :rtype: Tuple[GeneratorRegistry.Dispatcher, ...]
+        """
+        if self._dispatch_table is None:
+            self._dispatch_table = self._compileDispatchTable()
+        _table = self._dispatch_table
+        return _table[event_name] if event_name in _table else _table["all_events"]
+
+    def _profiledListener(self, listener:Listener) -> Optional[Callable[[Event], None]]:
+        """Get the function that sends an event to the generator a listener stands for, wrapped so the generator's time and calls are profiled.
+
+        :param listener: The listener to resolve.
+        :type listener: GeneratorRegistry.Listener
+        :return: The timed update function, or None if no generator is registered under the listener's name.
+        :rtype: Optional[Callable[[Event], None]]
+        """
+        update = self._resolveListener(listener)
+        _generator = getattr(update, "__self__", None)
+        return GeneratorProfiler.Wrap(generator=_generator, update=update) if update is not None and _generator is not None else update
+
+    def _compileDispatchTable(self) -> Dict[str, Tuple[Dispatcher, ...]]:
+        _compiled : Dict[int, Optional[GeneratorRegistry.Dispatcher]] = {}
+        # only pay for timing each generator when profiling, otherwise dispatch straight to the generators.
+        _resolve = self._profiledListener if GeneratorProfiler.Enabled else self._resolveListener
+        def _compile(listener:GeneratorRegistry.Listener) -> Optional[GeneratorRegistry.Dispatcher]:
+            # the same listener may be registered for several events, so only compile it once.
+            if id(listener) not in _compiled:
+                update = listener.Compile(resolve=_resolve) if isinstance(listener, GeneratorRegistry.CountListener) \
+                         else _resolve(listener)
+                _compiled[id(listener)] = (listener.name, update) if update is not None else None
+            return _compiled[id(listener)]
+
+        def _compileAll(listeners:List[GeneratorRegistry.Listener]) -> Tuple[GeneratorRegistry.Dispatcher, ...]:
+            return tuple(dispatcher for dispatcher in (_compile(listener) for listener in listeners) if dispatcher is not None)
+
+        _all_events = _compileAll(self._event_registry.get("all_events", []))
+        ret_val = {event_name : _compileAll(listeners) + _all_events for event_name, listeners in self._event_registry.items() if event_name != "all_events"}
+        ret_val["all_events"] = _all_events
+        return ret_val
+
     # def _format(obj):
     #     if obj == None:
     #         return ""
@@ -0,0 +1,154 @@
+## import standard libraries
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+## import local files
+from ogd.common.models.Event import Event
+from ogd.core.generators.Generator import GeneratorParameters
+from ogd.core.generators.GeneratorLoader import GeneratorLoader
+from ogd.core.registries.GeneratorRegistry import GeneratorRegistry
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+from ogd.common.models.enums.IterationMode import IterationMode
+from ogd.common.schemas.games.GameSchema import GameSchema
+from ogd.common.utils.Logger import Logger
+
+TemplateKey = Tuple[str, Type[GeneratorLoader], ExtractionMode, Optional[Tuple[str, ...]]]
+IndexerBinding = Callable[[str], Optional[Callable[[Event], Optional[Iterable[int]]]]]
+
+## @class RegistryTemplate
+#  Compiled form of a registry's schema, so later registries can skip re-resolving the schema.
+class RegistryTemplate:
+    """Compiled form of the extractors an ExtractorRegistry loads from a game schema.
+
+    The first registry loaded for a given game, loader, mode, and set of overrides works out which extractors to load,
+    and records them in a template.
+    Every later registry with the same configuration is stamped from the template,
+    which just constructs the extractors and copies the pre-built listener tables.
+    The extractors' parameters do not change, so each is shared by the instances of the extractor in every stamped registry.
+    """
+    class Entry:
+        __slots__ = ("feature_type", "name", "schema_args", "count_index", "iter_mode", "order", "params")
+
+        def __init__(self, feature_type:str, name:str, schema_args:Dict[str, Any], count_index:Optional[int], iter_mode:IterationMode, order:int,
+                     params:Optional[GeneratorParameters]=None):
+            self.feature_type = feature_type
+            self.name         = name
+            self.schema_args  = schema_args
+            self.count_index  = count_index
+            self.iter_mode    = iter_mode
+            self.order        = order
+            # parameters of the instance the template was compiled from, shared with every instance stamped from the template.
+            self.params       = params
+
+        def __str__(self) -> str:
+            return f"{self.name} ({self.feature_type}, {self.iter_mode.name})"
+
+        def __repr__(self) -> str:
+            return str(self)
+
+    # Cache of compiled templates, one per (game, loader, mode, overrides) combination.
+    _templates : Dict[TemplateKey, "RegistryTemplate"] = {}
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, schema:GameSchema, entries:List[Entry],
+                 event_registry:Dict[str, List[GeneratorRegistry.Listener]], feature_registry:Dict[str, List[GeneratorRegistry.Listener]],
+                 generator_names:List[str]):
+        """Constructor for a RegistryTemplate.
+
+        :param schema: The game schema the template was compiled from.
+        :type schema: GameSchema
+        :param entries: The extractors to load, in registration order.
+        :type entries: List[Entry]
+        :param event_registry: Mapping of event names to the listeners for each event.
+        :type event_registry: Dict[str, List[GeneratorRegistry.Listener]]
+        :param feature_registry: Mapping of feature names to the listeners for each feature.
+        :type feature_registry: Dict[str, List[GeneratorRegistry.Listener]]
+        :param generator_names: The column names of all extractors in the template.
+        :type generator_names: List[str]
+        """
+        self._schema           : GameSchema                                = schema
+        self._entries          : List[RegistryTemplate.Entry]              = entries
+        # count listeners are stored without an indexer, so the template doesn't hold on to the compiling registry's extractors.
+        self._event_registry   : Dict[str, List[GeneratorRegistry.Listener]] = RegistryTemplate._copyListeners(event_registry, bind=lambda name : None)
+        self._feature_registry : Dict[str, List[GeneratorRegistry.Listener]] = {key : list(val) for key,val in feature_registry.items()}
+        self._generator_names  : List[str]                                 = list(generator_names)
+
+    def __str__(self) -> str:
+        return f"RegistryTemplate({self._schema.GameName}, {len(self._entries)} entries)"
+
+    @property
+    def Schema(self) -> GameSchema:
+        return self._schema
+
+    @property
+    def Entries(self) -> List[Entry]:
+        return self._entries
+
+    @property
+    def GeneratorNames(self) -> List[str]:
+        return self._generator_names
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Find(schema:GameSchema, LoaderClass:Type[GeneratorLoader], mode:ExtractionMode, overrides:Optional[List[str]]) -> Optional["RegistryTemplate"]:
+        """Look up the compiled template for the given configuration, if one exists.
+
+        A template is only returned if it was compiled from the same GameSchema instance,
+        so templates do not outlive the export that compiled them.
+
+        :param schema: The game schema to be loaded.
+        :type schema: GameSchema
+        :param LoaderClass: The type of loader used to load the extractors.
+        :type LoaderClass: Type[GeneratorLoader]
+        :param mode: The extraction mode of the registry.
+        :type mode: ExtractionMode
+        :param overrides: An optional list of features to load in place of the schema's enabled features.
+        :type overrides: Optional[List[str]]
+        :return: The template for the given configuration, or None if none has been compiled.
+        :rtype: Optional[RegistryTemplate]
+        """
+        ret_val = RegistryTemplate._templates.get(RegistryTemplate._key(schema=schema, LoaderClass=LoaderClass, mode=mode, overrides=overrides))
+        return ret_val if ret_val is not None and ret_val.Schema is schema else None
+
+    @staticmethod
+    def Store(template:"RegistryTemplate", LoaderClass:Type[GeneratorLoader], mode:ExtractionMode, overrides:Optional[List[str]]) -> None:
+        RegistryTemplate._templates[RegistryTemplate._key(schema=template.Schema, LoaderClass=LoaderClass, mode=mode, overrides=overrides)] = template
+        Logger.Log(f"Compiled {template} for {LoaderClass.__name__} in {mode.name} mode.", logging.DEBUG, depth=3)
+
+    @staticmethod
+    def Clear() -> None:
+        RegistryTemplate._templates = {}
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _copyListeners(registry:Dict[str, List[GeneratorRegistry.Listener]], bind:IndexerBinding) -> Dict[str, List[GeneratorRegistry.Listener]]:
+        _copies : Dict[int, GeneratorRegistry.CountListener] = {}
+        def _copy(listener:GeneratorRegistry.Listener) -> GeneratorRegistry.Listener:
+            if isinstance(listener, GeneratorRegistry.CountListener):
+                # the same count listener is registered for several events, so make sure each gets the same copy.
+                if id(listener) not in _copies:
+                    _copies[id(listener)] = listener.Copy(indexer=bind(listener.indexer_name))
+                return _copies[id(listener)]
+            return listener
+        return {key : [_copy(listener) for listener in val] for key,val in registry.items()}
+
+    @staticmethod
+    def _key(schema:GameSchema, LoaderClass:Type[GeneratorLoader], mode:ExtractionMode, overrides:Optional[List[str]]) -> TemplateKey:
+        return (schema.GameName, LoaderClass, mode, tuple(overrides) if overrides is not None else None)
+
+    # *** PUBLIC METHODS ***
+
+    def CopyEventRegistry(self, bind:IndexerBinding) -> Dict[str, List[GeneratorRegistry.Listener]]:
+        """Copy the template's event listeners, for a registry stamped from the template.
+
+        :param bind: Function to look up the stamped registry's indexer for a count listener, given the name of the indexing extractor.
+        :type bind: Callable[[str], Optional[Callable[[Event], Optional[Iterable[int]]]]]
+        :return: Mapping of event names to the listeners for each event.
+        :rtype: Dict[str, List[GeneratorRegistry.Listener]]
+        """
+        return RegistryTemplate._copyListeners(self._event_registry, bind=bind)
+
+    def CopyFeatureRegistry(self) -> Dict[str, List[GeneratorRegistry.Listener]]:
+        return {key : list(val) for key,val in self._feature_registry.items()}
@@ -2,8 +2,10 @@ __all__ = [
     "GeneratorRegistry",
     "DetectorRegistry",
     "ExtractorRegistry",
+    "RegistryTemplate",
 ]
 
 from . import GeneratorRegistry
 from . import DetectorRegistry
-from . import ExtractorRegistry
\ No newline at end of file
+from . import ExtractorRegistry
+from . import RegistryTemplate
\ No newline at end of file
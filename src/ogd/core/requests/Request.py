@@ -54,9 +54,13 @@ class Request(abc.ABC):
     #                 Should correspond to the app_id in the database.
     #  @param start_date   The starting date for our range of data to process.
     #  @param end_date     The ending date for our range of data to process.
+    #  @param incremental  Whether to reuse cached features of sessions whose events have not changed since the last export.
+    #  @param use_event_cache     Whether to read and store the events of sessions in the local event cache, rather than always retrieving them from the interface.
+    #  @param refresh_event_cache Whether to retrieve all events from the interface, replacing any that were already in the event cache.
     def __init__(self, range:ExporterRange, exporter_modes:Set[ExportMode],
                 interface:EventInterface,    outerfaces:Set[DataOuterface],
-                feature_overrides:Optional[List[str]]=None):
+                feature_overrides:Optional[List[str]]=None, incremental:bool=False,
+                use_event_cache:bool=False,  refresh_event_cache:bool=False):
         # TODO: kind of a hack to just get id from interface, figure out later how this should be handled.
         self._game_id        : str                    = str(interface._game_id)
         self._interface      : EventInterface          = interface
@@ -64,6 +68,9 @@ class Request(abc.ABC):
         self._exports        : Set[ExportMode]        = exporter_modes
         self._outerfaces     : Set[DataOuterface]     = outerfaces
         self._feat_overrides : Optional[List[str]]    = feature_overrides
+        self._incremental    : bool                   = incremental
+        self._use_evt_cache  : bool                   = use_event_cache
+        self._refresh_cache  : bool                   = refresh_event_cache
 
     ## String representation of a request. Just gives game id, and date range.
     def __str__(self):
@@ -111,6 +118,18 @@ class Request(abc.ABC):
     def Outerfaces(self) -> Set[DataOuterface]:
         return self._outerfaces
 
+    @property
+    def Incremental(self) -> bool:
+        return self._incremental
+
+    @property
+    def UseEventCache(self) -> bool:
+        return self._use_evt_cache
+
+    @property
+    def RefreshEventCache(self) -> bool:
+        return self._refresh_cache
+
     def RemoveExportMode(self, mode:ExportMode):
         self._exports.discard(mode)
         for outerface in self.Outerfaces:
@@ -26,6 +26,11 @@ class ConfigSchema(Schema):
         """
         self._log_file       : bool
         self._batch_size     : int
+        self._worker_count   : int
+        self._prefetch_count : int
+        self._prefetch_cap   : int
+        self._cache_dir      : Path
+        self._event_cache_mb : int
         self._dbg_level      : int
         self._fail_fast      : bool
         self._with_profiling : bool
@@ -44,6 +49,31 @@ class ConfigSchema(Schema):
         else:
             self._batch_size = 500
             Logger.Log(f"{name} config does not have a 'BATCH_SIZE' element; defaulting to batch_size={self._batch_size}", logging.WARN)
+        if "WORKER_COUNT" in all_elements.keys():
+            self._worker_count = ConfigSchema._parseWorkerCount(all_elements["WORKER_COUNT"])
+        else:
+            self._worker_count = 1
+            Logger.Log(f"{name} config does not have a 'WORKER_COUNT' element; defaulting to worker_count={self._worker_count}", logging.WARN)
+        if "PREFETCH_SLICES" in all_elements.keys():
+            self._prefetch_count = ConfigSchema._parsePrefetchSlices(all_elements["PREFETCH_SLICES"])
+        else:
+            self._prefetch_count = 1
+            Logger.Log(f"{name} config does not have a 'PREFETCH_SLICES' element; defaulting to prefetch_slices={self._prefetch_count}", logging.WARN)
+        if "PREFETCH_MAX_EVENTS" in all_elements.keys():
+            self._prefetch_cap = ConfigSchema._parsePrefetchMaxEvents(all_elements["PREFETCH_MAX_EVENTS"])
+        else:
+            self._prefetch_cap = 1000000
+            Logger.Log(f"{name} config does not have a 'PREFETCH_MAX_EVENTS' element; defaulting to prefetch_max_events={self._prefetch_cap}", logging.WARN)
+        if "CACHE_DIR" in all_elements.keys():
+            self._cache_dir = ConfigSchema._parseCacheDirectory(all_elements["CACHE_DIR"])
+        else:
+            self._cache_dir = Path("./cache/")
+            Logger.Log(f"{name} config does not have a 'CACHE_DIR' element; defaulting to cache_dir={self._cache_dir}", logging.WARN)
+        if "EVENT_CACHE_MB" in all_elements.keys():
+            self._event_cache_mb = ConfigSchema._parseEventCacheSize(all_elements["EVENT_CACHE_MB"])
+        else:
+            self._event_cache_mb = 1024
+            Logger.Log(f"{name} config does not have a 'EVENT_CACHE_MB' element; defaulting to event_cache_mb={self._event_cache_mb}", logging.WARN)
         if "DEBUG_LEVEL" in all_elements.keys():
             self._dbg_level = ConfigSchema._parseDebugLevel(all_elements["DEBUG_LEVEL"])
         else:
@@ -76,7 +106,7 @@ class ConfigSchema(Schema):
             self._game_src_map = {}
             Logger.Log(f"{name} config does not have a 'GAME_SOURCE_MAP' element; defaulting to game_source_map={self._game_src_map}", logging.WARN)
 
-        _used = {"LOG_FILE", "BATCH_SIZE", "DEBUG_LEVEL", "FAIL_FAST", "FILE_INDEXING", "GAME_SOURCES", "GAME_SOURCE_MAP"}
+        _used = {"LOG_FILE", "BATCH_SIZE", "WORKER_COUNT", "PREFETCH_SLICES", "PREFETCH_MAX_EVENTS", "CACHE_DIR", "EVENT_CACHE_MB", "DEBUG_LEVEL", "FAIL_FAST", "FILE_INDEXING", "GAME_SOURCES", "GAME_SOURCE_MAP"}
         _leftovers = { key : val for key,val in all_elements.items() if key not in _used }
         super().__init__(name=name, other_elements=_leftovers)
 
@@ -104,6 +134,47 @@ class ConfigSchema(Schema):
         """
         return self._batch_size
 
+    @property
+    def WorkerCount(self) -> int:
+        """
+        The number of worker processes to use for processing slices during an export.
+        A value of 1 (the default) processes all slices sequentially, in the main process.
+        """
+        return self._worker_count
+
+    @property
+    def PrefetchSlices(self) -> int:
+        """
+        The number of slices to retrieve in the background, ahead of the slice currently being processed.
+        A value of 0 disables prefetching, so each slice is retrieved only when it is needed.
+        """
+        return self._prefetch_count
+
+    @property
+    def PrefetchMaxEvents(self) -> int:
+        """
+        The maximum number of events to hold in prefetched slices at once.
+        When the cap is reached, prefetching waits for buffered slices to be used, though at least one slice is always prefetched.
+        A value of 0 means no cap, other than the number of slices.
+        """
+        return self._prefetch_cap
+
+    @property
+    def CacheDirectory(self) -> Path:
+        """
+        The local directory where data cached between exports is stored, such as session features for incremental exports.
+        """
+        return self._cache_dir
+
+    @property
+    def EventCacheSize(self) -> int:
+        """
+        The maximum size, in megabytes, of the local cache of retrieved events.
+        When the cache grows past this size, the least-recently used sessions are evicted.
+        A value of 0 disables the event cache.
+        """
+        return self._event_cache_mb
+
     @property
     def DebugLevel(self) -> int:
         """
@@ -182,6 +253,78 @@ class ConfigSchema(Schema):
             Logger.Log(f"Config batch size was unexpected type {type(batch_size)}, defaulting to int(str(batch_size))={ret_val}.", logging.WARN)
         return ret_val
 
+    @staticmethod
+    def _parseWorkerCount(worker_count) -> int:
+        ret_val : int
+        if isinstance(worker_count, int):
+            ret_val = worker_count
+        elif isinstance(worker_count, str):
+            ret_val = int(worker_count)
+        else:
+            ret_val = int(str(worker_count))
+            Logger.Log(f"Config worker count was unexpected type {type(worker_count)}, defaulting to int(str(worker_count))={ret_val}.", logging.WARN)
+        if ret_val < 1:
+            Logger.Log(f"Config worker count was {ret_val}, but at least one worker is required; defaulting to 1.", logging.WARN)
+            ret_val = 1
+        return ret_val
+
+    @staticmethod
+    def _parsePrefetchSlices(prefetch_slices) -> int:
+        ret_val : int
+        if isinstance(prefetch_slices, int):
+            ret_val = prefetch_slices
+        elif isinstance(prefetch_slices, str):
+            ret_val = int(prefetch_slices)
+        else:
+            ret_val = int(str(prefetch_slices))
+            Logger.Log(f"Config prefetch slices was unexpected type {type(prefetch_slices)}, defaulting to int(str(prefetch_slices))={ret_val}.", logging.WARN)
+        if ret_val < 0:
+            Logger.Log(f"Config prefetch slices was {ret_val}, but cannot be negative; defaulting to 0.", logging.WARN)
+            ret_val = 0
+        return ret_val
+
+    @staticmethod
+    def _parsePrefetchMaxEvents(max_events) -> int:
+        ret_val : int
+        if isinstance(max_events, int):
+            ret_val = max_events
+        elif isinstance(max_events, str):
+            ret_val = int(max_events)
+        else:
+            ret_val = int(str(max_events))
+            Logger.Log(f"Config prefetch max events was unexpected type {type(max_events)}, defaulting to int(str(max_events))={ret_val}.", logging.WARN)
+        if ret_val < 0:
+            Logger.Log(f"Config prefetch max events was {ret_val}, but cannot be negative; defaulting to 0 (no cap).", logging.WARN)
+            ret_val = 0
+        return ret_val
+
+    @staticmethod
+    def _parseCacheDirectory(cache_dir) -> Path:
+        ret_val : Path
+        if isinstance(cache_dir, Path):
+            ret_val = cache_dir
+        elif isinstance(cache_dir, str):
+            ret_val = Path(cache_dir)
+        else:
+            ret_val = Path(str(cache_dir))
+            Logger.Log(f"Config cache directory was unexpected type {type(cache_dir)}, defaulting to Path(str(cache_dir))={ret_val}.", logging.WARN)
+        return ret_val
+
+    @staticmethod
+    def _parseEventCacheSize(cache_mb) -> int:
+        ret_val : int
+        if isinstance(cache_mb, int):
+            ret_val = cache_mb
+        elif isinstance(cache_mb, str):
+            ret_val = int(cache_mb)
+        else:
+            ret_val = int(str(cache_mb))
+            Logger.Log(f"Config event cache size was unexpected type {type(cache_mb)}, defaulting to int(str(cache_mb))={ret_val}.", logging.WARN)
+        if ret_val < 0:
+            Logger.Log(f"Config event cache size was {ret_val}, but cannot be negative; defaulting to 0 (no event cache).", logging.WARN)
+            ret_val = 0
+        return ret_val
+
     @staticmethod
     def _parseDebugLevel(level) -> int:
         ret_val : int
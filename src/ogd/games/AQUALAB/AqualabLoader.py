@@ -1,14 +1,14 @@
 # import standard libraries
 import itertools
-import json
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Callable, Dict, Final, List, Optional
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional
 # import OGD files
 from ogd.games import AQUALAB
 from ogd.games.AQUALAB.detectors import *
 from ogd.games.AQUALAB.features import *
 from ogd.core.generators.detectors.Detector import Detector
+from ogd.core.generators.GameMetadataCache import GameMetadataCache
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.generators.extractors.Feature import Feature
@@ -41,30 +41,18 @@ class AqualabLoader(GeneratorLoader):
         :type feature_overrides: Optional[List[str]]
         """
         super().__init__(player_id=player_id, session_id=session_id, game_schema=game_schema, mode=mode, feature_overrides=feature_overrides)
-        self._job_map = {"no-active-job": 0}
-        self._diff_map = {0: {"experimentation": 0, "modeling": 0, "argumentation": 0} }
-        self._task_map = {}
-
-        # Load Aqualab jobs export and map job names to integer values
-        METADATA = {}
-        _dbexport_path = Path(AQUALAB.__file__) if Path(AQUALAB.__file__).is_dir() else Path(AQUALAB.__file__).parent
-        with open(_dbexport_path / "DBExport.json", "r") as file:
-            METADATA = json.load(file)
-
-        task_num = 1
-        for i, job in enumerate(METADATA.get("jobs", {}), start=1):
-            self._job_map[job["id"]] = i
-            self._diff_map[i] = job["difficulties"]
-            for task in job["tasks"]:
-                task_by_job = job["id"] + "_" + task["id"]
-                self._task_map[task_by_job] = task_num
-                task_num += 1
+        # Map job names to integer values, using the Aqualab jobs export.
+        # The maps are built once per process and shared by all loaders, so they are read-only.
+        _maps = GameMetadataCache.GetDerived(path=GameMetadataCache.MetadataPath(AQUALAB), key="AqualabLoader", builder=AqualabLoader._buildMaps)
+        self._job_map  : Mapping[str, int]            = _maps["job_map"]
+        self._diff_map : Mapping[int, Dict[str, int]] = _maps["diff_map"]
+        self._task_map : Mapping[str, int]            = _maps["task_map"]
 
         # Update level count
         self._game_schema._max_level = len(self._job_map) - 1
 
     @property
-    def JobMap(self) -> Dict:
+    def JobMap(self) -> Mapping:
         """Property returning the "job map" that assigns each job in the DBExport an integer value/index.
 
         :return: The "job map" from the current DBExport
@@ -300,6 +288,26 @@ class AqualabLoader(GeneratorLoader):
 
 # *** PUBLIC STATICS ***
 
+    @staticmethod
+    def _buildMaps(metadata:Dict[str, Any]) -> Dict[str, Mapping]:
+        job_map  : Dict[str, int]            = {"no-active-job": 0}
+        diff_map : Dict[int, Dict[str, int]] = {0: {"experimentation": 0, "modeling": 0, "argumentation": 0} }
+        task_map : Dict[str, int]            = {}
+
+        task_num = 1
+        for i, job in enumerate(metadata.get("jobs", {}), start=1):
+            job_map[job["id"]] = i
+            diff_map[i] = job["difficulties"]
+            for task in job["tasks"]:
+                task_by_job = job["id"] + "_" + task["id"]
+                task_map[task_by_job] = task_num
+                task_num += 1
+        return {
+            "job_map"  : MappingProxyType(job_map),
+            "diff_map" : MappingProxyType(diff_map),
+            "task_map" : MappingProxyType(task_map)
+        }
+
     @staticmethod
     def GetAqualabJobCount(db_export_path:Path=Path(".") / "ogd" / "games" / "AQUALAB") -> int:
         """Function to retrieve the number of jobs in the DBExport file.
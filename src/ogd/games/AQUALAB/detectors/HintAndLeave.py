@@ -53,9 +53,6 @@ class HintAndLeave(Detector):
         """
         if self._sess_id == "Unknown":
             self._sess_id = event.SessionID
-        elif self._sess_id != event.SessionID:
-            self._sess_id = event.SessionID
-            self._last_hint_time = None
 
         if event.EventName == "ask_for_help":
             self._last_hint_time = event.Timestamp
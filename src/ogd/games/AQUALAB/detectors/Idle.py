@@ -51,9 +51,6 @@ class Idle(Detector):
             return
         if self._sess_id == "Unknown":
             self._sess_id = event.SessionID
-        elif self._sess_id != event.SessionID:
-            self._sess_id = event.SessionID
-            self._last_action_time = None
         if not self._last_action_time:
             self._last_action_time = event.Timestamp
             return
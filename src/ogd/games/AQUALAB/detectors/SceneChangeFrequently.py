@@ -53,12 +53,6 @@ class SceneChangeFrequently(Detector):
         """
         if self._sess_id == "Unknown":
             self._sess_id = event.SessionID
-        elif self._sess_id != event.SessionID:
-            self._sess_id = event.SessionID
-            self._last_change_time = None
-            self._scene_from = None
-            self._scene_stopby = None
-            self._scene_at = None
         if not self._last_change_time:
             self._last_change_time = event.Timestamp
             self._scene_stopby = event.EventData.get("scene_name")
@@ -56,15 +56,11 @@ class TwoHints(Detector):
         # 1. If first event we ever saw, just keep track of the session ID.
         if self._sess_id is None:
             self._sess_id = event.SessionID
-        # 2. Otherwise, if found new session ID, switch to it and reset.
-        elif self._sess_id != event.SessionID:
-            self._sess_id = event.SessionID
-            self._first_hint_time = None
-        # 3. If we don't have a previous hint marked, mark this as the first hint.
+        # 2. If we don't have a previous hint marked, mark this as the first hint.
         if not self._first_hint_time:
             self._first_hint_time = event.Timestamp
             self._first_hint = event.EventData.get("node_id", "HINT node_id NOT FOUND")
-        # 4. If we did have previous hint, mark this as the second hint and record relevant state variables.
+        # 3. If we did have previous hint, mark this as the second hint and record relevant state variables.
         else:
             self._second_hint = event.EventData.get("node_id", "HINT node_id NOT FOUND")
             self._time_between_hints = event.Timestamp - self._first_hint_time
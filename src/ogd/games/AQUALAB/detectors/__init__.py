@@ -10,10 +10,6 @@ __all__ = [
     "TwoHints"
 ]
 
-from . import CollectFactNoJob
-from . import DiveSiteNoEvidence
-from . import EchoRoomChange
-from . import Idle
-from . import HintAndLeave
-from . import SceneChangeFrequently
-from . import TwoHints
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
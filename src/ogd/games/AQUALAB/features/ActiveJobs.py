@@ -10,6 +10,7 @@ from ogd.core.generators.extractors.Feature import Feature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class ActiveJobs(Feature):
 
@@ -30,9 +31,7 @@ class ActiveJobs(Feature):
         return []
 
     def _updateFromEvent(self, event:Event) -> None:
-        _current_job = event.GameState.get('job_name', event.EventData.get('job_name', None))
-        if isinstance(_current_job, dict):
-            _current_job = _current_job['string_value']
+        _current_job = EventFields.StateValue(event, 'job_name', None)
 
         if self._validate_job(_current_job):
             user_code = event.UserID
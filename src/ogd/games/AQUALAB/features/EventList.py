@@ -8,6 +8,7 @@ from ogd.core.generators.Generator import GeneratorParameters
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class EventList(Feature):
 
@@ -70,9 +71,7 @@ class EventList(Feature):
         return []
 
     def _updateFromEvent(self, event:Event) -> None:
-        _job_name = event.GameState.get('job_name', event.EventData.get('job_name', "UNDEFINED"))
-        if isinstance(_job_name, dict):
-            _job_name = _job_name['string_value']
+        _job_name = EventFields.StateValue(event, 'job_name', "UNDEFINED")
 
         if event.UserID:
             next_event = {
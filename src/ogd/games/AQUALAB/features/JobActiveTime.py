@@ -9,6 +9,7 @@ from ogd.games.AQUALAB.features.PerJobFeature import PerJobFeature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class JobActiveTime(PerJobFeature):
 
@@ -54,9 +55,7 @@ class JobActiveTime(PerJobFeature):
         if event.EventName == "accept_job":
             self._last_start_time = event.timestamp
         elif event.EventName == "switch_job":
-            new_job = event.GameState.get('job_name', event.EventData.get('job_name', None))
-            if isinstance(new_job, dict):
-                new_job = new_job['string_value']
+            new_job = EventFields.StateValue(event, 'job_name', None)
 
             if new_job is None:
                 raise KeyError("Could not find key 'job_name' in GameState or EventData!")
@@ -103,9 +102,7 @@ class JobActiveTime(PerJobFeature):
     def _validateEventCountIndex(self, event:Event):
         ret_val : bool = False
 
-        _current_job = event.GameState.get('job_name', event.EventData.get('job_name', None))
-        if isinstance(_current_job, dict):
-            _current_job = _current_job['string_value']
+        _current_job = EventFields.StateValue(event, 'job_name', None)
 
         if _current_job is None:
             raise KeyError("Could not find key 'job_name' in GameState or EventData!")
@@ -10,6 +10,7 @@ from ogd.games.AQUALAB.features.PerJobFeature import PerJobFeature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class JobCompletionTime(PerJobFeature):
 
@@ -47,9 +48,7 @@ class JobCompletionTime(PerJobFeature):
                 self._time += (event.timestamp - self._job_start_time).total_seconds()
                 self._job_start_time = None
             else:
-                _completed_job = event.GameState.get('job_name', event.EventData.get('job_name', "JOB NAME NOT FOUND"))
-                if isinstance(_completed_job, dict):
-                    _completed_job = _completed_job['string_value']
+                _completed_job = EventFields.StateValue(event, 'job_name', "JOB NAME NOT FOUND")
 
                 callstack = [f"{_getFilename(inspect.stack()[i].filename)}.{inspect.stack()[i].function}" for i in range(min(11, len(inspect.stack())))]
                 Logger.Log(f"In {callstack}:\n  {event.user_id} ({event.session_id}) completed job {_completed_job} with no active start time!", logging.DEBUG)
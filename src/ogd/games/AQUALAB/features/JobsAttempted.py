@@ -11,6 +11,7 @@ from ogd.core.generators.extractors.Feature import Feature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class JobsAttempted(Feature):
 
@@ -60,9 +61,7 @@ class JobsAttempted(Feature):
                 # self._time += (self._prev_timestamp - self._job_start_time).total_seconds()
                 # self._job_start_time = event.Timestamp
 
-        _current_job = event.GameState.get('job_name', event.EventData.get('job_name', None))
-        if isinstance(_current_job, dict):
-            _current_job = _current_job['string_value']
+        _current_job = EventFields.StateValue(event, 'job_name', None)
 
         if _current_job is None:
             raise KeyError("Could not find key 'job_name' in GameState or EventData!")
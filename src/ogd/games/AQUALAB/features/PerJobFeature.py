@@ -1,34 +1,28 @@
 # import libraries
-import json
 import logging
-from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 # import locals
+from ogd.core.generators.GameMetadataCache import GameMetadataCache
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
 from ogd.common.utils.Logger import Logger
 from ogd.common.models.Event import Event
 from ogd.games import AQUALAB
+from ogd.core.generators.EventFields import EventFields
 
 class PerJobFeature(PerCountFeature):
-    _metadata : Optional[Dict] = None
 
     def __init__(self, params:GeneratorParameters, job_map:dict):
         super().__init__(params=params,)
         self._job_map = job_map
         self._target_job = self._getTargetJobName()
-        if PerJobFeature._metadata is None:
-            PerJobFeature._metadata = PerJobFeature._loadMetadata()
 
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     def _validateEventCountIndex(self, event:Event):
         ret_val : bool = False
 
-        job_name = event.GameState.get('job_name', event.EventData.get('job_name', "JOB NAME NOT FOUND"))
-
-        if type(job_name) is dict:
-            job_name = job_name['string_value']
+        job_name = EventFields.StateValue(event, 'job_name', "JOB NAME NOT FOUND")
 
         # If event occurred in the instance's target job, accept it.
         if job_name is not None:
@@ -48,6 +42,25 @@ class PerJobFeature(PerCountFeature):
 
         return ret_val
 
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        job_name = EventFields.StateValue(event, 'job_name', "JOB NAME NOT FOUND")
+        if job_name is None:
+            # let every instance see the event, so they can each report the bad data.
+            return None
+
+        ret_val = []
+        if job_name in self._job_map:
+            ret_val.append(self._job_map[job_name])
+        if event.EventName == "switch_job":
+            pre_job_name = event.EventData.get("prev_job_name", "PREVIOUS JOB NOT FOUND")
+            if pre_job_name in self._job_map:
+                ret_val.append(self._job_map[pre_job_name])
+        if event.EventName == "recommended_job":
+            attempted_job_name = event.EventData.get("attempted_job_name", "ATTEMPTED JOB NOT FOUND")
+            if attempted_job_name in self._job_map:
+                ret_val.append(self._job_map[attempted_job_name])
+        return ret_val
+
     # *** Optionally override public functions. ***
 
     @staticmethod
@@ -63,15 +76,14 @@ class PerJobFeature(PerCountFeature):
     # *** Private Functions ***
 
     @classmethod
-    def _loadMetadata(cls) -> Dict:
+    def _loadMetadata(cls) -> Dict[str, Any]:
         ret_val = {}
 
-        _dbexport_path = Path(AQUALAB.__file__) if Path(AQUALAB.__file__).is_dir() else Path(AQUALAB.__file__).parent
+        _dbexport_path = GameMetadataCache.MetadataPath(AQUALAB)
         try:
-            with open(_dbexport_path / "DBExport.json", "r") as file:
-                ret_val = json.load(file)
+            ret_val = GameMetadataCache.GetMetadata(path=_dbexport_path)
         except FileNotFoundError:
-            Logger.Log(f"In PerJobFeature, could not open file {_dbexport_path / "DBExport.json"}, the file does not exist!")
+            Logger.Log(f"In PerJobFeature, could not open file {_dbexport_path}, the file does not exist!")
 
         return ret_val
 
@@ -81,7 +93,7 @@ class PerJobFeature(PerCountFeature):
         if self.CountIndex == 0:
             ret_val = "no-active-job"
         else:
-            job_list = PerJobFeature._metadata.get("jobs", []) if PerJobFeature._metadata is not None else []
+            job_list = PerJobFeature._loadMetadata().get("jobs", [])
 
             # we'll access CountIndex - 1, since index 0 is for no-active-job, so index 1 will be for 0th item in list of jobs.
             job_dict = job_list[self.CountIndex - 1] if len(job_list) >= self.CountIndex else {}
@@ -10,6 +10,7 @@ from ogd.core.generators.extractors.Feature import Feature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
+from ogd.core.generators.EventFields import EventFields
 
 class TopJobCompletionDestinations(Feature):
 
@@ -30,9 +31,7 @@ class TopJobCompletionDestinations(Feature):
         return []
 
     def _updateFromEvent(self, event:Event) -> None:
-        _job_name = event.GameState.get('job_name', event.EventData.get('job_name', None))
-        if isinstance(_job_name, dict):
-            _job_name = _job_name['string_value']
+        _job_name = EventFields.StateValue(event, 'job_name', None)
 
         if _job_name is None:
             raise KeyError("Could not find key 'job_name' in GameState or EventData!")
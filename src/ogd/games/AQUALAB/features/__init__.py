@@ -95,95 +95,6 @@ __all__ = [
     "PopulationJobSwitchProgression",
 ]
 
-from . import ActiveJobs
-from . import ActiveTime
-from . import AppVersions
-from . import AverageSessionTime
-from . import EchoSessionID
-from . import EventList
-from . import ExperimentalCondition
-from . import PlayedNonexperimentalVersion
-from . import FinalBestiary
-from . import FollowedAdvice
-from . import JobActiveTime
-from . import JobArgumentation
-from . import JobArgumentationFails
-from . import JobArgumentationNoReject
-from . import JobArgumentationSuccessRatio
-from . import JobArgumentationSuccessRatioPerDifficulty
-from . import JobArgumentationRejects
-from . import JobAttempted
-from . import JobTotalAttempts
-from . import JobTotalHelpCount
-from . import JobComplete
-from . import JobCompletionTime
-from . import JobDiveSitesCount
-from . import JobDiveTime
-from . import JobExperimentation
-from . import JobGuideCount
-from . import JobHelpCount
-from . import JobInterventionFails
-from . import JobLocationChanges
-from . import JobLocationChangesNoKelp
-from . import JobQuitsPerComplete
-from . import JobModeling
-from . import JobName
-from . import JobPlayTime
-from . import JobPriorAttempt
-from . import JobPriorComplete
-from . import JobsAttempted
-from . import JobsCompleted
-from . import JobRecommendationReceived
-from . import JobStarted
-from . import JobTasksCompleted
-from . import JobTriesInArgument
-from . import JobTriesInArgumentPerDifficulty
-from . import QuitJob
-from . import ModelExportCount
-from . import ModelInterveneCount
-from . import ModelPredictCount
-from . import PerJobFeature
-from . import PlayerSummary
-from . import PlayLocations
-from . import PopulationSummary
-from . import RegionJobCount
-from . import RegionName
-from . import SessionDiveSitesCount
-from . import SessionJobsCompleted
-from . import SessionDuration
-from . import SessionDurationPerJob
-from . import SessionGuideCount
-from . import SessionHelpCount
-from . import SessionID
-from . import SuccessfulAdvice
-from . import SurveyCompleted
-from . import SurveyItemResponse
-from . import SwitchJobsCount
-from . import SyncCompletionTime
-from . import TankRulesCount
-from . import TopJobCompletionDestinations
-from . import TopJobSwitchDestinations
-from . import TotalJobQuits
-from . import TotalJobRecommendationReceived
-from . import TotalArcticTime
-from . import TotalArgumentationTime
-from . import TotalBayouTime
-from . import TotalCoralTime
-from . import TotalDiveTime
-from . import TotalExperimentationTime
-from . import TotalGuideCount
-from . import TotalHelpCount
-from . import TotalKelpTime
-from . import TotalModelingTime
-from . import TotalPlayTime
-from . import TotalSessionTime
-from . import TotalPopulationTime
-from . import TotalPlayerTime
-from . import TimeInJournal
-from . import UserAvgActiveTime
-from . import UserAvgSessionDuration
-from . import UserTotalSessionDuration
-from . import PlayerProgressionJobNodes
-from . import PlayerProgressionLinks
-from . import PopulationJobCompletionProgression
-from . import PopulationJobSwitchProgression
\ No newline at end of file
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
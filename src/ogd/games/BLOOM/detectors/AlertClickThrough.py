@@ -59,9 +59,6 @@ class AlertClickThrough(Detector):
                 ]
 
     def _updateFromEvent(self, event: Event) -> None:
-        # if the session ID changed, assume we reset out of any active alert.
-        if event.SessionID != self._last_session and self._last_session is not None:
-            self._reset()
         match event.EventName:
             case "click_local_alert":
                 _alert_type = event.EventData.get("alert_type", "NOT FOUND")
@@ -55,9 +55,6 @@ class CutsceneClickThrough(Detector):
                 ]
 
     def _updateFromEvent(self, event: Event) -> None:
-        # if the session ID changed, assume we reset out of any active cutscene.
-        if event.SessionID != self._last_session and self._last_session is not None:
-            self._reset()
         match event.EventName:
             case "cutscene_start":
                 self._in_cutscene = True
@@ -8,8 +8,6 @@ __all__ = [
     "GoodPolicyCombo"
 ]
 
-from . import AlertClickThrough
-from . import AlertFollowedByInspect
-from . import AlertFollowedByPolicy
-from . import CutsceneClickThrough
-from . import GoodPolicyCombo
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -1,4 +1,5 @@
 # import libraries
+from typing import Iterable, Optional
 # import locals
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
@@ -25,4 +26,9 @@ class PerCountyFeature(PerCountFeature):
         else:
             self.WarningMessage(f"In {type(self).__name__}, for event {event.EventName}, log_version={event.LogVersion}, with game state={event.GameState} no current_county found.")
 
-        return ret_val
\ No newline at end of file
+        return ret_val
+
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        county_name = event.GameState.get('current_county', event.EventData.get('current_county', "COUNTY NAME NOT FOUND"))
+        # unknown counties go to every instance, so they can each report the bad data.
+        return (self.COUNTY_LIST.index(county_name),) if county_name in self.COUNTY_LIST else None
\ No newline at end of file
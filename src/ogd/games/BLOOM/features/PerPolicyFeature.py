@@ -1,4 +1,4 @@
-from typing import List, Any, Optional
+from typing import Any, Iterable, List, Optional
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
 from ogd.common.models.Event import Event
@@ -23,3 +23,8 @@ class PerPolicyFeature(PerCountFeature):
             raise NotImplementedError(f"PerPolicyFeature subclass {type(self).__name__} requested event of type {event.EventName}, but {event.EventName} does not contain a 'policy' in its EventData.")
 
         return ret_val
+
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        policy_name = event.EventData.get('policy', event.EventData.get('policy_name', "POLICY NOT FOUND"))
+        # unknown policies go to every instance, so they can each report the bad data.
+        return (self.POLICY_LIST.index(policy_name),) if policy_name in self.POLICY_LIST else None
@@ -47,47 +47,6 @@ __all__ = [
     # "InspectorResponseCount"
 ]
 
-from . import ActiveJobs
-from . import PerCountyFeature
-from . import PerPolicyFeature
-from . import ActiveTime
-from . import AlertCount
-from . import AlertResponseCount
-from . import AlertReviewCount
-from . import AverageActiveTime
-from . import AverageBuildingInspectTime
-from . import AverageEconomyViewTime
-from . import AveragePhosphorusViewTime
-from . import BloomAlertCount
-from . import BuildingUnlockCount
-from . import CountyBloomAlertCount
-from . import CountyBuildCount
-from . import CountyFailCount
-from . import CountyFinalPolicySettings
-from . import CountyLatestMoney
-from . import CountyUnlockCount
-from . import EconomyViewUnlocked
-from . import FailCount
-from . import JobsAttempted
-from . import GameCompletionStatus
-from . import NumberOfSessionsPerPlayer
-from . import PersistThroughFailure
-from . import SucceededThroughFailure
-from . import CountyPolicyChangeCount
-from . import PersistenceTime
-from . import PhosphorusViewUnlocked
-from . import PlayerSummary
-from . import PopulationSummary
-from . import PolicyUnlocked
-from . import CountyUnlockTime
-from . import QuitOnBloomFail
-from . import QuitOnCityFail
-from . import QuitOnBankruptcy
-from . import TopJobSwitchDestinations
-from . import TopJobCompletionDestinations
-from . import BuildingInspectorTabCount
-from . import GoodPolicyCount
-from . import PlayerProgression
-from . import PopulationProgression
-# from . import PhosphorusViewTime
-# from . import InspectorResponseCount
\ No newline at end of file
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
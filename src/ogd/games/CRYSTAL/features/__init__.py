@@ -4,4 +4,6 @@ __all__ = [
     "CrystalExtractor"
 ]
 
-from . import CrystalExtractor
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -1,3 +1,5 @@
+# import standard libraries
+from typing import Iterable, Optional
 # import locals
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
@@ -36,4 +38,11 @@ class PerSceneFeature(PerCountFeature):
     # *** PRIVATE METHODS ***
 
     def _validateEventCountIndex(self, event:Event):
-        return event.EventData['scene_name'] == scenes_list[self.CountIndex]
\ No newline at end of file
+        return event.EventData['scene_name'] == scenes_list[self.CountIndex]
+
+    def _eventCountIndices(self, event:Event) -> Optional[Iterable[int]]:
+        try:
+            scene_name = event.EventData['scene_name']
+        except KeyError:
+            return None
+        return [i for i, scene in enumerate(scenes_list) if scene == scene_name]
@@ -12,14 +12,6 @@ __all__ = [
     "SceneFailureCount"
 ]
 
-# aggregate features
-from . import ScenesEncountered
-from . import Session_Language
-from . import SessionDuration
-from . import HeadsetOnCount
-from . import ObjectSelectionsDuringVoiceover
-from . import SceneFailureCount
-# percount features
-from . import SceneFailures
-from . import TaskTimeToComplete
-from . import SceneDuration
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
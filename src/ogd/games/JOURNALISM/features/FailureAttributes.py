@@ -8,6 +8,7 @@ from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
 from ogd.core.generators.Generator import GeneratorParameters
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.extractors.SessionFeature import SessionFeature
 
 
@@ -51,7 +52,7 @@ class FailureAttributes(PerLevelFeature):
         :type event: Event
         """
         attribs = ["endurance", "resourceful", "tech", "social", "trust", "research"]
-        stats = json.loads(event.GameState.get("current_stats", str([None]*len(attribs))))
+        stats = EventFields.GameStateJSON(event, "current_stats") if "current_stats" in event.GameState else json.loads(str([None]*len(attribs)))
         self._fails.append(dict(zip(attribs, stats)))
         return
 
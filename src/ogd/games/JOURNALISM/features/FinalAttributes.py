@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 # import locals
 from ogd.core.generators.extractors.PerLevelFeature import PerLevelFeature
 from ogd.core.generators.Generator import GeneratorParameters
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.extractors.PerCountFeature import PerCountFeature
 from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
@@ -29,7 +30,7 @@ class FinalAttributes(PerLevelFeature):
     def _updateFromEvent(self, event:Event) -> None:
         #self._story_alignment = event.EventData["story_alignment"]
         _default = str([None]*len(self._ATTRIBUTE_ENUM))
-        _stats = json.loads(event.GameState.get("current_stats", _default))
+        _stats = EventFields.GameStateJSON(event, "current_stats") if "current_stats" in event.GameState else json.loads(_default)
         self._last_attribs = dict(zip(self._ATTRIBUTE_ENUM, _stats))
 
     def _updateFromFeatureData(self, feature:FeatureData):
@@ -6,6 +6,7 @@ from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
 from ogd.core.generators.Generator import GeneratorParameters
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.extractors.SessionFeature import SessionFeature
 
 
@@ -54,7 +55,7 @@ class TopAttribute(SessionFeature):
         
         skill_str = event.GameState.get("current_stats", None)
         if skill_str:
-            skill_vals : List[int] = json.loads(skill_str)
+            skill_vals : List[int] = EventFields.GameStateJSON(event, "current_stats")
             self._top_value = max(skill_vals)
             #get lowest val in list 
             self._top_names = [self._ATTRIBUTE_ENUM[i] for i,val in enumerate(skill_vals) if val == self._top_value]
@@ -93,7 +93,9 @@ class UserPlayTime(SessionFeature):
         :rtype: List[Any]
         """
 
-        return [self._cumulative_play_time, self._cumulative_active_time, self._cumulative_active_time.total_seconds()]
+        # a player whose sessions had no active time yet has nothing to convert to seconds.
+        _active_seconds = self._cumulative_active_time.total_seconds() if self._cumulative_active_time is not None else None
+        return [self._cumulative_play_time, self._cumulative_active_time, _active_seconds]
 
 
     # *** Optionally override public functions. ***
@@ -7,6 +7,7 @@ from ogd.common.models.Event import Event
 from ogd.common.models.enums.ExtractionMode import ExtractionMode
 from ogd.common.models.FeatureData import FeatureData
 from ogd.core.generators.Generator import GeneratorParameters
+from ogd.core.generators.EventFields import EventFields
 from ogd.core.generators.extractors.SessionFeature import SessionFeature
 import json
 
@@ -54,7 +55,7 @@ class WinningAttributes(SessionFeature):
         # Note that this function runs once on each Event whose name matches one of the strings returned by _eventFilter()
         #
         # e.g. check if the event name contains the substring "Click," and if so set self._found_click to True
-        self._current_stats = json.loads(event.game_state["current_stats"])
+        self._current_stats = EventFields.GameStateJSON(event, "current_stats")
         
         
         
@@ -45,45 +45,6 @@ __all__ = [
     "PlayerProgression"
 ]
 
-from . import TextClickCount
-from . import StoryEditorTime
-from . import ChoiceClickCount
-from . import SessionPlayTime
-from . import SnippetReceivedCount
-from . import MeanSnippetTime
-from . import StoryCompleteTime
-from . import SkillSequenceCount
-from . import TotalLevelTime
-from . import FinalAttributes
-from . import PlayerAttributes
-from . import WinningAttributes
-from . import StoryAlignment
-from . import QuitLevel
-from . import QuitType
-from . import WorstAttribute
-from . import WorstPlayerAttribute
-from . import TopAttribute
-from . import TopPlayerAttribute
-from . import MaxedPlayerAttribute
-from . import LevelCompleteCount
-from . import LevelCompleted
-from . import TotalFails
-from . import FailureAttributes
-from . import FailureCount
-from . import ContinuesOnFail
-from . import PlayTime
-from . import UserPlayTime
-from . import GameComplete
-from . import QuitNode
-from . import SnippetReplace
-from . import AttributeView
-from . import EditorNoteOpen
-from . import TopPlayerQuitType
-from . import StoryScore
-from . import StoryAlignmentSequence
-from . import StoryScoreSequence
-from . import LevelTime
-from . import SnippetsCollected
-from . import SnippetsSubmitted
-from . import CompletedSurvey
-from . import PlayerProgression
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
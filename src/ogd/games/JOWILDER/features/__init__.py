@@ -26,26 +26,6 @@ __all__ = [
     "InteractionTextBoxesPerSecond"
 ]
 
-from . import QuestionAnswers
-from . import SurveyItem
-from . import Interaction
-from . import SurveyTime
-from . import Clicks
-from . import Hovers
-from . import SessionDuration
-from . import InteractionName
-from . import NotebookUses
-from . import EventCount
-from . import UserEnabled
-from . import GameVersion
-from . import UsedSaveCode
-from . import GameScript
-from . import SessionStart
-from . import IdleState
-from . import ActiveStateTime
-from . import MeaningfulActions
-from . import FirstInteraction
-from . import LastInteraction
-from . import UsedContinue
-from . import InteractionWordsPerSecond
-from . import InteractionTextBoxesPerSecond
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
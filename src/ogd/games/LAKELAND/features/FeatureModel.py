@@ -2,6 +2,9 @@
 import abc
 import typing
 import logging
+import numbers
+import re
+import numpy as np
 ## import local libraries
 from models.Model import *
 
@@ -25,4 +28,66 @@ class FeatureModel(Model):
     #  @return     : A result for the given row of data
     @abc.abstractmethod
     def _eval(self, row: typing.Dict):
-        pass
\ No newline at end of file
+        pass
+
+    ## Sort the names of a map of model coefficients into the kinds of terms used by _eval, so a batch of rows can be evaluated with matrix operations.
+    #  Feature coefficients become a weight vector, with one column per feature name,
+    #  enum coefficients (feature_name.enum_val) become (feature_name, enum_val, weight) indicator terms,
+    #  and "Intercept" is summed into a constant.
+    #
+    #  @param coefficient_map : A mapping of coefficient names to the coefficient values.
+    #  @return                : A tuple of the feature column names, their weight vector, the enum indicator terms, and the intercept.
+    @staticmethod
+    def _compileCoefficients(coefficient_map: typing.Dict[str, float]) -> typing.Tuple[typing.List[str], np.ndarray, typing.List[typing.Tuple[str, str, float]], float]:
+        columns   : typing.List[str] = []
+        weights   : typing.List[float] = []
+        enums     : typing.List[typing.Tuple[str, str, float]] = []
+        intercept : float = 0.0
+        for coeff_name, coeff in coefficient_map.items():
+            if coeff_name == "Intercept":
+                intercept += coeff
+            elif coeff_name == "display_name":
+                pass
+            elif re.search(r"\w+\.\w+", coeff_name):
+                pieces = coeff_name.split(".")
+                enums.append((pieces[0], pieces[1], coeff))
+            else:
+                columns.append(coeff_name)
+                weights.append(coeff)
+        return columns, np.array(weights, dtype=float), enums, intercept
+
+    ## Calculate the linear combination b0 + b1*x1 + ... + bn*xn for each of a batch of rows, as a single matrix operation.
+    #  Gives the same results as summing the terms row by row, as in _eval: a coefficient whose feature is missing from a row adds nothing to that row.
+    #  Rows that _eval would treat differently from the compiled terms are not evaluated, and None is returned so the caller can fall back on _eval.
+    #  That is the case when a feature value is not a real number (e.g. a numeric string, or None, which _eval rejects with a TypeError),
+    #  or when a row has a column named after an enum or special coefficient (e.g. "feature.Foo" or "Intercept"), which _eval multiplies as a feature.
+    #
+    #  @param rows      : A list of rows, each a mapping of column names to values.
+    #  @param columns   : The names of the feature columns, as given by _compileCoefficients.
+    #  @param weights   : The weight vector of the feature columns, as given by _compileCoefficients.
+    #  @param enums     : The enum indicator terms, as given by _compileCoefficients.
+    #  @param intercept : The intercept, as given by _compileCoefficients.
+    #  @return          : A vector with one result per row, or None if the rows must be evaluated one at a time by _eval.
+    @staticmethod
+    def _linearBatch(rows: typing.List[typing.Dict], columns: typing.List[str], weights: np.ndarray,
+                     enums: typing.List[typing.Tuple[str, str, float]], intercept: float) -> typing.Optional[np.ndarray]:
+        ret_val = np.full(len(rows), intercept, dtype=float)
+        if len(rows) == 0:
+            return ret_val
+        term_names = {f"{col}.{val}" for col, val, _ in enums} | {"Intercept", "display_name"}
+        for row in rows:
+            if not term_names.isdisjoint(row.keys()):
+                return None
+            if not all(isinstance(row[col], numbers.Real) for col in columns if col in row):
+                return None
+        if len(columns) > 0:
+            features = np.array([[row.get(col, 0.0) for col in columns] for row in rows], dtype=float)
+            ret_val += features @ weights
+        if len(enums) > 0:
+            indicators = np.array([[1.0 if row.get(col, None) == val else 0.0 for col, val, _ in enums] for row in rows], dtype=float)
+            ret_val += indicators @ np.array([coeff for _, _, coeff in enums], dtype=float)
+        missing = {col for col in columns if any(col not in row for row in rows)} \
+                | {f"{col}.{val}" for col, val, _ in enums if any(col not in row for row in rows)}
+        for coeff_name in sorted(missing):
+            print(f"Found an element of model that is not a feature: {coeff_name}")
+        return ret_val
@@ -4,6 +4,7 @@ import logging
 import math
 import re
 import typing
+import numpy as np
 ## import local libraries
 from models.FeatureModel import FeatureModel
 
@@ -12,6 +13,27 @@ class LogisticModel(FeatureModel):
     def __init__(self, coefficient_map: typing.Dict[str, float], levels: typing.List[int] = []):
         super().__init__(levels)
         self._coeff_map = coefficient_map
+        # coefficients are sorted into feature weights, enum indicators, and intercept once, so Eval does not re-parse the names for every row.
+        self._columns, self._weights, self._enums, self._intercept = FeatureModel._compileCoefficients(coefficient_map)
+
+    ## Evaluate the model for a batch of rows at once, as matrix operations over the compiled coefficients.
+    #  Gives the same results as calling _eval once per row, within floating-point tolerance,
+    #  and falls back on _eval for batches that cannot be evaluated as a matrix, see FeatureModel._linearBatch.
+    #
+    #  @param rows : A list of rows, where each row is a session's mapping of feature names to values.
+    #  @return     : A list with one result per row.
+    def Eval(self, rows: typing.List) -> typing.List:
+        logit = FeatureModel._linearBatch(rows, self._columns, self._weights, self._enums, self._intercept)
+        if logit is not None:
+            # a very negative logit overflows exp, which math.exp in _eval raises as an OverflowError, so that batch is left to _eval.
+            try:
+                with np.errstate(over="raise"):
+                    p = 1 / (1 + np.exp(-logit))
+            except FloatingPointError:
+                pass
+            else:
+                return p.tolist()
+        return [self._eval(row) for row in rows]
 
     ## Function to evaluate a logistic regression model, creating a prediction.
     #  This is based around the equation for probability of Y=1, denoted as p:
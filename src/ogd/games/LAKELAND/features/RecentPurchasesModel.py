@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 from models.SequenceModel import SequenceModel
+from collections import deque
 import datetime
 
 
@@ -24,6 +25,25 @@ class RecentPurchasesModel(SequenceModel):
         '''
         super().__init__()
 
+    def Reset(self) -> None:
+        super().Reset()
+        # ring buffer of (item, time) for the 10 most recent successful purchases, and the time of the latest event.
+        self._purchases : deque = deque(maxlen=10)
+        self._now       : Optional[datetime.datetime] = None
+
+    def Update(self, event: Dict[str, Any]) -> None:
+        self._now = SequenceModel._eventTime(event)
+        if event["event_custom"] == 7 and event["event_data_complex"]["success"]:
+            self._purchases.append((event["event_data_complex"]["buy"], self._now))
+
+    def Current(self) -> List[List[int]]:
+        assert self._now is not None
+        ret_val : List[List[int]] = [[] for _ in range(8)]
+        for item, event_time in reversed(self._purchases):
+            if item in {1, 2, 3, 4, 5, 6, 7, 8}:
+                ret_val[int(item) - 1].append((self._now - event_time).total_seconds())
+        return ret_val
+
     def _eval(self, events: List[Dict[str, Any]], verbose: bool = False) -> List[List[int]]:
         assert events
         homes = []
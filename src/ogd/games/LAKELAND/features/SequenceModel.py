@@ -3,6 +3,7 @@ import abc
 import typing
 from typing import List, Dict, Any
 import logging
+import datetime
 ## import local libraries
 from models.Model import *
 
@@ -13,9 +14,37 @@ from models.Model import *
 class SequenceModel(Model):
     def __init__(self, levels: typing.List[int] = []):
         super().__init__(levels=levels, input_type=ModelInputType.SEQUENCE)
+        self._events : List[Dict[str, Any]] = []
+        self.Reset()
 
+    ## Evaluate the model over a list of events, by feeding each one to Update, and taking the Current result.
+    #
+    #  @param rows : A list of rows of data for a session, in the order they occurred.
+    #  @return     : The result of the model after the last of the rows.
     def Eval(self, rows: typing.List) -> typing.List:
-        return self._eval(rows)
+        self.Reset()
+        for row in rows:
+            self.Update(row)
+        return self.Current()
+
+    ## Add one event to the state of the model, for realtime use, where a new event arrives after the model was last evaluated.
+    #  By default, the event is just kept, and the model is calculated from all kept events by Current.
+    #  Models that can keep a running state (e.g. counters, or a ring buffer of the last few events) should override
+    #  Update, Current, and Reset, so that Current does not need to rescan the events.
+    #
+    #  @param event : A row of data for an event, with the same keys as the rows given to _eval.
+    def Update(self, event: Dict[str, Any]) -> None:
+        self._events.append(event)
+
+    ## Get the result of the model for all events given to Update since the last Reset.
+    #
+    #  @return : The result of the model, the same as _eval would give for the list of events.
+    def Current(self) -> Any:
+        return self._eval(self._events)
+
+    ## Clear the state of the model, so it can be given a new sequence of events.
+    def Reset(self) -> None:
+        self._events = []
 
     ## Abstract declaration of a function to perform calculation of a model results from a row.
     #
@@ -27,4 +56,13 @@ class SequenceModel(Model):
     #  @return     : A result for the given row of data
     @abc.abstractmethod
     def _eval(self, rows: List[Dict[str, Any]]) -> Any:
-        pass
\ No newline at end of file
+        pass
+
+    ## Get the time of an event as a datetime, parsing it if it is still a string.
+    #  Incremental models call this once per event, in Update, rather than every time the model is calculated.
+    @staticmethod
+    def _eventTime(event: Dict[str, Any]) -> datetime.datetime:
+        event_time = event["client_time"]
+        if type(event_time) is str:
+            event_time = datetime.datetime.fromisoformat(event_time)
+        return event_time
@@ -91,6 +91,25 @@ class TimeSinceEventTypesModel(SequenceModel):
 
         super().__init__()
 
+    def Reset(self) -> None:
+        super().Reset()
+        self._first_time : Optional[datetime.datetime] = None
+        self._last_match : Optional[datetime.datetime] = None
+        self._now        : Optional[datetime.datetime] = None
+
+    def Update(self, event: Dict[str, Any]) -> None:
+        self._now = SequenceModel._eventTime(event)
+        if self._first_time is None:
+            self._first_time = self._now
+        if any(f(event) for f in self._parsed_filters[event["event_custom"]]):
+            self._last_match = self._now
+
+    def Current(self) -> Optional[float]:
+        if self._now is None:
+            return None
+        since = self._last_match if self._last_match is not None else self._first_time
+        return (self._now - since).total_seconds()
+
     def _eval(self, events: List[Dict[str, Any]], verbose: bool = False) -> Optional[float]:
         if not events:
             return None
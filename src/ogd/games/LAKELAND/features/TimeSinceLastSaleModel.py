@@ -17,6 +17,20 @@ class TimeSinceLastSaleModel(SequenceModel):
         '''
         super().__init__()
 
+    def Reset(self) -> None:
+        super().Reset()
+        self._now       : Optional[datetime.datetime] = None
+        self._last_sale : Optional[datetime.datetime] = None
+
+    def Update(self, event: Dict[str, Any]) -> None:
+        self._now = SequenceModel._eventTime(event)
+        if event["event_custom"] == 37:
+            self._last_sale = self._now
+
+    def Current(self) -> Optional[int]:
+        assert self._now is not None
+        return (self._now - self._last_sale).seconds if self._last_sale is not None else None
+
     def _eval(self, events: List[Dict[str, Any]], verbose: bool = False) -> Optional[int]:
         assert events
         now = events[-1]["client_time"]
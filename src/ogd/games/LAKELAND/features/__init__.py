@@ -4,4 +4,6 @@ __all__ = [
     "LakelandExtractor", "HouseBuildCount", "DairyBuildCount", "CropBuildCount", "TotalBuildCount", "HoversBeforeCropPlacement", "TotalEventsPerSession", "TotalSessionTime"
 ]
 
-from . import LakelandExtractor, HouseBuildCount, DairyBuildCount, CropBuildCount, TotalBuildCount, HoversBeforeCropPlacement, TotalEventsPerSession, TotalSessionTime
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
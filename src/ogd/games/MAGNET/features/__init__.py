@@ -4,4 +4,6 @@ __all__ = [
     "MagnetExtractor"
 ]
 
-from . import MagnetExtractor
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
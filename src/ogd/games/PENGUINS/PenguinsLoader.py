@@ -1,11 +1,11 @@
 ## import standard libraries
-import json
 from pathlib import Path
-from typing import Any, Callable, Dict, Final, List, Optional
+from typing import Any, Callable, Dict, Final, List, Optional, Sequence
 ## import local files
 from . import features
 from ogd.games import PENGUINS
 from ogd.core.generators.detectors.Detector import Detector
+from ogd.core.generators.GameMetadataCache import GameMetadataCache
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.generators.extractors.Feature import Feature
@@ -40,13 +40,9 @@ class PenguinsLoader(GeneratorLoader):
         :type feature_overrides: Optional[List[str]]
         """
         super().__init__(player_id=player_id, session_id=session_id, game_schema=game_schema, mode=mode, feature_overrides=feature_overrides)
-        self._region_map : List[Dict[str, Any]] = []
-
-        # Load Penguins jobs export and map job names to integer values
-        _dbexport_path = Path(PENGUINS.__file__) if Path(PENGUINS.__file__).is_dir() else Path(PENGUINS.__file__).parent
-        with open(_dbexport_path / "DBExport.json", "r") as file:
-            export = json.load(file)
-            self._region_map = export.get("regions", [])
+        # Load Penguins regions from the export, shared by all loaders in the process.
+        self._region_map : Sequence[Dict[str, Any]] = GameMetadataCache.GetDerived(path=GameMetadataCache.MetadataPath(PENGUINS), key="PenguinsLoader",
+                                                                                   builder=lambda export : tuple(export.get("regions", [])))
 
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
     @staticmethod
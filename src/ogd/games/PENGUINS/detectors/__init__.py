@@ -4,7 +4,7 @@ __all__ = [
     "RegionEnter",
     "RegionExit"
 ]
-# aggregated features
 
-from . import RegionEnter
-from . import RegionExit
\ No newline at end of file
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -12,12 +12,6 @@ __all__ = [
     "NPuzzleAttempted"
 ]
 
-from . import MoveShapeCount
-from . import SessionID
-from . import FunnelByUser
-from . import LevelsOfDifficulty
-from . import SequenceBetweenPuzzles
-from . import SequenceWithinPuzzles
-from . import NCompleted
-from . import SubmitByPuzzle
-from . import NPuzzleAttempted
\ No newline at end of file
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
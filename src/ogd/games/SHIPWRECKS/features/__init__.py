@@ -17,17 +17,6 @@ __all__ = [
     "TotalDiveTime"
 ]
 
-from . import ActiveJobs
-from . import EventList
-from . import EvidenceBoardCompleteCount
-from . import JobsAttempted
-from . import JobsCompleted
-from . import PlayerSummary
-from . import PopulationSummary
-from . import MissionDiveTime
-from . import MissionSonarTimeToComplete
-from . import SessionDuration
-from . import SessionID
-from . import TopJobCompletionDestinations
-from . import TopJobSwitchDestinations
-from . import TotalDiveTime
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -1,6 +1,5 @@
 # import standard libraries
 import itertools
-import json
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 # OGD imports
@@ -11,6 +10,7 @@ from ogd.common.utils.utils import loadJSONFile
 from ogd.common.utils.Logger import Logger
 # import local files
 from ogd.core.generators.detectors.Detector import Detector
+from ogd.core.generators.GameMetadataCache import GameMetadataCache
 from ogd.core.generators.Generator import GeneratorParameters
 from ogd.core.generators.GeneratorLoader import GeneratorLoader
 from ogd.core.generators.extractors.Feature import Feature
@@ -46,9 +46,7 @@ class ThermoLabLoader(GeneratorLoader):
         data = None
 
         # Load ThermoLab jobs export and map job names to integer values
-        _dbexport_path = Path(THERMOLAB.__file__) if Path(THERMOLAB.__file__).is_dir() else Path(THERMOLAB.__file__).parent
-        with open(_dbexport_path / "DBExport.json", "r") as file:
-            export = json.load(file)
+        export = GameMetadataCache.GetMetadata(path=GameMetadataCache.MetadataPath(THERMOLAB))
 
             # task_num = 1
             # for i, lab in enumerate(export["labs"], start=1):
@@ -5,5 +5,6 @@ __all__ = [
 
 ]
 
-# from . import JobTriesInArgument
-from . import SliderMove
\ No newline at end of file
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -15,15 +15,6 @@ __all__ = [
     "CorrectAnswerOnFirstGuess",
 ]
 
-from . import LabCompleteCount
-from . import LeftHandMoves
-from . import RightHandMoves
-from . import PhasesReached
-from . import PlayMode
-from . import TaskCompleteCount
-from . import ToolNudgeCount
-from . import ToolSliderTime
-from . import SectionCompleteCount
-from . import TotalPlayTime
-from . import AnswerAttemptsCount
-from . import CorrectAnswerOnFirstGuess
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
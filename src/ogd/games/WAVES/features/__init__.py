@@ -48,48 +48,6 @@ __all__ = [
     "SequenceLevel"
 ]
 
-from . import TotalSliderMoves
-from . import TotalArrowMoves
-from . import TotalLevelTime
-from . import SliderAverageStandardDeviations
-from . import TotalMoveTypeChanges
-from . import SliderAverageRange
-from . import TotalResets
-from . import TotalFails
-from . import TotalSkips
-from . import MenuButtonCount
-from . import BeginCount
-from . import SucceedCount
-from . import SessionSucceedCount
-from . import Completed
-from . import PercentAmplitudeMoves
-from . import PercentOffsetMoves
-from . import PercentWavelengthMoves
-from . import AmplitudeGoodMoveCount
-from . import OffsetGoodMoveCount
-from . import WavelengthGoodMoveCount
-from . import PercentAmplitudeGoodMoves
-from . import PercentOffsetGoodMoves
-from . import PercentWavelengthGoodMoves
-from . import FirstMoveType
-from . import ClosenessSlope
-from . import ClosenessIntercept
-from . import ClosenessR2
-from . import RangeSlope
-from . import RangeIntercept
-from . import RangeR2
-from . import QuestionAnswered
-from . import QuestionCorrect
-from . import TimeToAnswerMS
-from . import SessionID
-from . import PersistentSessionID
-from . import AverageSliderMoves
-from . import AverageLevelTime
-from . import AverageMoveTypeChanges
-from . import OverallSliderAverageStandardDeviations
-from . import OverallSliderAverageRange
-from . import OverallPercentAmplitudeMoves
-from . import OverallPercentOffsetMoves
-from . import OverallPercentWavelengthMoves
-from . import AverageFails
-from . import SequenceLevel
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
+
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
@@ -10,13 +10,8 @@ __all__ = [
     "PlayerProgression",
 ]
 
-
-from . import ActiveTime
-from . import JobsAttempted
-from . import TopJobCompletionDestinations
-from . import PuzzleCompletionTime
-from . import QuitCount
-from . import PlayerProgression
 from .utils import _getIndexNameFromEvent
 
+from ogd.core.generators.GeneratorManifest import GeneratorManifest
 
+globals().update(GeneratorManifest.LazyModules(package=__name__, modules=__all__))
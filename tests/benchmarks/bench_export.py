@@ -0,0 +1,317 @@
+'''
+Benchmark of full exports, for the main games.
+
+For each game, a seeded synthetic event stream is generated from the game's schema:
+event names come from the schema's events, and event data and game state are filled in according to each element's type,
+with levels drawn from the game's level range (and AQUALAB job names from its DBExport).
+The stream is then exported by an ExportManager, through an in-memory interface and an outerface that only counts lines.
+Each game runs in its own process, so its peak RSS can be measured separately.
+The benchmark only uses what every version of the export code has, so it can be run on older commits too;
+stage times are only reported where the ExportManager keeps them.
+
+Results are printed as a table, and written as JSON with --output,
+so runs on different commits can be compared, with --compare.
+
+Example commands to be run in the commandline from the project directory:
+python tests/benchmarks/bench_export.py
+python tests/benchmarks/bench_export.py --games AQUALAB WAVES --sessions 200 --output bench.json
+python tests/benchmarks/bench_export.py --output new.json --compare bench.json
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import platform
+import random
+import re
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+from ogd.common.interfaces.EventInterface import EventInterface
+from ogd.common.interfaces.outerfaces.DataOuterface import DataOuterface
+from ogd.common.models.Event import Event, EventSource
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.games.DataElementSchema import DataElementSchema
+from ogd.common.schemas.games.GameSchema import GameSchema
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow
+from ogd.core.managers.ExportManager import ExportManager
+from ogd.core.requests.Request import ExporterRange, Request
+from ogd.core.schemas.configs.ConfigSchema import ConfigSchema
+from ogd import games
+from ogd.games import AQUALAB
+
+GAMES = ["AQUALAB", "BLOOM", "JOURNALISM", "LAKELAND", "WAVES"]
+
+class SyntheticSession:
+    """Generates the events of one synthetic session, keeping a current level (and job, for AQUALAB) that advances as the session goes on."""
+
+    def __init__(self, schema:GameSchema, rand:random.Random, session_id:str, user_id:str, start:datetime, jobs:List[str]):
+        self._schema     = schema
+        self._rand       = rand
+        self._session_id = session_id
+        self._user_id    = user_id
+        self._time       = start
+        self._jobs       = jobs
+        self._levels     = schema.LevelRange if len(schema.LevelRange) > 0 else range(0, 10)
+        self._level      = self._levels[0]
+        self._job        = rand.choice(jobs) if jobs else None
+
+    def Events(self, count:int) -> List[Event]:
+        _events = self._schema.Events
+        ret_val : List[Event] = []
+        for i in range(count):
+            self._time += timedelta(seconds=self._rand.randint(1, 30))
+            if self._rand.random() < 0.05:
+                self._level = min(self._level + 1, self._levels[-1])
+                if self._jobs:
+                    self._job = self._rand.choice(self._jobs)
+            event_schema = self._rand.choice(_events)
+            ret_val.append(Event(session_id=self._session_id, app_id=self._schema.GameName, timestamp=self._time,
+                                 event_name=event_schema.Name, event_data=self._values(event_schema.EventData),
+                                 event_source=EventSource.GAME, app_version="1", log_version="1", user_id=self._user_id,
+                                 user_data={}, game_state=self._values(self._schema.GameState), event_sequence_index=i+1))
+        return ret_val
+
+    def _values(self, elements:Dict[str, Any]) -> Dict[str, Any]:
+        return {name : self._value(name=name, elem_type=element.ElementType if isinstance(element, DataElementSchema) else str(element.get("type", "")))
+                for name, element in elements.items()}
+
+    def _value(self, name:str, elem_type:str) -> Any:
+        elem_type = elem_type.strip()
+        _lower    = elem_type.lower()
+        if elem_type.startswith("Optional["):
+            return None if self._rand.random() < 0.1 else self._value(name=name, elem_type=elem_type[9:-1])
+        elif "|" in elem_type and not elem_type.startswith(("List", "Dict")):
+            return self._value(name=name, elem_type=self._rand.choice(elem_type.split("|")))
+        elif _lower.startswith("enum("):
+            return self._rand.choice([option.strip() for option in elem_type[5:-1].split(",")])
+        elif elem_type in self._schema.EnumDefs:
+            return self._rand.choice(self._schema.EnumDefs[elem_type])
+        elif _lower.startswith("list"):
+            _inner = re.match(r"List\[(.*)\]$", elem_type)
+            return [self._value(name=name, elem_type=_inner.group(1) if _inner and _inner.group(1) else "str") for _ in range(self._rand.randint(0, 3))]
+        elif _lower.startswith("dict"):
+            return {}
+        elif _lower == "int":
+            return self._level if "level" in name.lower() else self._rand.randint(0, 10)
+        elif _lower == "float":
+            return round(self._rand.uniform(0, 100), 3)
+        elif _lower == "bool":
+            return self._rand.random() < 0.5
+        elif _lower == "timedelta":
+            return self._rand.randint(0, 600)
+        elif _lower in {"str", "string"}:
+            if self._jobs and "job" in name.lower():
+                return self._job
+            return f"{name}_{self._rand.randint(0, 9)}"
+        else:
+            return None
+
+def loadJobs() -> List[str]:
+    """Get the AQUALAB job names from its DBExport."""
+    _path = Path(AQUALAB.__file__).parent / "DBExport.json"
+    with open(_path, "r", encoding="utf-8") as export_file:
+        return ["no-active-job"] + [job["id"] for job in json.load(export_file).get("jobs", [])]
+
+def generateEvents(game:str, sessions:int, events_per_session:int, seed:int) -> List[Event]:
+    """Generate a seeded synthetic event stream for a game, with one player for every three sessions."""
+    _games_path = Path(games.__file__) if Path(games.__file__).is_dir() else Path(games.__file__).parent
+    schema = GameSchema.FromFile(game_id=game, schema_path=_games_path / game / "schemas")
+    jobs : List[str] = loadJobs() if game == "AQUALAB" else []
+    rand  = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    ret_val : List[Event] = []
+    for i in range(sessions):
+        session = SyntheticSession(schema=schema, rand=rand, session_id=f"{24000000000 + i}", user_id=f"bench_user_{i // 3}",
+                                   start=start + timedelta(minutes=10*i), jobs=jobs)
+        ret_val += session.Events(count=events_per_session)
+    return ret_val
+
+class MemoryInterface(EventInterface):
+    """Interface serving a list of events from memory, grouped by session."""
+
+    def __init__(self, game_id:str, events:List[Event]):
+        self._sessions : Dict[str, List[Event]] = {}
+        for event in events:
+            self._sessions.setdefault(event.SessionID, []).append(event)
+        self._dates = {"min" : events[0].Timestamp, "max" : events[-1].Timestamp} if events else {"min" : None, "max" : None}
+        super().__init__(game_id=game_id, config=GameSourceSchema(name="BENCH", all_elements={"schema" : "OPENGAMEDATA_BIGQUERY"}, data_sources={}), fail_fast=False)
+        self.Open()
+
+    def _open(self) -> bool:
+        return True
+
+    def _close(self) -> bool:
+        return True
+
+    def _allIDs(self) -> List[str]:
+        return list(self._sessions.keys())
+
+    def _fullDateRange(self) -> Dict[str, Any]:
+        return self._dates
+
+    def _rowsFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None, exclude_rows:Optional[List[str]]=None) -> List[Any]:
+        return []
+
+    def _IDsFromDates(self, min:datetime, max:datetime, versions:Optional[List[int]]=None) -> List[str]:
+        return self._allIDs()
+
+    def _datesFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None) -> Dict[str, Any]:
+        _times = [event.Timestamp for sess_id in id_list for event in self._sessions.get(sess_id, [])]
+        return {"min" : min(_times), "max" : max(_times)} if _times else {"min" : None, "max" : None}
+
+    def EventsFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None, exclude_rows:Optional[List[str]]=None) -> Optional[List[Event]]:
+        _excluded = set(exclude_rows or [])
+        return [event for sess_id in id_list for event in self._sessions.get(sess_id, []) if event.EventName not in _excluded]
+
+    def SessionStats(self, id_list:List[str]) -> List[Tuple[str, int, datetime]]:
+        return [(sess_id, len(self._sessions[sess_id]), max(event.Timestamp for event in self._sessions[sess_id]))
+                for sess_id in id_list if len(self._sessions.get(sess_id, [])) > 0]
+
+class CountingOuterface(DataOuterface):
+    """Outerface that only counts the lines written in each mode, so the output itself doesn't take up memory."""
+
+    def __init__(self, game_id:str, export_modes:Set[ExportMode]):
+        super().__init__(game_id=game_id, config=GameSourceSchema(name="BENCH", all_elements={}, data_sources={}), export_modes=export_modes)
+        self.Counts : Dict[str, int] = {mode.name : 0 for mode in export_modes}
+
+    def _open(self) -> bool:
+        return True
+
+    def _close(self) -> bool:
+        return True
+
+    def _destination(self, mode:ExportMode) -> str:
+        return "count"
+
+    def _removeExportMode(self, mode:ExportMode) -> str:
+        self.Counts.pop(mode.name, None)
+        return mode.name
+
+    def _writeRawEventsHeader(self, header:List[str]) -> None:
+        pass
+
+    def _writeProcessedEventsHeader(self, header:List[str]) -> None:
+        pass
+
+    def _writeSessionHeader(self, header:List[str]) -> None:
+        pass
+
+    def _writePlayerHeader(self, header:List[str]) -> None:
+        pass
+
+    def _writePopulationHeader(self, header:List[str]) -> None:
+        pass
+
+    def _writeRawEventLines(self, events:List[ExportRow]) -> None:
+        self.Counts[ExportMode.EVENTS.name] += len(events)
+
+    def _writeProcessedEventLines(self, events:List[ExportRow]) -> None:
+        self.Counts[ExportMode.DETECTORS.name] += len(events)
+
+    def _writeSessionLines(self, sessions:List[ExportRow]) -> None:
+        self.Counts[ExportMode.SESSION.name] += len(sessions)
+
+    def _writePlayerLines(self, players:List[ExportRow]) -> None:
+        self.Counts[ExportMode.PLAYER.name] += len(players)
+
+    def _writePopulationLines(self, populations:List[ExportRow]) -> None:
+        self.Counts[ExportMode.POPULATION.name] += len(populations)
+
+def runGame(game:str, sessions:int, events_per_session:int, seed:int, settings:Dict[str, Any], modes:List[str]) -> Dict[str, Any]:
+    """Generate and export a synthetic event stream for one game, returning the measurements. Meant to be run in a fresh process."""
+    Logger.std_logger.setLevel(logging.CRITICAL)
+    _start  = time.perf_counter()
+    events  = generateEvents(game=game, sessions=sessions, events_per_session=events_per_session, seed=seed)
+    _gen_time = time.perf_counter() - _start
+
+    export_modes = {ExportMode[mode] for mode in modes}
+    interface    = MemoryInterface(game_id=game, events=events)
+    outerface    = CountingOuterface(game_id=game, export_modes=set(export_modes))
+    request      = Request(range=ExporterRange(date_min=None, date_max=None, ids=interface.AllIDs(), id_mode=IDMode.SESSION),
+                           exporter_modes=set(export_modes), interface=interface, outerfaces={outerface})
+    manager      = ExportManager(config=ConfigSchema(name="bench", all_elements=settings))
+    _start  = time.perf_counter()
+    # some feature code prints as it goes, which shouldn't end up in the results.
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = manager.ExecuteRequest(request=request)
+    _export_time = time.perf_counter() - _start
+    # older versions of the ExportManager don't keep stage times, in which case there are simply none to report.
+    _stages = {stage : delta.total_seconds() for stage, delta in getattr(manager, "StageTimes", {}).items()}
+    return {
+        "game"              : game,
+        "status"            : result.Status.name,
+        "message"           : result.Message if result.Status.name != "SUCCESS" else None,
+        "events"            : len(events),
+        "sessions"          : sessions,
+        "generate_seconds"  : round(_gen_time, 4),
+        "export_seconds"    : round(_export_time, 4),
+        "events_per_second" : round(len(events) / _export_time, 1) if _export_time > 0 else None,
+        "stage_seconds"     : {stage : round(seconds, 4) for stage, seconds in _stages.items()},
+        # ru_maxrss is in kilobytes on Linux, but bytes on macOS.
+        "peak_rss_mb"       : round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1),
+        "lines"             : outerface.Counts,
+    }
+
+def gitCommit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def printResults(results:List[Dict[str, Any]], baseline:Optional[Dict[str, Any]]) -> None:
+    _base = {result["game"] : result for result in baseline["results"]} if baseline is not None else {}
+    print(f"{'game':<12}{'events':>9}{'seconds':>10}{'events/s':>12}{'retrieve':>10}{'process':>10}{'output':>10}{'RSS MB':>9}{'vs base':>9}")
+    for result in results:
+        _stages = result["stage_seconds"]
+        _vs = ""
+        if result["game"] in _base and _base[result["game"]].get("events_per_second") and result["events_per_second"]:
+            _vs = f"{result['events_per_second'] / _base[result['game']]['events_per_second']:.2f}x"
+        _retrieve, _process, _output = (f"{_stages[stage]:.3f}" if stage in _stages else "-" for stage in ["retrieve", "process", "output"])
+        print(f"{result['game']:<12}{result['events']:>9}{result['export_seconds']:>10.3f}{result['events_per_second'] or 0:>12.0f}"
+              f"{_retrieve:>10}{_process:>10}{_output:>10}{result['peak_rss_mb']:>9.1f}{_vs:>9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark full exports of synthetic event streams for the main games.")
+    parser.add_argument("--games", nargs="+", default=GAMES, help="Games to benchmark.")
+    parser.add_argument("--sessions", type=int, default=100, help="Number of sessions to generate per game.")
+    parser.add_argument("--events-per-session", type=int, default=200, help="Number of events to generate per session.")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for the synthetic event streams.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Number of sessions per slice.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for the export.")
+    parser.add_argument("--modes", nargs="+", default=[mode.name for mode in ExportMode], choices=[mode.name for mode in ExportMode], help="Export modes to run.")
+    parser.add_argument("--output", type=Path, default=None, help="File to write the results to, as JSON.")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON results of an earlier run, to compare events/s against.")
+    args = parser.parse_args()
+
+    settings = {"BATCH_SIZE" : args.batch_size, "WORKER_COUNT" : args.workers, "LOG_FILE" : False, "DEBUG_LEVEL" : "ERROR", "FAIL_FAST" : False}
+    results : List[Dict[str, Any]] = []
+    # each game gets a fresh process, so peak RSS is measured per game.
+    _context = multiprocessing.get_context("spawn")
+    for game in args.games:
+        with _context.Pool(processes=1) as pool:
+            results.append(pool.apply(runGame, (game, args.sessions, args.events_per_session, args.seed, settings, args.modes)))
+    report = {
+        "commit"    : gitCommit(),
+        "timestamp" : datetime.now().isoformat(),
+        "python"    : platform.python_version(),
+        "platform"  : platform.platform(),
+        "settings"  : {"sessions" : args.sessions, "events_per_session" : args.events_per_session, "seed" : args.seed,
+                       "batch_size" : args.batch_size, "workers" : args.workers, "modes" : args.modes},
+        "results"   : results,
+    }
+    printResults(results=results, baseline=json.loads(args.compare.read_text()) if args.compare is not None else None)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
@@ -0,0 +1,139 @@
+'''
+Benchmark of the memory held by each session's processor.
+
+Each game is measured in a fresh interpreter.
+One session processor is set up first, so the game's modules are imported and its registry template is compiled,
+then a number of further session processors are set up and kept alive, as they are while an export is running,
+and the memory allocated for them (as traced by tracemalloc) and the number of objects they added are divided by the number of sessions.
+
+Results are printed as a table, and written as JSON with --output,
+so runs on different commits can be compared, with --compare.
+With --max-growth, the script exits with an error if any game uses more bytes per session than the compared run by more than the given factor.
+
+Example commands to be run in the commandline from the project directory:
+python tests/benchmarks/bench_memory.py
+python tests/benchmarks/bench_memory.py --games AQUALAB --sessions 1000 --output memory.json
+python tests/benchmarks/bench_memory.py --compare memory.json --max-growth 1.05
+'''
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SRC_PATH = Path(__file__).parents[2] / "src"
+GAMES = ["AQUALAB", "BLOOM", "JOURNALISM", "LAKELAND", "WAVES"]
+
+def measureGame(game:str, sessions:int) -> Dict[str, Any]:
+    """Set up the processors of many sessions of a game, and measure the memory they hold. Meant to be run in a fresh process."""
+    from ogd.common.utils.Logger import Logger
+    from ogd.core.managers.ExportManager import ExportManager
+    from ogd.core.processors.SessionProcessor import SessionProcessor
+    Logger.std_logger.setLevel(logging.CRITICAL)
+
+    _loader = ExportManager._loadLoaderClass(game)
+    if _loader is None:
+        raise ValueError(f"{game} has no loader class.")
+    _schema = ExportManager._loadGameSchema(game)
+    def _newProcessor(index:int) -> SessionProcessor:
+        return SessionProcessor(LoaderClass=_loader, game_schema=_schema, player_id=f"player{index}", session_id=f"session{index}", feature_overrides=None)
+
+    # the first processor imports the game's generators and compiles its template, which is shared by all later sessions, so it is not counted.
+    _first = _newProcessor(0)
+    gc.collect()
+    tracemalloc.start()
+    _start_bytes, _ = tracemalloc.get_traced_memory()
+    _start_objects  = len(gc.get_objects())
+
+    _processors = [_newProcessor(index) for index in range(1, sessions + 1)]
+    gc.collect()
+    _end_bytes, _   = tracemalloc.get_traced_memory()
+    _end_objects    = len(gc.get_objects())
+    tracemalloc.stop()
+    return {
+        "target"               : game,
+        "sessions"             : len(_processors),
+        "extractors"           : sum(len(order) for order in _first._registry._features),
+        "bytes_per_session"    : (_end_bytes - _start_bytes) / sessions,
+        # only objects tracked by the garbage collector are counted, so e.g. strings and numbers are not included.
+        "objects_per_session"  : (_end_objects - _start_objects) / sessions,
+    }
+
+def runTarget(target:str, sessions:int) -> Dict[str, Any]:
+    """Measure a target in a fresh interpreter."""
+    _proc = subprocess.run([sys.executable, __file__, "--child", target, "--sessions", str(sessions)], capture_output=True, text=True)
+    if _proc.returncode != 0:
+        return {"target" : target, "status" : "ERROR", "message" : _proc.stderr.strip().splitlines()[-1:]}
+    ret_val = json.loads(_proc.stdout.strip().splitlines()[-1])
+    ret_val["status"]              = "SUCCESS"
+    ret_val["bytes_per_session"]   = round(ret_val["bytes_per_session"])
+    ret_val["objects_per_session"] = round(ret_val["objects_per_session"], 1)
+    return ret_val
+
+def gitCommit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def printResults(results:List[Dict[str, Any]], baseline:Optional[Dict[str, Any]]) -> None:
+    _base = {result["target"] : result for result in baseline["results"]} if baseline is not None else {}
+    print(f"{'target':<12}{'extractors':>12}{'bytes/sess':>12}{'objs/sess':>11}{'bytes/extr':>12}{'vs base':>9}")
+    for result in results:
+        if result["status"] != "SUCCESS":
+            print(f"{result['target']:<12}  {result['status']}: {result['message']}")
+            continue
+        _per_extractor = result["bytes_per_session"] / result["extractors"] if result["extractors"] else 0
+        _vs = ""
+        if _base.get(result["target"], {}).get("bytes_per_session"):
+            _vs = f"{result['bytes_per_session'] / _base[result['target']]['bytes_per_session']:.2f}x"
+        print(f"{result['target']:<12}{result['extractors']:>12}{result['bytes_per_session']:>12}{result['objects_per_session']:>11.1f}{_per_extractor:>12.0f}{_vs:>9}")
+
+def growths(results:List[Dict[str, Any]], baseline:Dict[str, Any], max_growth:float) -> List[str]:
+    """List the targets whose bytes per session are more than the baseline's by more than the given factor."""
+    _base = {result["target"] : result for result in baseline["results"]}
+    return [result["target"] for result in results
+            if result["status"] == "SUCCESS" and _base.get(result["target"], {}).get("bytes_per_session")
+            and result["bytes_per_session"] > max_growth * _base[result["target"]]["bytes_per_session"]]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the memory held by the processor of each session.")
+    parser.add_argument("--games", nargs="+", default=GAMES, help="Games to benchmark.")
+    parser.add_argument("--sessions", type=int, default=200, help="Number of session processors to set up for each game.")
+    parser.add_argument("--output", type=Path, default=None, help="File to write the results to, as JSON.")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON results of an earlier run, to compare bytes per session against.")
+    parser.add_argument("--max-growth", type=float, default=None, help="With --compare, fail if any bytes per session is more than this many times the earlier run's.")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC_PATH))
+    if args.child is not None:
+        # run a single measurement, and hand the result back to the parent process as the last line of output.
+        print(json.dumps(measureGame(game=args.child, sessions=max(1, args.sessions))))
+        sys.exit(0)
+
+    results = [runTarget(target=target, sessions=max(1, args.sessions)) for target in args.games]
+    baseline = json.loads(args.compare.read_text()) if args.compare is not None else None
+    report = {
+        "commit"    : gitCommit(),
+        "timestamp" : datetime.now().isoformat(),
+        "python"    : platform.python_version(),
+        "platform"  : platform.platform(),
+        "settings"  : {"sessions" : args.sessions},
+        "results"   : results,
+    }
+    printResults(results=results, baseline=baseline)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    if baseline is not None and args.max_growth is not None:
+        _grown = growths(results=results, baseline=baseline, max_growth=args.max_growth)
+        if len(_grown) > 0:
+            print(f"Memory per session is more than {args.max_growth}x that of {args.compare} for: {', '.join(_grown)}")
+            sys.exit(1)
@@ -0,0 +1,120 @@
+'''
+Micro-benchmark of ExtractorRegistry event dispatch.
+
+Compares the old way of dispatching events (looking up each listener's name in every feature order, for every event)
+against the compiled dispatch tables, on an AQUALAB event stream.
+The stream is read from a JSON-lines file of recorded events if one is given, otherwise a seeded stream is generated from the AQUALAB schema.
+
+Example commands to be run in the commandline from the project directory:
+python tests/benchmarks/bench_registry_dispatch.py
+python tests/benchmarks/bench_registry_dispatch.py --events path/to/AQUALAB_events.jsonl --repeat 5
+'''
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+from ogd.common.models.Event import Event, EventSource
+from ogd.common.utils.Logger import Logger
+from ogd.core.generators.GameMetadataCache import GameMetadataCache
+from ogd.core.managers.ExportManager import ExportManager
+from ogd.core.processors.SessionProcessor import SessionProcessor
+from ogd.core.registries.ExtractorRegistry import ExtractorRegistry
+from ogd.core.registries.GeneratorRegistry import GeneratorRegistry
+from ogd.games import AQUALAB
+
+GAME = "AQUALAB"
+
+def loadEvents(path:Path) -> List[Event]:
+    """Load a recorded event stream, with one JSON object per line, using the column names from Event.ColumnNames()."""
+    ret_val : List[Event] = []
+    with open(path, "r") as events_file:
+        for line in events_file:
+            if line.strip():
+                row = json.loads(line)
+                ret_val.append(Event(session_id=row["session_id"], app_id=row.get("app_id", GAME), timestamp=datetime.fromisoformat(row["timestamp"]),
+                                     event_name=row["event_name"], event_data=row.get("event_data", {}), event_source=EventSource.GAME,
+                                     app_version=row.get("app_version"), log_version=row.get("log_version"),
+                                     user_id=row.get("user_id"), user_data=row.get("user_data", {}), game_state=row.get("game_state", {}),
+                                     event_sequence_index=row.get("event_sequence_index")))
+    return ret_val
+
+def generateEvents(count:int, seed:int=1234) -> List[Event]:
+    """Generate a seeded AQUALAB event stream, with event names from the schema and job names from the DBExport."""
+    schema    = ExportManager._loadGameSchema(GAME)
+    names     = schema.EventTypes
+    jobs      = ["no-active-job"] + [job["id"] for job in GameMetadataCache.GetMetadata(GameMetadataCache.MetadataPath(AQUALAB)).get("jobs", [])]
+    rand      = random.Random(seed)
+    timestamp = datetime(2024, 1, 1)
+    job       = rand.choice(jobs)
+    ret_val : List[Event] = []
+    for i in range(count):
+        timestamp += timedelta(seconds=rand.randint(1, 30))
+        if rand.random() < 0.05:
+            job = rand.choice(jobs)
+        event_data = {"job_name": job, "prev_job_name": rand.choice(jobs), "attempted_job_name": rand.choice(jobs), "level": rand.randint(0, 5)}
+        ret_val.append(Event(session_id="bench", app_id=GAME, timestamp=timestamp, event_name=rand.choice(names), event_data=event_data,
+                             event_source=EventSource.GAME, app_version="1", log_version="5", user_id="bench_user",
+                             user_data={}, game_state={"job_name": job, "level": rand.randint(0, 5)}, event_sequence_index=i))
+    return ret_val
+
+def legacyDispatch(registry:ExtractorRegistry) -> Callable[[Event], None]:
+    """The old dispatch loop, which looked up every listener's name in each feature order, and sent events to all instances of per-count features."""
+    def _listeners(event_key:str) -> List[GeneratorRegistry.Listener]:
+        ret_val = []
+        for listener in registry._event_registry.get(event_key, []):
+            ret_val += listener.listeners if isinstance(listener, GeneratorRegistry.CountListener) else [listener]
+        return ret_val
+    _event_registry = {event_key : _listeners(event_key) for event_key in registry._event_registry.keys()}
+    _features       = registry._features
+
+    def _dispatch(event:Event) -> None:
+        try:
+            for listener in _event_registry.get(event.EventName, []):
+                for order_key in range(len(_features)):
+                    if listener.name in _features[order_key].keys():
+                        _features[order_key][listener.name].UpdateFromEvent(event)
+            for listener in _event_registry["all_events"]:
+                for order_key in range(len(_features)):
+                    if listener.name in _features[order_key].keys():
+                        _features[order_key][listener.name].UpdateFromEvent(event)
+        except KeyError:
+            pass
+    return _dispatch
+
+def timeDispatch(make_dispatch:Callable[[ExtractorRegistry], Callable[[Event], None]], events:List[Event], repeat:int) -> float:
+    """Time dispatch of the event stream to a fresh session registry, returning the best time over all repeats."""
+    schema = ExportManager._loadGameSchema(GAME)
+    loader = ExportManager._loadLoaderClass(GAME)
+    best   = float("inf")
+    for _ in range(repeat):
+        processor = SessionProcessor(LoaderClass=loader, game_schema=schema, player_id="bench_user", session_id="bench")
+        dispatch  = make_dispatch(processor._registry)
+        start = time.perf_counter()
+        for event in events:
+            dispatch(event)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare old and compiled ExtractorRegistry event dispatch on an AQUALAB event stream.")
+    parser.add_argument("--events", type=Path, default=None, help="JSON-lines file of recorded AQUALAB events. If not given, a seeded stream is generated.")
+    parser.add_argument("--count", type=int, default=5000, help="Number of events to generate, if no recorded stream is given.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times to run each dispatcher, the best time is reported.")
+    args = parser.parse_args()
+
+    Logger.std_logger.setLevel(logging.CRITICAL)
+    events = loadEvents(args.events) if args.events is not None else generateEvents(count=args.count)
+    legacy   = timeDispatch(legacyDispatch, events=events, repeat=args.repeat)
+    compiled = timeDispatch(lambda registry : registry.UpdateFromEvent, events=events, repeat=args.repeat)
+    print(f"{len(events)} events, best of {args.repeat}")
+    print(f"legacy dispatch   : {legacy:8.3f}s ({len(events) / legacy:10.0f} events/s)")
+    print(f"compiled dispatch : {compiled:8.3f}s ({len(events) / compiled:10.0f} events/s)")
+    print(f"speedup           : {legacy / compiled:8.2f}x")
@@ -0,0 +1,146 @@
+'''
+Benchmark of start-up time: importing the command-line modules, and getting a game ready to process its first session.
+
+Each measurement runs in a fresh interpreter, so nothing is already imported.
+For the command line, the modules imported by main.py are timed.
+For each game, the time to import its loader class, and then to set up the processors of a single session from the game's schema, are timed,
+and the number of the game's feature and detector modules that were actually run is counted.
+
+Results are printed as a table, and written as JSON with --output,
+so runs on different commits can be compared, with --compare.
+With --max-slowdown, the script exits with an error if any total time is slower than the compared run by more than the given factor.
+
+Example commands to be run in the commandline from the project directory:
+python tests/benchmarks/bench_startup.py
+python tests/benchmarks/bench_startup.py --games AQUALAB --repeat 10 --output startup.json
+python tests/benchmarks/bench_startup.py --compare startup.json --max-slowdown 1.2
+'''
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SRC_PATH = Path(__file__).parents[2] / "src"
+GAMES = ["AQUALAB", "BLOOM", "JOURNALISM", "LAKELAND", "WAVES"]
+
+def measureCLI() -> Dict[str, Any]:
+    """Import the modules main.py needs before it can parse a command. Meant to be run in a fresh process."""
+    _start = time.perf_counter()
+    from ogd.core.exec.Commands import OGDCommands
+    from ogd.core.exec.Parsers import OGDParsers
+    _import_time = time.perf_counter() - _start
+    return {"target" : "cli", "import_seconds" : _import_time, "setup_seconds" : 0.0, "modules_run" : None, "modules_total" : None}
+
+def measureGame(game:str) -> Dict[str, Any]:
+    """Import a game's loader, and set up the processors of one session. Meant to be run in a fresh process."""
+    from ogd.common.utils.Logger import Logger
+    from ogd.core.generators.GeneratorManifest import GeneratorManifest
+    from ogd.core.managers.ExportManager import ExportManager
+    from ogd.core.processors.SessionProcessor import SessionProcessor
+    Logger.std_logger.setLevel(logging.CRITICAL)
+
+    _start = time.perf_counter()
+    _loader = ExportManager._loadLoaderClass(game)
+    _import_time = time.perf_counter() - _start
+    if _loader is None:
+        raise ValueError(f"{game} has no loader class.")
+
+    _start = time.perf_counter()
+    _schema = ExportManager._loadGameSchema(game)
+    SessionProcessor(LoaderClass=_loader, game_schema=_schema, player_id="player", session_id="session", feature_overrides=None)
+    _setup_time = time.perf_counter() - _start
+
+    # modules that have not been run yet are still lazy placeholders, see GeneratorManifest.LazyModules.
+    _packages = [package for package in GeneratorManifest.Load().keys() if package.startswith(f"ogd.games.{game}.")]
+    _modules  = {f"{package}.{module}" for package in _packages for module in GeneratorManifest.Load()[package].values()}
+    _run      = [name for name in _modules if name in sys.modules and type(sys.modules[name]).__name__ != "_LazyModule"]
+    return {"target" : game, "import_seconds" : _import_time, "setup_seconds" : _setup_time, "modules_run" : len(_run), "modules_total" : len(_modules)}
+
+def runTarget(target:str, repeat:int) -> Dict[str, Any]:
+    """Measure a target `repeat` times, each in a fresh interpreter, and take the median of each time."""
+    _runs : List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        _proc = subprocess.run([sys.executable, __file__, "--child", target], capture_output=True, text=True)
+        if _proc.returncode != 0:
+            return {"target" : target, "status" : "ERROR", "message" : _proc.stderr.strip().splitlines()[-1:]}
+        _runs.append(json.loads(_proc.stdout.strip().splitlines()[-1]))
+    _import = statistics.median(run["import_seconds"] for run in _runs)
+    _setup  = statistics.median(run["setup_seconds"] for run in _runs)
+    return {
+        "target"         : target,
+        "status"         : "SUCCESS",
+        "import_seconds" : round(_import, 4),
+        "setup_seconds"  : round(_setup, 4),
+        "total_seconds"  : round(_import + _setup, 4),
+        "modules_run"    : _runs[0]["modules_run"],
+        "modules_total"  : _runs[0]["modules_total"],
+    }
+
+def gitCommit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def printResults(results:List[Dict[str, Any]], baseline:Optional[Dict[str, Any]]) -> None:
+    _base = {result["target"] : result for result in baseline["results"]} if baseline is not None else {}
+    print(f"{'target':<12}{'import s':>10}{'setup s':>10}{'total s':>10}{'modules':>10}{'vs base':>9}")
+    for result in results:
+        if result["status"] != "SUCCESS":
+            print(f"{result['target']:<12}  {result['status']}: {result['message']}")
+            continue
+        _modules = f"{result['modules_run']}/{result['modules_total']}" if result["modules_total"] is not None else ""
+        _vs = ""
+        if _base.get(result["target"], {}).get("total_seconds"):
+            _vs = f"{result['total_seconds'] / _base[result['target']]['total_seconds']:.2f}x"
+        print(f"{result['target']:<12}{result['import_seconds']:>10.3f}{result['setup_seconds']:>10.3f}{result['total_seconds']:>10.3f}{_modules:>10}{_vs:>9}")
+
+def slowdowns(results:List[Dict[str, Any]], baseline:Dict[str, Any], max_slowdown:float) -> List[str]:
+    """List the targets whose total time is slower than the baseline by more than the given factor."""
+    _base = {result["target"] : result for result in baseline["results"]}
+    return [result["target"] for result in results
+            if result["status"] == "SUCCESS" and _base.get(result["target"], {}).get("total_seconds")
+            and result["total_seconds"] > max_slowdown * _base[result["target"]]["total_seconds"]]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark start-up time of the command line and of loading each game.")
+    parser.add_argument("--games", nargs="+", default=GAMES, help="Games to benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh processes to measure each target in; the median is reported.")
+    parser.add_argument("--output", type=Path, default=None, help="File to write the results to, as JSON.")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON results of an earlier run, to compare total times against.")
+    parser.add_argument("--max-slowdown", type=float, default=None, help="With --compare, fail if any total time is more than this many times the earlier run's.")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC_PATH))
+    if args.child is not None:
+        # run a single measurement, and hand the result back to the parent process as the last line of output.
+        print(json.dumps(measureCLI() if args.child == "cli" else measureGame(args.child)))
+        sys.exit(0)
+
+    results = [runTarget(target=target, repeat=args.repeat) for target in ["cli"] + args.games]
+    baseline = json.loads(args.compare.read_text()) if args.compare is not None else None
+    report = {
+        "commit"    : gitCommit(),
+        "timestamp" : datetime.now().isoformat(),
+        "python"    : platform.python_version(),
+        "platform"  : platform.platform(),
+        "settings"  : {"repeat" : args.repeat},
+        "results"   : results,
+    }
+    printResults(results=results, baseline=baseline)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    if baseline is not None and args.max_slowdown is not None:
+        _slow = slowdowns(results=results, baseline=baseline, max_slowdown=args.max_slowdown)
+        if len(_slow) > 0:
+            print(f"Start-up is more than {args.max_slowdown}x slower than {args.compare} for: {', '.join(_slow)}")
+            sys.exit(1)
@@ -0,0 +1,47 @@
+# import libraries
+import logging
+import unittest
+from datetime import timedelta
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.FeatureData import FeatureData
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.generators.Generator import GeneratorParameters
+from ogd.games.JOURNALISM.features.UserPlayTime import UserPlayTime
+from tests.config.t_config import settings
+
+class test_UserPlayTime(TestCase):
+    """Testbed for the JOURNALISM UserPlayTime feature.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="UserPlayTimeTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self.feature = UserPlayTime(params=GeneratorParameters(name="UserPlayTime", description="", mode=ExtractionMode.PLAYER, count_index=None))
+
+    def test_NoPlayTime(self):
+        # a player without any PlayTime data, e.g. whose sessions had no active time, gets empty values instead of crashing the export.
+        self.assertEqual(self.feature.GetFeatureValues(), [None, None, None])
+        self.assertEqual(len(self.feature.GetFeatureValues()), len(self.feature.GetFeatureNames()))
+
+    def test_ActiveSeconds(self):
+        self.feature.UpdateFromFeatureData(FeatureData(name="PlayTime", feature_type="PlayTime", count_index=None,
+                                                       cols=["PlayTime", "PlayTime-Active"], vals=[timedelta(minutes=5), timedelta(minutes=2)],
+                                                       mode=ExtractionMode.SESSION, player_id="player", sess_id="session"))
+        _play_time, _active_time, _active_seconds = self.feature.GetFeatureValues()
+        self.assertEqual(_active_seconds, _active_time.total_seconds())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,16 @@
+# import libraries
+import importlib.util
+import sys
+import types
+
+def UseFeaturesAsModels() -> None:
+    """Let the LAKELAND model modules be imported in place.
+
+    The model modules import each other from the legacy top-level `models` package, which is now the LAKELAND features directory.
+    This makes `models` a package whose path is that directory, so e.g. `from models.LogisticModel import LogisticModel` imports the in-tree module.
+    """
+    if "models" not in sys.modules:
+        _spec = importlib.util.find_spec("ogd.games.LAKELAND.features")
+        _models = types.ModuleType("models")
+        _models.__path__ = list(_spec.submodule_search_locations or []) if _spec is not None else []
+        sys.modules["models"] = _models
@@ -0,0 +1,112 @@
+# import libraries
+import contextlib
+import io
+import logging
+import random
+import unittest
+from typing import Any, Dict, List
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from tests.cases.games.LAKELAND import UseFeaturesAsModels
+from tests.config.t_config import settings
+
+UseFeaturesAsModels()
+from models.FeatureModel import FeatureModel
+from models.LinearModel import LinearModel
+from models.LogisticModel import LogisticModel
+
+class test_FeatureModel(TestCase):
+    """Testbed for the batch evaluation of LAKELAND feature models.
+
+    Each test checks that `Eval` of a batch of rows gives the same results, or raises the same errors, as calling `_eval` once per row.
+    """
+    COEFFICIENTS : Dict[str, Any] = {
+        "Intercept"      : -0.5,
+        "display_name"   : "Test Model",
+        "sessionTime"    : 0.002,
+        "num_deaths"     : -0.3,
+        "has_farm"       : 0.75,
+        "not_a_feature"  : 4.0,
+        "biome.Forest"   : 0.4,
+        "biome.Desert"   : -0.2,
+    }
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="FeatureModelTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Set up rows of numeric features, with some features missing from some rows.
+        _rand = random.Random(1234)
+        cls.rows : List[Dict[str, Any]] = []
+        for i in range(50):
+            row : Dict[str, Any] = {"sessionTime" : _rand.uniform(0, 3600), "num_deaths" : _rand.randint(0, 20), "has_farm" : _rand.random() < 0.5,
+                                    "biome" : _rand.choice(["Forest", "Desert", "Plains"])}
+            if i % 7 == 0:
+                del row["num_deaths"]
+            if i % 11 == 0:
+                del row["biome"]
+            cls.rows.append(row)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self.models : List[FeatureModel] = [LinearModel(coefficient_map=self.COEFFICIENTS), LogisticModel(coefficient_map=self.COEFFICIENTS)]
+
+    def assertMatchesRows(self, model:FeatureModel, rows:List[Dict[str, Any]]):
+        # models print a line for each coefficient that is not a feature, which is just noise here.
+        with contextlib.redirect_stdout(io.StringIO()):
+            _batch    = model.Eval(rows)
+            _expected = [model._eval(row) for row in rows]
+        self.assertEqual(len(_batch), len(_expected))
+        for _result, _row_result in zip(_batch, _expected):
+            self.assertAlmostEqual(_result, _row_result, places=12)
+
+    def assertRaisesLikeRows(self, model:FeatureModel, rows:List[Dict[str, Any]], error:type):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(error):
+                [model._eval(row) for row in rows]
+            with self.assertRaises(error):
+                model.Eval(rows)
+
+    def test_BatchMatchesRows(self):
+        for model in self.models:
+            with self.subTest(model=type(model).__name__):
+                self.assertMatchesRows(model=model, rows=self.rows)
+                self.assertMatchesRows(model=model, rows=[])
+
+    def test_NonNumericFeatureRejected(self):
+        # numpy would convert a numeric string to a float, and None to nan, but _eval cannot multiply either one.
+        for _value in ["3", None]:
+            _rows = [dict(row) for row in self.rows]
+            _rows[5]["num_deaths"] = _value
+            for model in self.models:
+                with self.subTest(model=type(model).__name__, value=_value):
+                    self.assertRaisesLikeRows(model=model, rows=_rows, error=TypeError)
+
+    def test_DottedColumnIsFeature(self):
+        # a row with a column named after an enum coefficient uses it as a feature value, rather than checking the enum's base column.
+        _rows = [dict(row) for row in self.rows]
+        _rows[3]["biome.Forest"] = 2.5
+        _rows[4]["Intercept"]    = 10
+        for model in self.models:
+            with self.subTest(model=type(model).__name__):
+                self.assertMatchesRows(model=model, rows=_rows)
+
+    def test_LogitOverflowRaises(self):
+        _rows = [dict(row) for row in self.rows]
+        _rows[8]["sessionTime"] = -1e6
+        self.assertRaisesLikeRows(model=LogisticModel(coefficient_map=self.COEFFICIENTS), rows=_rows, error=OverflowError)
+        # a very large logit does not overflow, since exp(-logit) just goes to 0.
+        _rows[8]["sessionTime"] = 1e6
+        self.assertMatchesRows(model=LogisticModel(coefficient_map=self.COEFFICIENTS), rows=_rows)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# import libraries
+import datetime
+import logging
+import random
+import unittest
+from typing import Any, Dict, List
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from tests.cases.games.LAKELAND import UseFeaturesAsModels
+from tests.config.t_config import settings
+
+UseFeaturesAsModels()
+from models.DeathCountModel import DeathCountModel
+from models.RecentPurchasesModel import RecentPurchasesModel
+from models.SequenceModel import SequenceModel
+from models.TimeSinceEventTypes import TimeSinceEventTypesModel
+from models.TimeSinceLastSaleModel import TimeSinceLastSaleModel
+
+class test_SequenceModel(TestCase):
+    """Testbed for the incremental Update/Current API of LAKELAND sequence models.
+
+    Each test feeds a stream of events to a model one at a time, and checks that `Current` gives the same result as `_eval` of the events so far.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="SequenceModelTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Set up a stream of events, with deaths (18), buys (7) and sales (37) among other events.
+        #    Some client times are left as strings, the same as rows that were not parsed ahead of time.
+        _rand = random.Random(1234)
+        _time = datetime.datetime(2020, 5, 1, 12, 0, 0)
+        cls.events : List[Dict[str, Any]] = []
+        for _ in range(300):
+            _time += datetime.timedelta(seconds=_rand.uniform(0, 40))
+            _custom = _rand.choice([1, 3, 7, 7, 7, 10, 18, 37])
+            _data   = {"buy" : _rand.randint(1, 9), "success" : _rand.random() < 0.7, "worth" : _rand.randint(0, 800)} if _custom == 7 else {}
+            cls.events.append({"event_custom" : _custom, "event_data_complex" : _data,
+                               "client_time" : _time.isoformat() if _rand.random() < 0.5 else _time})
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self.models : List[SequenceModel] = [
+            DeathCountModel(),
+            RecentPurchasesModel(),
+            TimeSinceLastSaleModel(),
+            TimeSinceEventTypesModel(event_list=[1, [7, [[["event_data_complex", "buy"], "in", [1, 3, 5]],
+                                                         [["event_data_complex", "success"], "eq", True]]]]),
+        ]
+
+    def test_CurrentMatchesEvalForEveryPrefix(self):
+        for model in self.models:
+            with self.subTest(model=type(model).__name__):
+                model.Reset()
+                for i, event in enumerate(self.events):
+                    model.Update(event)
+                    self.assertEqual(model.Current(), model._eval(self.events[:i+1]), msg=f"Current differs from _eval after {i+1} events")
+
+    def test_EvalResets(self):
+        # Eval of a second sequence must not see any of the events of the first.
+        _half = len(self.events) // 2
+        for model in self.models:
+            with self.subTest(model=type(model).__name__):
+                model.Eval(self.events[:_half])
+                self.assertEqual(model.Eval(self.events[_half:]), model._eval(self.events[_half:]))
+                self.assertEqual(model.Eval(self.events), model._eval(self.events))
+
+if __name__ == '__main__':
+    unittest.main()
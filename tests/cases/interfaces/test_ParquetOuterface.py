@@ -0,0 +1,127 @@
+# import libraries
+import logging
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List
+from unittest import TestCase
+# import 3rd-party libraries
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+# import ogd libraries.
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.configs.IndexingSchema import FileIndexingSchema
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.interfaces.outerfaces.ParquetOuterface import ParquetOuterface
+from ogd.core.processors.RowBatch import RowBatch
+from tests.config.t_config import settings
+
+@unittest.skipUnless(pyarrow is not None, "ParquetOuterface requires the pyarrow package")
+class test_ParquetOuterface(TestCase):
+    """Testbed for the ParquetOuterface class.
+
+    Each test writes a session features file into a temporary directory, and reads it back with pyarrow.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="ParquetOuterfaceTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        # the outerface writes under a data directory relative to the working directory.
+        self._dir = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._dir.name)
+        self._outerface = test_ParquetOuterface._makeOuterface(dataset_id="TEST")
+
+    def tearDown(self) -> None:
+        self._outerface.Close()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    @staticmethod
+    def _makeOuterface(dataset_id:str) -> ParquetOuterface:
+        ret_val = ParquetOuterface(game_id="BLOOM", config=GameSourceSchema(name="TEST", all_elements={}, data_sources={}),
+                                   export_modes={ExportMode.SESSION}, date_range={"min":None, "max":None},
+                                   file_indexing=FileIndexingSchema(name="FILE_INDEXING", all_elements={"LOCAL_DIR":"data"}),
+                                   dataset_id=dataset_id)
+        ret_val.Open()
+        return ret_val
+
+    def _write(self, header:List[str], *row_groups:List[List[Any]]):
+        self._outerface.WriteHeader(header=header, mode=ExportMode.SESSION)
+        for rows in row_groups:
+            self._outerface.WriteBatch(batch=RowBatch.FromRows(rows), mode=ExportMode.SESSION)
+        self._outerface.Close()
+        _file = pyarrow.parquet.ParquetFile(self._outerface.Destination(mode=ExportMode.SESSION))
+        self.assertEqual(_file.num_row_groups, len(row_groups))
+        return _file.read()
+
+    def test_TypedColumns(self):
+        _when  = datetime(2024, 5, 1, 12, 30)
+        _table = self._write(["SessionID", "Count", "Time", "Done", "When", "Info", "Count"],
+                             [["a", 1, 1.5, True,  _when, {"x":[1, 2]}, 3],
+                              ["b", 2, None, False, None,  None,        4]])
+        self.assertEqual(_table.column_names, ["SessionID", "Count", "Time", "Done", "When", "Info", "Count.1"])
+        self.assertEqual([field.type for field in _table.schema],
+                         [pyarrow.string(), pyarrow.int64(), pyarrow.float64(), pyarrow.bool_(), pyarrow.string(), pyarrow.string(), pyarrow.int64()])
+        self.assertEqual(_table.to_pylist()[0], {"SessionID":"a", "Count":1, "Time":1.5, "Done":True, "When":_when.isoformat(), "Info":'{"x": [1, 2]}', "Count.1":3})
+
+    def test_LargeInts(self):
+        _big   = 2**53 + 1
+        _huge  = 2**70
+        _table = self._write(["Big", "Huge", "Mixed"],
+                             [[_big, _huge, _big], [-_big, 1, 0.5]])
+        self.assertEqual([field.type for field in _table.schema], [pyarrow.int64(), pyarrow.string(), pyarrow.string()])
+        self.assertEqual(_table.column("Big").to_pylist(),   [_big, -_big])
+        self.assertEqual(_table.column("Huge").to_pylist(),  [str(_huge), "1"])
+        self.assertEqual(_table.column("Mixed").to_pylist(), [str(_big), "0.5"])
+
+    def test_TypeChangesBetweenRowGroups(self):
+        _big   = 2**53 + 1
+        _table = self._write(["ToFloat", "ToString", "FromNull", "BigToFloat", "Same"],
+                             [[1,   1,     None, _big, "a"]],
+                             [[2.5, "abc", None, 1.5,  "b"]],
+                             [[3,   2,     7,    2,    "c"]])
+        self.assertEqual([field.type for field in _table.schema],
+                         [pyarrow.float64(), pyarrow.string(), pyarrow.int64(), pyarrow.string(), pyarrow.string()])
+        self.assertEqual(_table.column("ToFloat").to_pylist(),    [1.0, 2.5, 3.0])
+        self.assertEqual(_table.column("ToString").to_pylist(),   ["1", "abc", "2"])
+        self.assertEqual(_table.column("FromNull").to_pylist(),   [None, None, 7])
+        self.assertEqual(_table.column("BigToFloat").to_pylist(), [str(_big), "1.5", "2"])
+        self.assertEqual(_table.column("Same").to_pylist(),       ["a", "b", "c"])
+        self.assertEqual(list(Path(self._outerface.Destination(mode=ExportMode.SESSION)).parent.iterdir()),
+                         [Path(self._outerface.Destination(mode=ExportMode.SESSION))])
+
+    def test_LinesMatchBatches(self):
+        _rows  = [["a", 1, 1.5, True, {"x":1}, None], ["b", 2**60, 2, False, [1, "y"], "z"]]
+        _batch = self._write(["A", "B", "C", "D", "E", "F"], _rows)
+        self._outerface = test_ParquetOuterface._makeOuterface(dataset_id="TEST_LINES")
+        self._outerface.WriteHeader(header=["A", "B", "C", "D", "E", "F"], mode=ExportMode.SESSION)
+        self._outerface.WriteLines(lines=RowBatch.FromRows(_rows).AsStrings(), mode=ExportMode.SESSION)
+        self._outerface.Close()
+        _lines = pyarrow.parquet.read_table(self._outerface.Destination(mode=ExportMode.SESSION))
+        self.assertTrue(_lines.equals(_batch))
+
+    def test_HeaderOnly(self):
+        _table = self._write(["SessionID", "Count"])
+        self.assertEqual(_table.num_rows, 0)
+        self.assertEqual([field.type for field in _table.schema], [pyarrow.string(), pyarrow.string()])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# import libraries
+import contextlib
+import copy
+import csv
+import io
+import json
+import logging
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from unittest import TestCase
+# import 3rd-party libraries
+import pandas as pd
+# import ogd libraries.
+from ogd.common.interfaces.CSVInterface import CSVInterface
+from ogd.common.interfaces.EventInterface import EventInterface
+from ogd.common.interfaces.outerfaces.DictionaryOuterface import DictionaryOuterface
+from ogd.common.models.Event import Event
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.interfaces.StreamingFileInterface import StreamingFileInterface
+from ogd.core.managers.ExportManager import ExportManager
+from ogd.core.requests.Request import ExporterRange, Request
+from ogd.core.requests.RequestResult import RequestResult, ResultStatus
+from ogd.core.schemas.configs.ConfigSchema import ConfigSchema
+from tests.benchmarks.bench_export import generateEvents
+from tests.config.t_config import settings
+
+class test_StreamingFileInterface(TestCase):
+    """Testbed for the StreamingFileInterface class.
+
+    Each test writes events to a TSV file in the OGD_EVENT_FILE format, in a temporary directory, and reads it back.
+    """
+    COLUMNS : List[str] = ["session_id", "app_id", "timestamp", "event_name", "event_data", "event_source", "app_version", "app_branch",
+                           "log_version", "offset", "user_id", "user_data", "game_state", "index"]
+    MODES   : Set[ExportMode] = {ExportMode.EVENTS, ExportMode.SESSION, ExportMode.PLAYER, ExportMode.POPULATION}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="StreamingFileInterfaceTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Set up events of a few sessions, in order of session.
+        cls.events : List[Event] = generateEvents(game="BLOOM", sessions=6, events_per_session=30, seed=1234)
+        cls.config = GameSourceSchema(name="FILE SOURCE", all_elements={"schema":"OGD_EVENT_FILE"}, data_sources={})
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _writeFile(self, events:List[Event], name:str="events.tsv") -> Path:
+        ret_val = Path(self._dir.name) / name
+        with open(ret_val, "w", newline="", encoding="utf-8") as _file:
+            _writer = csv.writer(_file, delimiter="\t")
+            _writer.writerow(test_StreamingFileInterface.COLUMNS)
+            for event in events:
+                _writer.writerow([event.SessionID, event.AppID, event.Timestamp.isoformat(), event.EventName, json.dumps(event.EventData),
+                                  event.EventSource.name, event.AppVersion, event.AppBranch, event.LogVersion, "", event.UserID,
+                                  json.dumps(event.UserData), json.dumps(event.GameState), event.EventSequenceIndex])
+        return ret_val
+
+    def _interface(self, path:Path) -> StreamingFileInterface:
+        return StreamingFileInterface(game_id="BLOOM", config=self.config, fail_fast=True, filepath=path, delim="\t")
+
+    def _export(self, interface:EventInterface, ids:Optional[List[str]]) -> Tuple[RequestResult, Dict[str, Any]]:
+        _output    : Dict[str, Any] = {}
+        _outerface = DictionaryOuterface(game_id="BLOOM", config=GameSourceSchema(name="TEST", all_elements={}, data_sources={}),
+                                         export_modes=set(self.MODES), out_dict=_output)
+        _request   = Request(range=ExporterRange(date_min=None, date_max=None, ids=ids, id_mode=IDMode.SESSION),
+                             exporter_modes=set(self.MODES), interface=interface, outerfaces={_outerface})
+        _config    = ConfigSchema(name="StreamingFileTest", all_elements={"BATCH_SIZE" : 4, "LOG_FILE" : False, "DEBUG_LEVEL" : "ERROR", "FAIL_FAST" : False})
+        # DictionaryOuterface prints progress as it writes, which is just noise here.
+        with contextlib.redirect_stdout(io.StringIO()):
+            _result = ExportManager(config=_config).ExecuteRequest(_request)
+        return _result, _output
+
+    def test_UnsortedFileRaises(self):
+        _sessions = list(dict.fromkeys(event.SessionID for event in self.events))
+        # move the first event of the second session to the end, after rows of the other sessions.
+        _moved    = next(event for event in self.events if event.SessionID == _sessions[1])
+        _path     = self._writeFile([event for event in self.events if event is not _moved] + [_moved])
+        with self.assertRaises(ValueError):
+            list(self._interface(_path).StreamSessions())
+
+    def test_ExcludeRows(self):
+        _excluded = self.events[0].EventName
+        _interface = self._interface(self._writeFile(self.events))
+        _streamed = [event for session in _interface.StreamSessions(exclude_rows=[_excluded]) for event in session]
+        _expected = [event for event in self.events if event.EventName != _excluded]
+        self.assertEqual(len(_streamed), len(_expected))
+        self.assertNotIn(_excluded, {event.EventName for event in _streamed})
+        _retrieved = _interface.EventsFromIDs(id_list=_interface.AllIDs(), exclude_rows=[_excluded]) or []
+        self.assertEqual([event.EventName for event in _retrieved], [event.EventName for event in _expected])
+
+    def test_ExcludedOnlySessionCounted(self):
+        # BLOOM exports leave out algae growth events, so a session of only those events has nothing to process.
+        _sess_ids   = list(dict.fromkeys(event.SessionID for event in self.events))
+        _excluded_id = _sess_ids[2]
+        _events     = [event for event in self.events if event.SessionID != _excluded_id]
+        _template   = next(event for event in self.events if event.SessionID == _excluded_id)
+        _excluded   = [Event(session_id=_excluded_id, app_id="BLOOM", timestamp=_template.Timestamp, event_name=name, event_data={},
+                             event_source=_template.EventSource, app_version=_template.AppVersion, app_branch=_template.AppBranch,
+                             log_version=_template.LogVersion, time_offset=None, user_id=_template.UserID, user_data={},
+                             game_state=_template.GameState, event_sequence_index=i + 1)
+                       for i, name in enumerate(["algae_growth_begin", "algae_growth_end"])]
+        _index      = next(i for i, event in enumerate(_events) if event.SessionID == _sess_ids[3])
+        _path       = self._writeFile(_events[:_index] + _excluded + _events[_index:])
+        _result, _output = self._export(interface=self._interface(_path), ids=None)
+        self.assertEqual(_result.Status, ResultStatus.SUCCESS)
+        self.assertEqual(_result.SessionCount, len(_sess_ids))
+        _session_ids = [json.loads(row[1]) for row in _output["sessions"]["vals"]]
+        self.assertEqual(len(_session_ids), len(_sess_ids) - 1)
+        self.assertNotIn(_excluded_id, _session_ids)
+
+    def test_VersionsApplied(self):
+        _events = [copy.copy(event) for event in self.events]
+        _sess_ids = list(dict.fromkeys(event.SessionID for event in _events))
+        for event in _events:
+            if event.SessionID == _sess_ids[0]:
+                event.app_version = "2"
+        _interface = self._interface(self._writeFile(_events))
+        _retrieved = _interface.EventsFromIDs(id_list=_sess_ids, versions=[2]) or []
+        self.assertGreater(len(_retrieved), 0)
+        self.assertEqual({event.SessionID for event in _retrieved}, {_sess_ids[0]})
+
+    def test_MatchesCSVInterface(self):
+        _path = self._writeFile(self.events)
+        _csv  = CSVInterface(game_id="BLOOM", config=self.config, fail_fast=True, filepath=_path, delim="\t")
+        _streamed_result, _streamed = self._export(interface=self._interface(_path), ids=None)
+        _csv_result,      _loaded   = self._export(interface=_csv, ids=_csv.AllIDs())
+        self.assertEqual(_streamed_result.Status, ResultStatus.SUCCESS)
+        self.assertEqual(_csv_result.Status,      ResultStatus.SUCCESS)
+        self.assertEqual(_streamed_result.SessionCount, _csv_result.SessionCount)
+        self.assertGreater(len(_loaded["raw_events"]["vals"]), 0)
+        for key in _loaded.keys():
+            self.assertEqual(_streamed[key]["cols"], _loaded[key]["cols"])
+            self.assertEqual(_streamed[key]["vals"], [[test_StreamingFileInterface._pythonTimedelta(cell) for cell in row] for row in _loaded[key]["vals"]],
+                             msg=f"{key} output of streamed export differs from CSVInterface export")
+
+    @staticmethod
+    def _pythonTimedelta(cell:str) -> str:
+        """The CSVInterface loads timestamps with pandas, so durations are pandas Timedeltas, which are formatted differently than Python timedeltas of the same length."""
+        _match = re.fullmatch(r'"(-?\d+ days [0-9:.]+)"', cell)
+        return json.dumps(str(pd.Timedelta(_match.group(1)).to_pytimedelta())) if _match is not None else cell
+
+if __name__ == '__main__':
+    unittest.main()
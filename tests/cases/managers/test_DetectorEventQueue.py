@@ -0,0 +1,88 @@
+# import libraries
+import logging
+import unittest
+from typing import List
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.Event import Event
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.managers.DetectorEventQueue import DetectorEventQueue
+from ogd.core.requests.RequestResult import ResultStatus
+# the other testbeds are imported as modules, so their test cases are not collected again here.
+from tests.cases.managers import test_EventManager as EventManagerTests
+from tests.cases.managers import test_ExportManager as ExportManagerTests
+from tests.config.t_config import settings
+
+class test_DetectorEventQueue(TestCase):
+    """Testbed for the DetectorEventQueue class.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="DetectorEventQueueTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    @staticmethod
+    def Triggered(session_id:str, seconds:int, event_name:str="triggered") -> Event:
+        return EventManagerTests.test_EventManager.BloomEvent(session_id=session_id, seconds=seconds, event_name=event_name, event_data={})
+
+    def test_Ordering(self):
+        queue = DetectorEventQueue()
+        _events = [self.Triggered("A", 0), self.Triggered("B", 1), self.Triggered("A", 2)]
+        for event in _events:
+            queue.Push(event=event)
+        self.assertTrue(queue.Pending)
+        # one batch per session, in the order each session first triggered, and each batch in trigger order.
+        self.assertEqual(list(queue.Batches()), [[_events[0], _events[2]], [_events[1]]])
+        self.assertFalse(queue.Pending)
+
+    def test_Generations(self):
+        queue = DetectorEventQueue()
+        _first  = self.Triggered("A", 0)
+        _second = self.Triggered("A", 1)
+        queue.Push(event=_first)
+        _batches : List[List[Event]] = []
+        for batch in queue.Batches():
+            _batches.append(batch)
+            # events triggered while a batch is processed come out after it, as the next generation.
+            if batch == [_first]:
+                queue.Push(event=_second)
+        self.assertEqual(_batches, [[_first], [_second]])
+
+    def test_GenerationCap(self):
+        queue = DetectorEventQueue(max_generations=3)
+        queue.Push(event=self.Triggered("A", 0, event_name="loop"))
+        _processed = 0
+        # a detector that triggers on its own events, which would loop forever without the cap.
+        for batch in queue.Batches():
+            for event in batch:
+                _processed += 1
+                queue.Push(event=self.Triggered(event.SessionID, event.EventSequenceIndex + 1, event_name="loop"))
+        self.assertEqual(_processed, 3)
+        self.assertEqual(queue.Emitted, {"loop" : 4})
+        self.assertEqual(queue.Dropped, {"loop" : 1})
+        # the next ordinary event starts a new chain.
+        queue.Push(event=self.Triggered("A", 10, event_name="loop"))
+        self.assertTrue(queue.Pending)
+
+    def test_TriggeredEventsFollowTrigger(self):
+        # the event triggered by the first inspection is processed once that inspection is done, and before the next event.
+        _events = [EventManagerTests.test_EventManager.BloomEvent(session_id="A", seconds=0, event_name="click_local_alert", event_data={"alert_type":"ExcessRunoff", "tile_index":5}),
+                   EventManagerTests.test_EventManager.BloomEvent(session_id="A", seconds=1, event_name="click_inspect_building", event_data={"tile_index":5}),
+                   EventManagerTests.test_EventManager.BloomEvent(session_id="A", seconds=2, event_name="click_inspect_building", event_data={"tile_index":6})]
+        _status, _output = ExportManagerTests.test_ExportManager.Export(game="BLOOM", events=_events, modes={ExportMode.DETECTORS})
+        self.assertEqual(_status, ResultStatus.SUCCESS)
+        _names = [row[_output["all_events"]["cols"].index("event_name")] for row in _output["all_events"]["vals"]]
+        self.assertEqual(_names, ['"click_local_alert"', '"click_inspect_building"', '"alert_followed_by_inspect"', '"click_inspect_building"'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# import libraries
+import logging
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.Event import Event
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.interfaces.SourceStats import SourceStats
+from ogd.core.interfaces.StreamingFileInterface import StreamingFileInterface
+from ogd.core.managers.EventCache import EventCache
+from ogd.core.requests.RequestResult import ResultStatus
+from tests.benchmarks.bench_export import MemoryInterface, generateEvents
+# the ExportManager testbed is imported as a module, so its test cases are not collected again here.
+from tests.cases.managers import test_ExportManager as ExportManagerTests
+from tests.config.t_config import settings
+
+class _StatsCountingInterface(MemoryInterface):
+    """MemoryInterface that records each query for the state of sessions at the source, and each query for their dates."""
+    stats_queries : List[List[str]] = []
+    date_queries  : int             = 0
+
+    def SessionStats(self, id_list:List[str]) -> List[Tuple[str, int, datetime]]:
+        _StatsCountingInterface.stats_queries.append(list(id_list))
+        return super().SessionStats(id_list=id_list)
+
+    def _datesFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None) -> Dict[str, Any]:
+        _StatsCountingInterface.date_queries += 1
+        return super()._datesFromIDs(id_list=id_list, id_mode=id_mode, versions=versions)
+
+class test_EventCache(TestCase):
+    """Testbed for the EventCache class.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="EventCacheTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Set up events of a few sessions, grouped by session.
+        cls.events : List[Event] = generateEvents(game="BLOOM", sessions=6, events_per_session=30, seed=1234)
+        cls.sessions : Dict[str, List[Event]] = {}
+        for event in cls.events:
+            cls.sessions.setdefault(event.SessionID, []).append(event)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self._dir   = tempfile.TemporaryDirectory()
+        self._cache = EventCache(cache_dir=Path(self._dir.name), game_id="BLOOM", source="TEST", max_bytes=64 * 1024 * 1024)
+        self._cache.Open()
+        _interface  = MemoryInterface(game_id="BLOOM", events=self.events)
+        self._stats = SourceStats.SessionStats(interface=_interface, session_ids=self.sessions.keys()) or {}
+
+    def tearDown(self) -> None:
+        self._cache.Close()
+        self._dir.cleanup()
+
+    def test_RoundTrip(self):
+        self._cache.Put(session_events=self.sessions, session_stats=self._stats)
+        _cached = self._cache.Get(session_ids=self.sessions.keys(), session_stats=self._stats)
+        self.assertEqual(_cached.keys(), self.sessions.keys())
+        for sess_id, events in self.sessions.items():
+            self.assertEqual([(event.Timestamp, event.EventName, event.EventData, event.GameState, event.UserID) for event in _cached[sess_id]],
+                             [(event.Timestamp, event.EventName, event.EventData, event.GameState, event.UserID) for event in events])
+
+    def test_StaleEntriesNotServed(self):
+        self._cache.Put(session_events=self.sessions, session_stats=self._stats)
+        _changed_id = next(iter(self.sessions.keys()))
+        _stats = dict(self._stats)
+        _stats[_changed_id] = (_stats[_changed_id][0] + 1, _stats[_changed_id][1])
+        _cached = self._cache.Get(session_ids=self.sessions.keys(), session_stats=_stats)
+        self.assertNotIn(_changed_id, _cached)
+        self.assertEqual(len(_cached), len(self.sessions) - 1)
+
+    def test_UnstampedSessionsNotCached(self):
+        self._cache.Put(session_events=self.sessions, session_stats={})
+        self.assertEqual(self._cache.Get(session_ids=self.sessions.keys(), session_stats=self._stats), {})
+        self.assertEqual(self._cache.Stats["stored"], 0)
+
+    def test_SourceKeyIncludesFile(self):
+        _path = Path(self._dir.name) / "events.tsv"
+        _path.write_text("session_id\tevent_name\n1\tstart\n")
+        _config = GameSourceSchema(name="FILE SOURCE", all_elements={"schema":"OGD_EVENT_FILE"}, data_sources={})
+        _key = EventCache.SourceKey(interface=StreamingFileInterface(game_id="BLOOM", config=_config, fail_fast=False, filepath=_path), exclude_rows=None)
+        self.assertIn(str(_path.resolve()), _key)
+        # the same file, once modified, is a different source.
+        _path.write_text("session_id\tevent_name\n1\tstart\n1\tend\n")
+        os.utime(_path, ns=(_path.stat().st_atime_ns, _path.stat().st_mtime_ns + 1_000_000_000))
+        _new_key = EventCache.SourceKey(interface=StreamingFileInterface(game_id="BLOOM", config=_config, fail_fast=False, filepath=_path), exclude_rows=None)
+        self.assertNotEqual(_key, _new_key)
+
+    def test_ExportRetrievesChangedSessions(self):
+        _modes = {ExportMode.SESSION, ExportMode.PLAYER, ExportMode.POPULATION}
+        # a session that gains events after the first export, as if it was still being played.
+        _changed_id = self.events[0].SessionID
+        _extra      = [event for event in generateEvents(game="BLOOM", sessions=1, events_per_session=20, seed=4321)]
+        for event in _extra:
+            event.session_id = _changed_id
+            event.user_id    = self.events[0].UserID
+            event.timestamp  = self.sessions[_changed_id][-1].Timestamp + timedelta(hours=1) + (event.Timestamp - _extra[0].Timestamp)
+        _grown = self.sessions[_changed_id] + _extra + [event for event in self.events if event.SessionID != _changed_id]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            _status, _ = ExportManagerTests.test_ExportManager.Export(game="BLOOM", events=self.events, modes=_modes, use_event_cache=True, CACHE_DIR=cache_dir)
+            self.assertEqual(_status, ResultStatus.SUCCESS)
+            _cached_status, _cached = ExportManagerTests.test_ExportManager.Export(game="BLOOM", events=_grown, modes=_modes, use_event_cache=True, CACHE_DIR=cache_dir)
+        _full_status, _full = ExportManagerTests.test_ExportManager.Export(game="BLOOM", events=_grown, modes=_modes)
+        self.assertEqual(_cached_status, ResultStatus.SUCCESS)
+        self.assertEqual(_full_status,   ResultStatus.SUCCESS)
+        for key in _full.keys():
+            self.assertEqual(_cached[key]["vals"], _full[key]["vals"], msg=f"{key} output of export with event cache differs from export without it")
+
+    def test_OneStatsQueryPerSlice(self):
+        _modes = {ExportMode.SESSION}
+        _StatsCountingInterface.stats_queries, _StatsCountingInterface.date_queries = [], 0
+        with tempfile.TemporaryDirectory() as cache_dir:
+            _status, _ = ExportManagerTests.test_ExportManager.Export(game="BLOOM", events=self.events, modes=_modes, use_event_cache=True,
+                                                                      interface_class=_StatsCountingInterface, CACHE_DIR=cache_dir)
+        self.assertEqual(_status, ResultStatus.SUCCESS)
+        # six sessions, in slices of four.
+        self.assertEqual([len(ids) for ids in _StatsCountingInterface.stats_queries], [4, 2])
+        self.assertEqual(_StatsCountingInterface.date_queries, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# import libraries
+import logging
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.Event import Event, EventSource
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.schemas.games.GameSchema import GameSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd import games
+from ogd.core.managers.EventManager import EventManager
+from ogd.games.BLOOM.BloomLoader import BloomLoader
+from tests.config.t_config import settings
+
+class test_EventManager(TestCase):
+    """Testbed for the EventManager class.
+
+    Uses the BLOOM AlertFollowedByInspect detector, which triggers when an alert is followed shortly by an inspection of the same tile,
+    to check that detector state stays within a session.
+    """
+    START : datetime = datetime(2024, 1, 1)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="EventManagerTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Load the BLOOM schema, shared by all tests.
+        _games_path = Path(games.__file__) if Path(games.__file__).is_dir() else Path(games.__file__).parent
+        cls.schema  = GameSchema.FromFile(game_id="BLOOM", schema_path=_games_path / "BLOOM" / "schemas")
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    def setUp(self) -> None:
+        self.triggered : List[Event] = []
+        self.manager = EventManager(game_schema=self.schema, trigger_callback=self.triggered.append, LoaderClass=BloomLoader)
+
+    @staticmethod
+    def BloomEvent(session_id:str, seconds:int, event_name:str, event_data:Dict[str, Any]) -> Event:
+        return Event(session_id=session_id, app_id="BLOOM", timestamp=test_EventManager.START + timedelta(seconds=seconds),
+                     event_name=event_name, event_data=event_data, event_source=EventSource.GAME, app_version="1", log_version="1",
+                     user_id="player", user_data={}, game_state={}, event_sequence_index=seconds)
+
+    def Alert(self, session_id:str, seconds:int) -> Event:
+        return test_EventManager.BloomEvent(session_id=session_id, seconds=seconds, event_name="click_local_alert", event_data={"alert_type":"ExcessRunoff", "tile_index":5})
+
+    def Inspect(self, session_id:str, seconds:int) -> Event:
+        return test_EventManager.BloomEvent(session_id=session_id, seconds=seconds, event_name="click_inspect_building", event_data={"tile_index":5})
+
+    def Inspections(self) -> List[Event]:
+        return [event for event in self.triggered if event.EventName == "alert_followed_by_inspect"]
+
+    def test_DetectorTriggers(self):
+        self.manager.ProcessEvent(event=self.Alert(session_id="A", seconds=0))
+        self.manager.ProcessEvent(event=self.Inspect(session_id="A", seconds=1))
+        self.assertEqual([event.SessionID for event in self.Inspections()], ["A"])
+
+    def test_DetectorStateNotShared(self):
+        # an alert at the end of one session is not followed up by an inspection at the start of the next one.
+        self.manager.ProcessEvent(event=self.Alert(session_id="A", seconds=0))
+        self.manager.ProcessEvent(event=self.Inspect(session_id="B", seconds=1))
+        self.assertEqual(self.Inspections(), [])
+        # events of other sessions, interleaved with a session's own, don't affect its detectors either.
+        self.manager.ProcessEvent(event=self.Alert(session_id="B", seconds=2))
+        self.manager.ProcessEvent(event=self.Inspect(session_id="A", seconds=3))
+        self.manager.ProcessEvent(event=self.Inspect(session_id="C", seconds=3))
+        self.assertEqual([event.SessionID for event in self.Inspections()], ["A"])
+
+    def test_FinishSession(self):
+        # once a session is finished, later events of the session start over with fresh detectors.
+        self.manager.ProcessEvent(event=self.Alert(session_id="A", seconds=0))
+        self.manager.FinishSession(session_id="A")
+        self.manager.ProcessEvent(event=self.Inspect(session_id="A", seconds=1))
+        self.assertEqual(self.Inspections(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# import libraries
+import contextlib
+import io
+import logging
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.interfaces.outerfaces.DictionaryOuterface import DictionaryOuterface
+from ogd.common.models.Event import Event
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.GameSourceSchema import GameSourceSchema
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.interfaces.outerfaces.BatchOuterface import BatchOuterface
+from ogd.core.managers.ExportManager import ExportManager
+from ogd.core.processors.RowBatch import RowBatch
+from ogd.core.requests.Request import ExporterRange, Request
+from ogd.core.requests.RequestResult import ResultStatus
+from ogd.core.schemas.configs.ConfigSchema import ConfigSchema
+from tests.benchmarks.bench_export import MemoryInterface, generateEvents
+from tests.config.t_config import settings
+
+class _BatchDictionaryOuterface(BatchOuterface, DictionaryOuterface):
+    """DictionaryOuterface that takes batches, and records the modes it was given a batch for under the "batch_modes" key."""
+    def _writeBatch(self, batch:RowBatch, mode:ExportMode) -> None:
+        self._out.setdefault("batch_modes", set()).add(mode)
+        self.WriteLines(lines=batch.AsStrings(), mode=mode)
+
+class test_ExportManager(TestCase):
+    """Testbed for the ExportManager class.
+
+    Exports run on seeded synthetic event streams, from an in-memory interface into a DictionaryOuterface,
+    so the outputs of different ways of running the same export can be compared value by value.
+    """
+    FEATURE_MODES : Set[ExportMode] = {ExportMode.SESSION, ExportMode.PLAYER, ExportMode.POPULATION}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="ExportManagerTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+        # 2. Set up event streams for each game, with several players, spread over several slices.
+        cls.events : Dict[str, List[Event]] = {
+            game : generateEvents(game=game, sessions=12, events_per_session=60, seed=1234)
+            for game in ["AQUALAB", "BLOOM", "JOURNALISM"]
+        }
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    @staticmethod
+    def Export(game:str, events:List[Event], modes:Set[ExportMode], incremental:bool=False, use_event_cache:bool=False,
+               outerface_class:Type[DictionaryOuterface]=DictionaryOuterface, interface_class:Type[MemoryInterface]=MemoryInterface,
+               feature_overrides:Optional[List[str]]=None, **config_elements) -> Tuple[ResultStatus, Dict[str, Any]]:
+        """Run an export of the given events, and get the status of the request and everything written to the outerface."""
+        _interface = interface_class(game_id=game, events=events)
+        _output    : Dict[str, Any] = {}
+        _outerface = outerface_class(game_id=game, config=GameSourceSchema(name="TEST", all_elements={}, data_sources={}),
+                                         export_modes=set(modes), out_dict=_output)
+        _request   = Request(range=ExporterRange(date_min=None, date_max=None, ids=_interface.AllIDs(), id_mode=IDMode.SESSION),
+                             exporter_modes=set(modes), interface=_interface, outerfaces={_outerface}, feature_overrides=feature_overrides,
+                             incremental=incremental, use_event_cache=use_event_cache)
+        _elements  = {"BATCH_SIZE" : 4, "LOG_FILE" : False, "DEBUG_LEVEL" : "ERROR", "FAIL_FAST" : False}
+        _elements.update(config_elements)
+        # DictionaryOuterface prints progress as it writes, which is just noise here.
+        with contextlib.redirect_stdout(io.StringIO()):
+            _result = ExportManager(config=ConfigSchema(name="ExportManagerTest", all_elements=_elements)).ExecuteRequest(_request)
+        return _result.Status, _output
+
+    def test_ParallelMatchesSerial(self):
+        for game, events in self.events.items():
+            # player and population features are checked both with and without session output,
+            # since session output changes when second-order features are calculated during the export.
+            for modes in [self.FEATURE_MODES, {ExportMode.PLAYER, ExportMode.POPULATION}]:
+                with self.subTest(game=game, modes=sorted(mode.name for mode in modes)):
+                    _serial_status,   _serial   = test_ExportManager.Export(game=game, events=events, modes=modes)
+                    _parallel_status, _parallel = test_ExportManager.Export(game=game, events=events, modes=modes, WORKER_COUNT=2)
+                    self.assertEqual(_serial_status,   ResultStatus.SUCCESS)
+                    self.assertEqual(_parallel_status, ResultStatus.SUCCESS)
+                    self.assertEqual(_parallel.keys(), _serial.keys())
+                    for key in _serial.keys():
+                        self.assertEqual(_parallel[key]["cols"], _serial[key]["cols"])
+                        self.assertEqual(_parallel[key]["vals"], _serial[key]["vals"], msg=f"{key} output of parallel export differs from serial export")
+
+    def test_BatchOuterfaceMatchesLines(self):
+        game   = "BLOOM"
+        _modes = self.FEATURE_MODES | {ExportMode.EVENTS, ExportMode.DETECTORS}
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                _lines_status, _lines = test_ExportManager.Export(game=game, events=self.events[game], modes=_modes, WORKER_COUNT=workers)
+                _batch_status, _batch = test_ExportManager.Export(game=game, events=self.events[game], modes=_modes, WORKER_COUNT=workers,
+                                                                  outerface_class=_BatchDictionaryOuterface)
+                self.assertEqual(_lines_status, ResultStatus.SUCCESS)
+                self.assertEqual(_batch_status, ResultStatus.SUCCESS)
+                self.assertEqual(_batch.pop("batch_modes"), _modes)
+                self.assertEqual(_batch.keys(), _lines.keys())
+                for key in _lines.keys():
+                    self.assertEqual(_batch[key]["cols"], _lines[key]["cols"])
+                    self.assertEqual(_batch[key]["vals"], _lines[key]["vals"], msg=f"{key} output written from batches differs from output written from lines")
+
+    def test_IncrementalMatchesFull(self):
+        game    = "AQUALAB"
+        events  = self.events[game]
+        # cut one session short, so its player's and the population's features change, along with their other sessions' second-order features.
+        _mutated_id = events[0].SessionID
+        _mutated    = [event for i, event in enumerate(events) if event.SessionID != _mutated_id or i < 20]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            _status, _ = test_ExportManager.Export(game=game, events=events, modes=self.FEATURE_MODES, incremental=True, CACHE_DIR=cache_dir)
+            self.assertEqual(_status, ResultStatus.SUCCESS)
+            with sqlite3.connect(Path(cache_dir) / "session_cache.sqlite") as db:
+                _cached_count = db.execute("SELECT COUNT(*) FROM session_features").fetchone()[0]
+            self.assertEqual(_cached_count, len({event.SessionID for event in events}))
+            _inc_status, _incremental = test_ExportManager.Export(game=game, events=_mutated, modes=self.FEATURE_MODES, incremental=True, CACHE_DIR=cache_dir)
+        _full_status,   _full       = test_ExportManager.Export(game=game, events=_mutated, modes=self.FEATURE_MODES)
+        _before_status, _before     = test_ExportManager.Export(game=game, events=events,   modes=self.FEATURE_MODES)
+        self.assertEqual(_inc_status,    ResultStatus.SUCCESS)
+        self.assertEqual(_full_status,   ResultStatus.SUCCESS)
+        self.assertEqual(_before_status, ResultStatus.SUCCESS)
+        # make sure the mutation actually changed some unchanged session's row, otherwise the comparison below would not show much.
+        _changed_others = [after for before, after in zip(_before["sessions"]["vals"], _full["sessions"]["vals"])
+                           if after[1] != _mutated_id and before != after]
+        self.assertGreater(len(_changed_others), 0)
+        for key in _full.keys():
+            self.assertEqual(_incremental[key]["cols"], _full[key]["cols"])
+            self.assertEqual(_incremental[key]["vals"], _full[key]["vals"], msg=f"{key} output of incremental export differs from full export")
+
+if __name__ == '__main__':
+    unittest.main()
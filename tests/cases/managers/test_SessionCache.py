@@ -0,0 +1,166 @@
+# import libraries
+import json
+import logging
+import sqlite3
+import tempfile
+import unittest
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, List, Optional
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.Event import Event
+from ogd.common.models.FeatureData import FeatureData
+from ogd.common.models.enums.ExportMode import ExportMode
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+from ogd.common.models.enums.IDMode import IDMode
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.managers.SessionCache import SessionCache
+from ogd.core.requests.RequestResult import ResultStatus
+from tests.benchmarks.bench_export import MemoryInterface, generateEvents
+# the ExportManager testbed is imported as a module, so its test cases are not collected again here.
+from tests.cases.managers import test_ExportManager as ExportManagerTests
+from tests.config.t_config import settings
+
+class _CountingInterface(MemoryInterface):
+    """MemoryInterface that records the IDs of every session whose events were retrieved."""
+    retrieved : List[str] = []
+
+    def EventsFromIDs(self, id_list:List[str], id_mode:IDMode=IDMode.SESSION, versions:Optional[List[int]]=None, exclude_rows:Optional[List[str]]=None) -> Optional[List[Event]]:
+        _CountingInterface.retrieved += id_list
+        return super().EventsFromIDs(id_list=id_list, id_mode=id_mode, versions=versions, exclude_rows=exclude_rows)
+
+class test_SessionCache(TestCase):
+    """Testbed for the SessionCache class.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="SessionCacheTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    @staticmethod
+    def SessionData(session_id:str, vals:List[Any]) -> List[FeatureData]:
+        return [
+            FeatureData(name="EventCount", feature_type="EventCount", count_index=None, cols=["EventCount"], vals=[len(vals)],
+                        mode=ExtractionMode.SESSION, player_id="player", sess_id=session_id),
+            FeatureData(name="JobValues", feature_type="JobValues", count_index=0, cols=[f"JobValues-{i}" for i in range(len(vals))], vals=vals,
+                        mode=ExtractionMode.SESSION, player_id="player", sess_id=session_id),
+        ]
+
+    @staticmethod
+    def Fields(feature_list:List[FeatureData]):
+        return [(feature.Name, feature.FeatureType, feature.CountIndex, list(feature.FeatureNames), list(feature.FeatureValues),
+                 [type(val) for val in feature.FeatureValues], feature.ExportMode, feature.PlayerID, feature.SessionID) for feature in feature_list]
+
+    def setUp(self) -> None:
+        self._dir   = tempfile.TemporaryDirectory()
+        self._cache = SessionCache(cache_dir=Path(self._dir.name), game_id="BLOOM", schema_hash="schema-1")
+        self._cache.Open()
+
+    def tearDown(self) -> None:
+        self._cache.Close()
+        self._dir.cleanup()
+
+    def test_RoundTrip(self):
+        _vals = [None, True, 3, 2**70, 1.5, "text", [1, [2, "three"]], {"a" : 1}, {1 : "one", (2, 3) : {4}},
+                 defaultdict(list, {"jobs" : [1, 2]}), (1, "two"), {1, 2}, frozenset({"x"}),
+                 datetime(2024, 5, 6, 7, 8, 9, 10), date(2024, 5, 6), timedelta(days=1, seconds=2, microseconds=3)]
+        _data = self.SessionData("s1", _vals)
+        self._cache.Store(sessions={"s1" : _data}, session_stats={"s1" : (10, "2024-05-06T07:08:09")})
+        _loaded = self._cache.Load(session_ids=["s1"])
+        self.assertEqual(self.Fields(_loaded["s1"]), self.Fields(_data))
+        self.assertEqual(_loaded["s1"][1].FeatureValues[9].default_factory, list)
+
+    def test_UnchangedDetectsChanges(self):
+        _sessions = {f"s{i}" : self.SessionData(f"s{i}", [i]) for i in range(4)}
+        _stats    = {f"s{i}" : (10 + i, f"2024-01-0{i+1}T00:00:00") for i in range(4)}
+        self._cache.Store(sessions=_sessions, session_stats=_stats)
+        _current = dict(_stats)
+        _current["s1"] = (12, _stats["s1"][1])
+        _current["s2"] = (_stats["s2"][0], "2024-02-01T00:00:00")
+        _current["s9"] = (1, "2024-01-01T00:00:00")
+        self.assertEqual(self._cache.Unchanged(session_stats=_current), {"s0", "s3"})
+        self.assertEqual(self._cache.Stats["hits"], 2)
+        self.assertEqual(self._cache.Stats["misses"], 3)
+
+    def test_ManySessions(self):
+        # more sessions than fit in a single query.
+        _ids   = [f"s{i}" for i in range(SessionCache._QUERY_SIZE * 2 + 7)]
+        _stats = {sess_id : (1, "2024-01-01T00:00:00") for sess_id in _ids}
+        self._cache.Store(sessions={sess_id : self.SessionData(sess_id, [1]) for sess_id in _ids}, session_stats=_stats)
+        self.assertEqual(self._cache.Unchanged(session_stats=_stats), set(_ids))
+        self.assertEqual(set(self._cache.Load(session_ids=_ids).keys()), set(_ids))
+
+    def test_SchemaChangeDropsEntries(self):
+        self._cache.Store(sessions={"s1" : self.SessionData("s1", [1])}, session_stats={"s1" : (1, "2024-01-01T00:00:00")})
+        self._cache.Close()
+        self._cache = SessionCache(cache_dir=Path(self._dir.name), game_id="BLOOM", schema_hash="schema-2")
+        self._cache.Open()
+        self.assertEqual(self._cache.Unchanged(session_stats={"s1" : (1, "2024-01-01T00:00:00")}), set())
+        self.assertEqual(self._cache.Load(session_ids=["s1"]), {})
+
+    def test_UnstorableValuesNotCached(self):
+        _sessions = {"s1" : self.SessionData("s1", [object()]), "s2" : self.SessionData("s2", [ExtractionMode.SESSION]), "s3" : self.SessionData("s3", [1])}
+        _stats    = {sess_id : (1, "2024-01-01T00:00:00") for sess_id in _sessions.keys()}
+        self._cache.Store(sessions=_sessions, session_stats=_stats)
+        self.assertEqual(self._cache.Stats["stored"], 1)
+        self.assertEqual(set(self._cache.Load(session_ids=_sessions.keys()).keys()), {"s3"})
+
+    def test_StoredAsJSON(self):
+        self._cache.Store(sessions={"s1" : self.SessionData("s1", [(1, 2)])}, session_stats={"s1" : (1, "2024-01-01T00:00:00")})
+        self._cache.Commit()
+        with sqlite3.connect(Path(self._dir.name) / "session_cache.sqlite") as db:
+            _text = db.execute("SELECT feature_data FROM session_features WHERE session_id = 's1'").fetchone()[0]
+        self.assertIsInstance(_text, str)
+        self.assertEqual(json.loads(_text)[1][0], "JobValues")
+
+    def test_PickledCacheDropped(self):
+        self._cache.Close()
+        _path = Path(self._dir.name) / "old" / "session_cache.sqlite"
+        _path.parent.mkdir()
+        with sqlite3.connect(_path) as db:
+            db.execute("""CREATE TABLE session_features (game TEXT, schema_hash TEXT, session_id TEXT, player_id TEXT,
+                                                         event_count INTEGER, max_time TEXT, feature_data BLOB,
+                                                         PRIMARY KEY (game, schema_hash, session_id))""")
+            db.execute("INSERT INTO session_features VALUES ('BLOOM', 'schema-1', 's1', 'player', 1, '2024-01-01T00:00:00', ?)", (b"\x80\x05N.",))
+        db.close()
+        self._cache = SessionCache(cache_dir=_path.parent, game_id="BLOOM", schema_hash="schema-1")
+        self._cache.Open()
+        self.assertEqual(self._cache.Unchanged(session_stats={"s1" : (1, "2024-01-01T00:00:00")}), set())
+
+    def test_UnchangedSessionsNotRetrieved(self):
+        # with only these session features, nothing else needs the events of sessions whose features are cached.
+        _game      = "PENGUINS"
+        _overrides = ["SessionDuration", "LogVersion"]
+        _modes     = {ExportMode.SESSION, ExportMode.PLAYER, ExportMode.POPULATION}
+        _events    = generateEvents(game=_game, sessions=10, events_per_session=40, seed=1234)
+        _changed_id = _events[0].SessionID
+        _mutated    = [event for i, event in enumerate(_events) if event.SessionID != _changed_id or i < 20]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            _status, _ = ExportManagerTests.test_ExportManager.Export(game=_game, events=_events, modes=_modes, incremental=True,
+                                                                      feature_overrides=_overrides, CACHE_DIR=cache_dir)
+            self.assertEqual(_status, ResultStatus.SUCCESS)
+            _CountingInterface.retrieved = []
+            _inc_status, _incremental = ExportManagerTests.test_ExportManager.Export(game=_game, events=_mutated, modes=_modes, incremental=True,
+                                                                                     interface_class=_CountingInterface, feature_overrides=_overrides, CACHE_DIR=cache_dir)
+        _full_status, _full = ExportManagerTests.test_ExportManager.Export(game=_game, events=_mutated, modes=_modes, feature_overrides=_overrides)
+        self.assertEqual(_inc_status,  ResultStatus.SUCCESS)
+        self.assertEqual(_full_status, ResultStatus.SUCCESS)
+        self.assertEqual(_CountingInterface.retrieved, [_changed_id])
+        # sessions whose events were not retrieved come after the other sessions of their slice, so rows are compared regardless of order.
+        for key in _full.keys():
+            self.assertEqual(_incremental[key]["cols"], _full[key]["cols"])
+            self.assertEqual(sorted(_incremental[key]["vals"]), sorted(_full[key]["vals"]), msg=f"{key} output of incremental export differs from full export")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# import libraries
+import logging
+import unittest
+from typing import List
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.models.FeatureData import FeatureData
+from ogd.common.models.enums.ExtractionMode import ExtractionMode
+from ogd.common.schemas.configs.TestConfigSchema import TestConfigSchema
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.core.managers.SessionFeatureStore import SessionFeatureStore
+from tests.config.t_config import settings
+
+class test_SessionFeatureStore(TestCase):
+    """Testbed for the SessionFeatureStore class.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 1. Get testing config
+        _testing_cfg = TestConfigSchema.FromDict(name="SessionFeatureStoreTestConfig", all_elements=settings, logger=None)
+        _level       = logging.DEBUG if _testing_cfg.Verbose else logging.CRITICAL
+        Logger.std_logger.setLevel(_level)
+
+    @staticmethod
+    def RunAll():
+        pass
+
+    @staticmethod
+    def SessionData(player_id:str, session_id:str, offset:int) -> List[FeatureData]:
+        return [
+            FeatureData(name="EventCount", feature_type="EventCount", count_index=None, cols=["EventCount"], vals=[offset],
+                        mode=ExtractionMode.SESSION, player_id=player_id, sess_id=session_id),
+            FeatureData(name="JobTime", feature_type="JobTime", count_index=0, cols=["JobTime", "JobTime-Active"], vals=[offset + 1, offset + 2],
+                        mode=ExtractionMode.SESSION, player_id=player_id, sess_id=session_id),
+        ]
+
+    @staticmethod
+    def Fields(feature_list:List[FeatureData]):
+        return [(feature.Name, feature.FeatureType, feature.CountIndex, list(feature.FeatureNames), list(feature.FeatureValues),
+                 feature.ExportMode, feature.PlayerID, feature.SessionID) for feature in feature_list]
+
+    def test_TakePending(self):
+        store = SessionFeatureStore()
+        _data = self.SessionData("p1", "s1", 0) + self.SessionData("p1", "s2", 10) + self.SessionData("p2", "s3", 20)
+        store.Add(feature_list=_data)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(self.Fields(store.TakePending()), self.Fields(_data))
+
+    def test_TakenDataIsDropped(self):
+        # once taken, data is not held by the store any more, nor handed out again.
+        store = SessionFeatureStore()
+        store.Add(feature_list=self.SessionData("p1", "s1", 0))
+        store.TakePending()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.TakePending(), [])
+        _later = self.SessionData("p1", "s2", 10)
+        store.Add(feature_list=_later)
+        self.assertEqual(self.Fields(store.TakePending()), self.Fields(_later))
+
+if __name__ == '__main__':
+    unittest.main()
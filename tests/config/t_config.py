@@ -0,0 +1,9 @@
+settings = {
+    "VERBOSE" : False,
+    "ENABLED" : {
+        "CONFIG":True,
+        "GAMES":True,
+    },
+    "REMOTE_ADDRESS" : "address_placeholder"
+}
+    
\ No newline at end of file